@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime, timedelta
+from itertools import groupby
+from operator import attrgetter
 from typing import Any, Optional, Sequence
 
 import structlog
-from sqlalchemy import select, update, delete, func, and_
+from sqlalchemy import select, update, delete, exists, func, and_, or_
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -552,6 +554,119 @@ class Repository:
             )
             return events
 
+    async def get_events_by_dates(
+        self,
+        dates: Sequence[date],
+        *,
+        active_only: bool = True,
+    ) -> Sequence[EventCalendar]:
+        """Retrieve calendar events falling on any of *dates* in one query.
+
+        Args:
+            dates: The dates to fetch.
+            active_only: If True, only return active events.
+
+        Returns:
+            List of EventCalendar records ordered by event_date ascending.
+        """
+        if not dates:
+            return []
+
+        async with self._session_factory() as session:
+            stmt = select(EventCalendar).where(
+                EventCalendar.event_date.in_(list(dates))
+            )
+            if active_only:
+                stmt = stmt.where(EventCalendar.is_active.is_(True))
+
+            stmt = stmt.order_by(EventCalendar.event_date.asc())
+            result = await session.execute(stmt)
+            events = result.scalars().all()
+            logger.debug(
+                "repository.events_by_dates",
+                count=len(events),
+                date_count=len(dates),
+            )
+            return events
+
+    async def get_events_grouped_by_date(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        active_only: bool = True,
+    ) -> dict[date, list[EventCalendar]]:
+        """Retrieve calendar events in ``[start_date, end_date]`` grouped by date.
+
+        One ranged query; rows come back ordered by date and are grouped
+        in Python.  Dates without events are absent from the result.
+
+        Args:
+            start_date: First date of the window (inclusive).
+            end_date: Last date of the window (inclusive).
+            active_only: If True, only return active events.
+
+        Returns:
+            ``{event_date: [EventCalendar, ...]}``.
+        """
+        async with self._session_factory() as session:
+            stmt = (
+                select(EventCalendar)
+                .where(EventCalendar.event_date >= start_date)
+                .where(EventCalendar.event_date <= end_date)
+            )
+            if active_only:
+                stmt = stmt.where(EventCalendar.is_active.is_(True))
+
+            stmt = stmt.order_by(EventCalendar.event_date.asc())
+            result = await session.execute(stmt)
+            events = result.scalars().all()
+            logger.debug(
+                "repository.events_grouped_by_date",
+                count=len(events),
+                start_date=str(start_date),
+                end_date=str(end_date),
+            )
+            return {
+                event_date: list(group)
+                for event_date, group in groupby(
+                    events, key=attrgetter("event_date")
+                )
+            }
+
+    async def exists_high_impact(
+        self,
+        target_date: date,
+        *,
+        active_only: bool = True,
+    ) -> bool:
+        """Return whether *target_date* has at least one high-impact event.
+
+        An event is high-impact when ``market_impact == 'HIGH'`` or its
+        ``trading_action`` is ``HALT``/``REDUCE``.  Runs a single
+        ``SELECT EXISTS(...)`` so no rows are loaded.
+
+        Args:
+            target_date: The date to check.
+            active_only: If True, only consider active events.
+
+        Returns:
+            True if a matching event exists.
+        """
+        cond = and_(
+            EventCalendar.event_date == target_date,
+            or_(
+                EventCalendar.market_impact == "HIGH",
+                EventCalendar.trading_action.in_(("HALT", "REDUCE")),
+            ),
+        )
+        if active_only:
+            cond = and_(cond, EventCalendar.is_active.is_(True))
+
+        async with self._session_factory() as session:
+            found = await session.scalar(select(exists().where(cond)))
+            return bool(found)
+
     # ------------------------------------------------------------------
     # PaperAccount
     # ------------------------------------------------------------------
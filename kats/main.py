@@ -21,7 +21,7 @@ import asyncio
 import signal
 import sys
 from datetime import datetime, date, timedelta
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -103,6 +103,7 @@ class KATSSystem:
         self.current_regime: MarketRegime = MarketRegime.SIDEWAYS
         self.daily_candidates: List = []
         self.active_strategies: List = []
+        self.strategy_candidates: Dict[str, List] = {}
 
     async def init_components(self):
         """모든 컴포넌트 초기화"""
@@ -400,10 +401,14 @@ class KATSSystem:
             kospi_data = await self.data_hub.get_kospi_data()
             self.current_regime = self.regime_detector.detect(kospi_data)
 
-            # 전략 선택
-            self.active_strategies = self.strategy_selector.select_strategies(
-                self.current_regime
+            # 전략 선택 및 전략별 후보 스캔 (전 전략 동시 실행)
+            self.strategy_candidates = await self.strategy_selector.run_all_scans(
+                self.current_regime, self.daily_candidates
             )
+            self.active_strategies = [
+                self.strategy_selector.get_strategy(code)
+                for code in self.strategy_candidates
+            ]
 
             # Kill Switch 일일 초기화
             balance = await self.rest_client.get_balance()
@@ -416,6 +421,10 @@ class KATSSystem:
                 "전략 선택 완료",
                 regime=self.current_regime.value,
                 strategies=[s.strategy_code for s in self.active_strategies],
+                scan_matches={
+                    code: len(matched)
+                    for code, matched in self.strategy_candidates.items()
+                },
             )
 
             # 이벤트 확인
@@ -455,6 +464,9 @@ class KATSSystem:
             # OrderTracker 시작
             asyncio.create_task(self.order_manager.order_tracker.start_tracking())
 
+            # 이벤트 캘린더 선조회 (향후 7일, 5분 주기 갱신)
+            self.event_calendar.start_background_refresh()
+
             # 실시간 매매 루프 시작
             asyncio.create_task(self._trading_loop())
 
@@ -486,15 +498,28 @@ class KATSSystem:
                 # 시간대별 전략 필터링
                 active_now = self._filter_strategies_by_time(datetime.now())
 
-                # 각 전략별 신호 생성
+                # 종목별 시장 데이터는 틱당 한 번만 조회하여 전략 간 공유
+                # (분봉 NumPy 변환도 종목당 한 번으로 끝남)
+                tick_market_data: dict = {}
+
+                # 각 전략별 신호 생성 (전략 스캔을 통과한 종목만 평가)
                 for strategy in active_now:
-                    for candidate in self.daily_candidates:
+                    for candidate in self.strategy_candidates.get(
+                        strategy.strategy_code, ()
+                    ):
                         try:
-                            market_data = self.data_hub.get_market_data(
-                                candidate.stock_code
-                            )
+                            market_data = tick_market_data.get(candidate.stock_code)
                             if market_data is None:
-                                continue
+                                market_data = self.data_hub.get_market_data(
+                                    candidate.stock_code
+                                )
+                                if market_data is None:
+                                    continue
+                                tick_market_data[candidate.stock_code] = market_data
+                                # 일봉 지표(볼린저 밴드, 피벗 고가)는 새 일봉만 반영해 증분 갱신
+                                self.strategy_selector.update_daily_indicators(
+                                    candidate.stock_code, market_data
+                                )
 
                             signal = await strategy.generate_signal(
                                 candidate, market_data
@@ -643,6 +668,9 @@ class KATSSystem:
             # 3. OrderTracker 중지
             self.order_manager.order_tracker.stop_tracking()
 
+            # 4. 이벤트 캘린더 선조회 중지
+            await self.event_calendar.stop_background_refresh()
+
             logger.info("=== 장 마감 처리 완료 ===")
 
         except Exception as e:
@@ -793,6 +821,10 @@ class KATSSystem:
         if self.ws_client:
             await self.ws_client.disconnect()
 
+        # 이벤트 캘린더 선조회 중지
+        if self.event_calendar:
+            await self.event_calendar.stop_background_refresh()
+
         # REST client 종료
         if self.rest_client:
             await self.rest_client.close()
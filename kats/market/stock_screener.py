@@ -71,6 +71,15 @@ class StockCandidate:
     has_vcp: bool = False          # Volatility Contraction Pattern detected
     spread_pct: float = 0.0        # bid-ask spread (%)
 
+    # Derived once at construction (read per tick by intraday strategies)
+    avg_minute_volume_20d: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        # ~390 regular-session minutes per trading day
+        self.avg_minute_volume_20d = (
+            self.avg_volume_20d / 390 if self.avg_volume_20d > 0 else 0.0
+        )
+
 
 # ── StockScreener ────────────────────────────────────────────────────────────
 
@@ -0,0 +1,243 @@
+"""
+KATS strategy numeric kernels
+
+Array-only cores of the daily-bar pattern detectors used by the range and
+SEPA strategies.  Each kernel takes raw float64 arrays (oldest bar first,
+as held by :class:`kats.strategy.base_strategy.MarketDataView`) and
+plain scalars, and returns plain Python values, so the strategy methods
+stay thin adapters that only deal with ``market_data`` plumbing.
+
+:class:`RollingMax` is the streaming counterpart of :func:`pivot`, fed one
+bar at a time by the strategy selector's per-stock indicator cache.
+
+:func:`range_decision` and :func:`sepa_breakout` fuse each strategy's
+whole entry check into one call over these kernels, with the fixed
+parameters bundled in a :class:`RangeParams` / :class:`SEPAParams` built
+once per strategy instance.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, NamedTuple, Tuple
+
+import numpy as np
+
+# Small-window reductions: bottleneck's typed C loops when installed
+# (optional, not in requirements.txt), else the ufunc reduce, which skips
+# the ndarray.min/max method dispatch.  Daily bars never hold NaN, where
+# bottleneck's nan-skipping would be the only difference.
+try:
+    import bottleneck as _bn
+
+    _min = _bn.nanmin
+    _max = _bn.nanmax
+except ImportError:  # pragma: no cover - depends on the environment
+    _min = np.minimum.reduce
+    _max = np.maximum.reduce
+
+# Action codes returned by :func:`range_decision`
+RANGE_NONE, RANGE_BUY, RANGE_SELL = 0, 1, 2
+
+
+def channel_extremes(highs: np.ndarray, lows: np.ndarray) -> Tuple[float, float]:
+    """Return ``(min(lows), max(highs))`` for two equal-length windows.
+
+    Both reductions run on the caller's views (no temporaries).
+    """
+    return float(_min(lows)), float(_max(highs))
+
+
+def detect_channel(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    lookback: int,
+    max_range_pct: float,
+) -> Tuple[float, float, bool]:
+    """Return ``(support, resistance, ok)`` over the last *lookback* bars.
+
+    ``ok`` is ``False`` when there are fewer than 10 bars, the midpoint is
+    non-positive, or the range exceeds *max_range_pct* of the midpoint.
+    """
+    highs = highs[-lookback:]
+    lows = lows[-lookback:]
+    if highs.size < 10 or lows.size == 0:
+        return 0.0, 0.0, False
+
+    support, resistance = channel_extremes(highs, lows)
+
+    midpoint = (resistance + support) / 2
+    if midpoint <= 0:
+        return support, resistance, False
+
+    range_pct = (resistance - support) / midpoint * 100
+    return support, resistance, range_pct <= max_range_pct
+
+
+def detect_vcp(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    min_contractions: int,
+) -> bool:
+    """Return whether the last 60 bars show *min_contractions* tightening
+    segment ranges (Volatility Contraction Pattern).
+    """
+    if len(highs) < 40 or len(lows) != len(highs):
+        return False
+
+    # Analyse the last 60 bars (or available) for consolidation
+    window = min(60, len(highs))
+    highs = highs[-window:]
+    lows = lows[-window:]
+
+    # Split into segments and measure each segment's range
+    segments = min_contractions + 1
+    segment_size = window // segments
+    if segment_size < 5:
+        return False
+
+    # One reduction per segment; trailing bars that do not fill a whole
+    # segment are excluded, as reduceat would fold them into the last one.
+    span = segment_size * segments
+    starts = np.arange(0, span, segment_size)
+    ranges = (
+        np.maximum.reduceat(highs[:span], starts)
+        - np.minimum.reduceat(lows[:span], starts)
+    )
+
+    # Count how many successive ranges are tighter
+    contractions = int(np.count_nonzero(np.diff(ranges) < 0))
+    return contractions >= min_contractions
+
+
+def pivot(highs: np.ndarray, window: int = 10) -> float:
+    """Return the highest high of the last *window* bars (``0.0`` if empty)."""
+    if highs.size == 0:
+        return 0.0
+    return float(_max(highs[-window:]))
+
+
+class RollingMax:
+    """Maximum of the last *window* pushed values, O(1) amortised per push.
+
+    Keeps a deque of ``(index, value)`` pairs with strictly decreasing
+    values: a new value evicts every smaller-or-equal one from the back,
+    and the front is dropped once it falls out of the window.
+    """
+
+    __slots__ = ("window", "_dq", "_idx")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._dq: Deque[Tuple[int, float]] = deque()
+        self._idx = 0
+
+    def push(self, value: float) -> None:
+        """Append the next bar's *value* to the window."""
+        dq = self._dq
+        while dq and dq[-1][1] <= value:
+            dq.pop()
+        dq.append((self._idx, value))
+        while dq[0][0] <= self._idx - self.window:
+            dq.popleft()
+        self._idx += 1
+
+    def max(self) -> float:
+        """Return the window maximum (``0.0`` before the first push)."""
+        return self._dq[0][1] if self._dq else 0.0
+
+
+# ── Fused entry checks ────────────────────────────────────────────────────
+
+
+class RangeParams(NamedTuple):
+    """Fixed Range Trading thresholds consumed by :func:`range_decision`."""
+
+    lookback: int
+    max_range_pct: float
+    squeeze_threshold: float
+    support_prox_pct: float
+    resistance_prox_pct: float
+
+
+def range_decision(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    price: float,
+    bb_upper: float,
+    bb_lower: float,
+    reversal_ok: bool,
+    p: RangeParams,
+) -> Tuple[int, float, float, bool]:
+    """Run the channel -> squeeze -> proximity -> reversal chain.
+
+    Returns ``(action, support, resistance, squeeze)`` where *action* is
+    :data:`RANGE_BUY` near support (with a reversal candle, or a BB
+    squeeze in its place), :data:`RANGE_SELL` near resistance, or
+    :data:`RANGE_NONE`.
+    """
+    support, resistance, ok = detect_channel(
+        highs, lows, p.lookback, p.max_range_pct
+    )
+    if not ok or support <= 0:
+        return RANGE_NONE, support, resistance, False
+
+    squeeze = (
+        price > 0
+        and bb_upper > 0
+        and bb_lower > 0
+        and (bb_upper - bb_lower) / price <= p.squeeze_threshold
+    )
+
+    if (price - support) / support * 100 > p.support_prox_pct:
+        if (
+            resistance > 0
+            and (resistance - price) / resistance * 100 <= p.resistance_prox_pct
+        ):
+            return RANGE_SELL, support, resistance, squeeze
+        return RANGE_NONE, support, resistance, squeeze
+
+    if not (reversal_ok or squeeze):
+        return RANGE_NONE, support, resistance, squeeze
+    return RANGE_BUY, support, resistance, squeeze
+
+
+class SEPAParams(NamedTuple):
+    """Fixed SEPA thresholds consumed by :func:`sepa_breakout`."""
+
+    min_contractions: int
+    pivot_window: int
+    vol_breakout: float
+    eps_min: float
+    revenue_min: float
+
+
+def sepa_breakout(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    price: float,
+    pivot_hint: float,
+    vol_ratio: float,
+    eps_growth: float,
+    revenue_growth: float,
+    p: SEPAParams,
+) -> float:
+    """Return the breakout pivot, or ``0.0`` when there is no entry.
+
+    The scalar volume / fundamental gates run before the VCP scan, which
+    is the only step that touches the bar arrays.  A negative
+    *pivot_hint* means no streamed pivot is available and it is taken
+    from the last ``p.pivot_window`` highs.
+    """
+    if (
+        vol_ratio < p.vol_breakout
+        or eps_growth < p.eps_min
+        or revenue_growth < p.revenue_min
+    ):
+        return 0.0
+    if not detect_vcp(highs, lows, p.min_contractions):
+        return 0.0
+    piv = pivot_hint if pivot_hint >= 0 else pivot(highs, p.pivot_window)
+    if piv <= 0 or price < piv:
+        return 0.0
+    return piv
@@ -12,15 +12,35 @@ Design references:
 
 from __future__ import annotations
 
+import logging
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import attrgetter
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Column order of the cached minute OHLCV block (see ``prepare_market_data``)
+OHLCV_COLUMNS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
+COL_OPEN, COL_HIGH, COL_LOW, COL_CLOSE, COL_VOLUME = range(len(OHLCV_COLUMNS))
+
+# Regular-session minutes per KRX trading day (09:00-15:30)
+TRADING_MINUTES_PER_DAY = 390
+
+# Small-int codes for candidate grades; grade filters are bitmasks over them
+GRADE_CODE: Dict[str, int] = {"A": 0, "B": 1, "C": 2, "D": 3, "ETF": 4}
+_UNKNOWN_GRADE = len(GRADE_CODE)  # its bit is never set in any mask
+
+# Position-size multiplier per grade (see ``BaseStrategy._adjust_position``)
+_GRADE_POSITION_MULT: Dict[str, float] = {"A": 1.0, "B": 0.8, "C": 0.5, "ETF": 0.7}
+
 
 # ───────────────────────────── Enums ─────────────────────────────────────────
 
@@ -38,6 +58,19 @@ class MarketRegime(Enum):
     BEAR = "약세장"
     STRONG_BEAR = "강한 하락장"
 
+    @classmethod
+    def from_code(cls, code: int) -> "MarketRegime":
+        """Return the member for a :data:`REGIME_CODE` value."""
+        return _REGIMES_BY_CODE[code]
+
+
+# Small-int regime codes (declaration order), as returned by
+# ``MarketRegimeDetector.detect_batch``
+_REGIMES_BY_CODE: Tuple[MarketRegime, ...] = tuple(MarketRegime)
+REGIME_CODE: Dict[MarketRegime, int] = {
+    regime: code for code, regime in enumerate(_REGIMES_BY_CODE)
+}
+
 
 class StrategyCategory(Enum):
     """Broad category that determines in which regimes a strategy operates."""
@@ -50,7 +83,7 @@ class StrategyCategory(Enum):
 # ───────────────────────────── Data Classes ──────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class TradeSignal:
     """Immutable record of a trade signal emitted by a strategy.
 
@@ -65,9 +98,12 @@ class TradeSignal:
             means trailing stop instead of a fixed target.
         position_pct: Suggested position size as a percentage of capital.
         confidence: Conviction score from 1 (low) to 5 (high).
-        reason: Human-readable rationale for the signal (Korean).
+        reason: Human-readable rationale for the signal (Korean).  When
+            *reason_args* is given, the constructor's *reason* is a
+            :meth:`str.format` template, rendered only when read.
         indicators_snapshot: Dictionary snapshot of all relevant indicator
             values at signal creation time (for trade journal).
+        reason_args: Values substituted into the *reason* template.
     """
 
     stock_code: str
@@ -78,11 +114,89 @@ class TradeSignal:
     target_prices: List[float]
     position_pct: float
     confidence: int
-    reason: str
-    indicators_snapshot: Dict[str, Any] = field(default_factory=dict)
+    _reason: str
+    indicators_snapshot: Dict[str, Any]
+    reason_args: Dict[str, Any]
 
+    def __init__(
+        self,
+        stock_code: str,
+        action: str,
+        strategy_code: str,
+        entry_price: float,
+        stop_loss: float,
+        target_prices: List[float],
+        position_pct: float,
+        confidence: int,
+        reason: str = "",
+        indicators_snapshot: Optional[Dict[str, Any]] = None,
+        reason_args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.stock_code = stock_code
+        self.action = action
+        self.strategy_code = strategy_code
+        self.entry_price = entry_price
+        self.stop_loss = stop_loss
+        self.target_prices = target_prices
+        self.position_pct = position_pct
+        self.confidence = confidence
+        self._reason = reason
+        self.indicators_snapshot = (
+            {} if indicators_snapshot is None else indicators_snapshot
+        )
+        self.reason_args = {} if reason_args is None else reason_args
+
+    @property
+    def reason(self) -> str:
+        """Human-readable rationale, formatted on access only."""
+        if not self.reason_args:
+            return self._reason
+        return self._reason.format(**self.reason_args)
+
+
+@dataclass(frozen=True, slots=True)
+class ExitRules:
+    """Exit rules of a strategy, enforced by the Risk and Order Managers.
+
+    Built once per strategy instance and returned by
+    :meth:`BaseStrategy.get_exit_rules`.  Item access (``rules["key"]``)
+    is kept for callers written against the former dict form.
+
+    Attributes:
+        stop_loss_pct: Hard stop distance in percent.
+        target_prices_pct: Progressive take-profit distances in percent.
+        trailing_stop: Whether a trailing stop is used.
+        trailing_stop_pct: Trailing stop distance in percent, if any.
+        time_exit: Forced exit time, e.g. ``"MARKET_CLOSE"``.
+        max_holding_hours: Maximum holding period in hours, if any.
+    """
 
-@dataclass
+    stop_loss_pct: float
+    target_prices_pct: Tuple[float, ...] = ()
+    trailing_stop: bool = False
+    trailing_stop_pct: Optional[float] = None
+    time_exit: Optional[str] = None
+    max_holding_hours: Optional[int] = None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the rules as a plain dict (target list as ``list``)."""
+        return {
+            "stop_loss_pct": self.stop_loss_pct,
+            "target_prices_pct": list(self.target_prices_pct),
+            "trailing_stop": self.trailing_stop,
+            "trailing_stop_pct": self.trailing_stop_pct,
+            "time_exit": self.time_exit,
+            "max_holding_hours": self.max_holding_hours,
+        }
+
+
+@dataclass(slots=True)
 class StockCandidate:
     """Pre-screened stock that passed the initial stock screener filters.
 
@@ -109,10 +223,13 @@ class StockCandidate:
         eps_growth_qoq: Quarter-over-quarter EPS growth (%).
         revenue_growth: Year-over-year revenue growth (%).
         op_margin_trend: Operating margin trend (``"UP"``/``"DOWN"``/``"FLAT"``).
-        inst_foreign_flow: Net institutional + foreign buying flow (KRW).
+        inst_foreign_flow: Net institutional + foreign buying flow (KRW), or
+            the screener's ``"BUY"``/``"SELL"``/``"NEUTRAL"`` label.
         trend_score: Composite technical trend score (0-100).
         canslim_score: CAN SLIM composite score (0-100).
         confidence: Overall confidence score (1-5).
+        avg_minute_volume_20d: ``avg_volume_20d`` spread over one session's
+            minutes; derived once at construction.
     """
 
     stock_code: str
@@ -138,6 +255,312 @@ class StockCandidate:
     trend_score: float
     canslim_score: float
     confidence: int
+    avg_minute_volume_20d: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.avg_minute_volume_20d = (
+            self.avg_volume_20d / TRADING_MINUTES_PER_DAY
+            if self.avg_volume_20d > 0
+            else 0.0
+        )
+
+
+# ───────────────────────────── Streaming indicators ──────────────────────────
+
+
+class StreamingBB:
+    """Bollinger Bands over the last *n* prices, updated in O(1) per bar.
+
+    Keeps a ring buffer plus running ``sum`` and ``sum of squares``; each
+    :meth:`update` swaps the oldest price for the new one.  The running sums
+    are re-derived from the buffer once per full cycle so floating-point
+    drift (cancellation in ``sumsq/n - mean**2``) cannot accumulate.
+
+    Bands use the population standard deviation, matching
+    ``IndicatorCalculator.bollinger_bands``.
+    """
+
+    __slots__ = ("n", "num_std", "_sum", "_sumsq", "_buf", "_idx", "_warm")
+
+    def __init__(self, n: int = 20, num_std: float = 2.0) -> None:
+        self.n = n
+        self.num_std = num_std
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._buf: List[float] = [0.0] * n
+        self._idx = 0
+        self._warm = 0  # number of prices seen, capped at n
+
+    @property
+    def ready(self) -> bool:
+        """``True`` once *n* prices have been seen."""
+        return self._warm == self.n
+
+    def update(self, price: float) -> None:
+        """Push the latest bar's *price* into the window."""
+        old = self._buf[self._idx]
+        self._buf[self._idx] = price
+        if self._warm < self.n:
+            self._warm += 1
+            old = 0.0
+        self._sum += price - old
+        self._sumsq += price * price - old * old
+        self._idx += 1
+        if self._idx == self.n:
+            self._idx = 0
+            self._sum = math.fsum(self._buf)
+            self._sumsq = math.fsum(p * p for p in self._buf)
+
+    def bands(self) -> Tuple[float, float, float]:
+        """Return ``(upper, middle, lower)``; zeros until :attr:`ready`."""
+        if not self.ready:
+            return 0.0, 0.0, 0.0
+        mean = self._sum / self.n
+        var = max(self._sumsq / self.n - mean * mean, 0.0)
+        width = self.num_std * math.sqrt(var)
+        return mean + width, mean, mean - width
+
+
+# ───────────────────────────── Market data prep ──────────────────────────────
+
+
+def _to_ohlcv_array(minute_candles: Any) -> np.ndarray:
+    """Convert minute candles (DataFrame or list of dicts) to an ``(n, 5)``
+    float64 array ordered as :data:`OHLCV_COLUMNS`.
+
+    Missing or malformed input yields an empty ``(0, 5)`` array.
+    """
+    if minute_candles is None:
+        return np.empty((0, len(OHLCV_COLUMNS)))
+    try:
+        if hasattr(minute_candles, "to_numpy"):
+            return minute_candles[list(OHLCV_COLUMNS)].to_numpy(
+                dtype=np.float64, copy=False
+            )
+        return np.array(
+            [[c[k] for k in OHLCV_COLUMNS] for c in minute_candles],
+            dtype=np.float64,
+        ).reshape(-1, len(OHLCV_COLUMNS))
+    except (KeyError, TypeError, ValueError):
+        return np.empty((0, len(OHLCV_COLUMNS)))
+
+
+def prepare_market_data(market_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Materialise ``minute_candles`` as NumPy arrays, once per dict.
+
+    Adds to *market_data* in place:
+
+        * ``minute_ohlcv``: ``(n, 5)`` float64 array, columns per
+          :data:`OHLCV_COLUMNS` (index with ``COL_OPEN`` .. ``COL_VOLUME``).
+        * ``minute_tail5``: view of the last 5 rows of ``minute_ohlcv``.
+        * ``minute_candles_ok``: ``True`` when ``minute_ohlcv`` holds at
+          least one well-formed ``(n, 5)`` row, so helpers can index the
+          arrays directly without guarding each access.
+
+    Calling it again on the same dict is a single key lookup, so every
+    strategy evaluating the same tick shares one conversion.
+    """
+    if "minute_ohlcv" in market_data:
+        return market_data
+    ohlcv = _to_ohlcv_array(market_data.get("minute_candles"))
+    market_data["minute_ohlcv"] = ohlcv
+    market_data["minute_tail5"] = ohlcv[-5:]
+    market_data["minute_candles_ok"] = (
+        ohlcv.ndim == 2
+        and ohlcv.shape[0] > 0
+        and ohlcv.shape[1] == len(OHLCV_COLUMNS)
+    )
+    return market_data
+
+
+def _to_column_arrays(
+    daily_prices: Any, price_dtype: Any = np.float64
+) -> Dict[str, np.ndarray]:
+    """Extract each :data:`OHLCV_COLUMNS` column of *daily_prices* as an
+    array (zero-copy when the column already has the target dtype).
+
+    Price columns use *price_dtype*; ``volume`` is always float64.
+    Missing or malformed columns yield empty arrays.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    for col in OHLCV_COLUMNS:
+        dtype = np.float64 if col == "volume" else price_dtype
+        try:
+            arrays[col] = np.asarray(daily_prices[col], dtype=dtype)
+        except (KeyError, TypeError, ValueError, IndexError):
+            arrays[col] = np.empty(0, dtype=dtype)
+    return arrays
+
+
+class MarketDataView:
+    """Read-only NumPy view of one stock's daily bars, shared per tick.
+
+    ``high`` / ``low`` / ``close`` are float32 and ``vol`` is float64
+    (oldest bar first).  KRX prices are whole won below 2**24, which
+    float32 holds exactly, so min/max reductions move half the bytes
+    with no loss; results are returned as Python floats, keeping order
+    prices and sizing in double precision.  Trailing-window
+    extremes are served from suffix max/min arrays built once with
+    ``np.maximum.accumulate`` / ``np.minimum.accumulate``, so every
+    ``max_high(k)`` / ``min_low(k)`` after the first is O(1).
+    """
+
+    __slots__ = ("high", "low", "close", "vol", "window_cache")
+
+    def __init__(self, daily_prices: Any) -> None:
+        arrays = _to_column_arrays(daily_prices, np.float32)
+        self.high: np.ndarray = arrays["high"]
+        self.low: np.ndarray = arrays["low"]
+        self.close: np.ndarray = arrays["close"]
+        self.vol: np.ndarray = arrays["volume"]
+        self.window_cache: Dict[str, np.ndarray] = {}
+
+    def max_high(self, window: int) -> float:
+        """Highest high of the last *window* bars (``0.0`` if empty)."""
+        if self.high.size == 0:
+            return 0.0
+        suffix = self.window_cache.get("max_high")
+        if suffix is None:
+            suffix = np.maximum.accumulate(self.high[::-1])
+            self.window_cache["max_high"] = suffix
+        return float(suffix[min(window, suffix.size) - 1])
+
+    def min_low(self, window: int) -> float:
+        """Lowest low of the last *window* bars (``0.0`` if empty)."""
+        if self.low.size == 0:
+            return 0.0
+        suffix = self.window_cache.get("min_low")
+        if suffix is None:
+            suffix = np.minimum.accumulate(self.low[::-1])
+            self.window_cache["min_low"] = suffix
+        return float(suffix[min(window, suffix.size) - 1])
+
+
+def prepare_daily_data(market_data: Dict[str, Any]) -> MarketDataView:
+    """Return the :class:`MarketDataView` of ``daily_prices``, once per dict.
+
+    The view is cached on *market_data* under ``view``; the trading loop
+    shares one market-data dict per stock per tick, so all strategies
+    slice the same arrays instead of each re-reading the DataFrame.
+    """
+    view = market_data.get("view")
+    if view is None:
+        view = MarketDataView(market_data.get("daily_prices"))
+        market_data["view"] = view
+    return view
+
+
+# ───────────────────────────── Candidate arrays ──────────────────────────────
+
+# Numeric candidate attributes exposed column-wise to vectorised scans
+# The leading price/MA fields are kept adjacent and in trend order so the
+# Minervini chain can be compared as one slice (see ``candidate_matrix``).
+CANDIDATE_FIELDS: Tuple[str, ...] = (
+    "price",
+    "ma_50",
+    "ma_150",
+    "ma_200",
+    "ma_200_slope",
+    "week52_high",
+    "week52_low",
+    "rs_rank",
+    "eps_growth_qoq",
+    "revenue_growth",
+    "avg_turnover_20d",
+    "inst_foreign_flow",
+)
+_CANDIDATE_DTYPE = np.dtype([(name, np.float64) for name in CANDIDATE_FIELDS])
+# Every field but the trailing ``inst_foreign_flow`` is read as is
+_get_numeric_fields = attrgetter(*CANDIDATE_FIELDS[:-1])
+
+# The screener reports institutional flow as a direction label rather
+# than a KRW amount; labels map to a signed unit so ``> 0`` still means
+# net buying.
+_FLOW_CODE: Dict[str, float] = {"BUY": 1.0, "SELL": -1.0, "NEUTRAL": 0.0}
+
+
+def _flow_value(flow: Any) -> float:
+    """Return ``inst_foreign_flow`` as a float (KRW amount or label code)."""
+    if isinstance(flow, str):
+        return _FLOW_CODE.get(flow, 0.0)
+    return float(flow)
+
+
+def _candidate_row(c: StockCandidate) -> Tuple[float, ...]:
+    return (*_get_numeric_fields(c), _flow_value(c.inst_foreign_flow))
+
+# Arrays of the scan cycle in progress: (candidates list, structured array).
+# Set only for the duration of :func:`scan_cycle`, so candidates enriched
+# in place between cycles are always converted afresh.
+_cycle_arrays: ContextVar[Optional[Tuple[List[StockCandidate], np.ndarray]]] = (
+    ContextVar("kats_cycle_arrays", default=None)
+)
+
+
+def candidate_arrays(candidates: List[StockCandidate]) -> np.ndarray:
+    """Return *candidates* as a structured array with one float64 field per
+    :data:`CANDIDATE_FIELDS` entry (row ``i`` is ``candidates[i]``).
+
+    ``inst_foreign_flow`` may be a KRW amount or a screener direction
+    label (``"BUY"`` / ``"SELL"`` / ``"NEUTRAL"``), stored as +1 / -1 / 0.
+
+    Inside :func:`scan_cycle` for the same list, the cycle's array is
+    returned, so every strategy scanning that universe shares one
+    conversion; otherwise the array is built on each call.
+    """
+    cycle = _cycle_arrays.get()
+    if cycle is not None and cycle[0] is candidates:
+        return cycle[1]
+    return np.fromiter(
+        map(_candidate_row, candidates),
+        dtype=_CANDIDATE_DTYPE,
+        count=len(candidates),
+    )
+
+
+@contextmanager
+def scan_cycle(candidates: List[StockCandidate]) -> Iterator[np.ndarray]:
+    """Convert *candidates* once and share the array with every
+    :func:`candidate_arrays` call made within the block (including tasks
+    started inside it).  *candidates* must not be modified meanwhile.
+    """
+    arr = candidate_arrays(candidates)
+    token = _cycle_arrays.set((candidates, arr))
+    try:
+        yield arr
+    finally:
+        _cycle_arrays.reset(token)
+
+
+def candidate_matrix(arr: np.ndarray) -> np.ndarray:
+    """Return a :func:`candidate_arrays` block as a zero-copy ``(N, F)``
+    float64 view, column ``j`` being ``CANDIDATE_FIELDS[j]``.
+    """
+    return arr.view(np.float64).reshape(len(arr), len(CANDIDATE_FIELDS))
+
+
+def _is_enabled_for(log: Any, level: int) -> bool:
+    """Return whether *log* would emit records at *level*.
+
+    Works for both stdlib-backed and filtering structlog loggers; if the
+    logger cannot tell, assume the level is enabled.
+    """
+    for name in ("isEnabledFor", "is_enabled_for"):
+        check = getattr(log, name, None)
+        if check is not None:
+            try:
+                return bool(check(level))
+            except Exception:  # noqa: BLE001
+                break
+    return True
+
+
+def grade_mask(grades: Iterable[str]) -> int:
+    """Return the :data:`GRADE_CODE` bitmask selecting *grades*."""
+    mask = 0
+    for grade in grades:
+        mask |= 1 << GRADE_CODE[grade]
+    return mask
 
 
 # ───────────────────────────── Abstract Base ─────────────────────────────────
@@ -166,6 +589,9 @@ class BaseStrategy(ABC):
             strategy=strategy_code,
             category=category.value,
         )
+        # structlog builds the event dict eagerly, so hot paths check this
+        # cached flag before assembling per-tick INFO events.
+        self._info_enabled: bool = _is_enabled_for(self.log, logging.INFO)
 
     # ── Abstract interface ────────────────────────────────────────────────
 
@@ -201,23 +627,36 @@ class BaseStrategy(ABC):
                 "minute_candles": pd.DataFrame,  # intraday 1-min candles
                 "indicators": dict,              # pre-computed indicators
             }
+
+        Minute-candle strategies read the NumPy block attached by
+        :func:`prepare_market_data` instead of indexing the DataFrame;
+        daily-bar strategies use :func:`prepare_daily_data`.
         """
 
-    @abstractmethod
-    def get_exit_rules(self) -> Dict[str, Any]:
-        """Return a dictionary describing exit rules so that the Risk
-        Manager and Order Manager can enforce them autonomously.
+    async def generate_signals_batch(
+        self,
+        stocks: List[StockCandidate],
+        market_data_batch: List[Dict[str, Any]],
+    ) -> List[Optional[TradeSignal]]:
+        """Evaluate several candidates in a single call.
+
+        Returns a list aligned with *stocks*: element ``i`` is the signal
+        for ``stocks[i]`` (or ``None``).  The default implementation calls
+        :meth:`generate_signal` per candidate; strategies whose checks are
+        independent per-row arithmetic override it with a vectorised pass.
+        """
+        return [
+            await self.generate_signal(stock, market_data)
+            for stock, market_data in zip(stocks, market_data_batch)
+        ]
 
-        Expected keys::
+    @abstractmethod
+    def get_exit_rules(self) -> ExitRules:
+        """Return the :class:`ExitRules` so that the Risk Manager and Order
+        Manager can enforce them autonomously.
 
-            {
-                "stop_loss_pct": float,
-                "target_prices_pct": List[float],
-                "trailing_stop": bool,
-                "trailing_stop_pct": float | None,
-                "time_exit": str | None,        # e.g. "MARKET_CLOSE"
-                "max_holding_hours": int | None,
-            }
+        Rules are fixed for the strategy's lifetime: implementations build
+        them once in ``__init__`` and return that instance.
         """
 
     # ── Regime applicability ──────────────────────────────────────────────
@@ -235,6 +674,33 @@ class BaseStrategy(ABC):
             return regime in (MarketRegime.BEAR, MarketRegime.STRONG_BEAR)
         return True  # NEUTRAL
 
+    # ── Grade filtering ───────────────────────────────────────────────────
+
+    @staticmethod
+    def _grade_keep(candidates: List[StockCandidate], mask: int) -> np.ndarray:
+        """Return a boolean row mask: grade bit of each candidate in *mask*.
+
+        Grades are mapped to :data:`GRADE_CODE` at call time (the screener
+        assigns ``grade`` after construction) and tested with one bitwise
+        op over the whole batch.
+        """
+        codes = np.fromiter(
+            (GRADE_CODE.get(c.grade, _UNKNOWN_GRADE) for c in candidates),
+            dtype=np.int64,
+            count=len(candidates),
+        )
+        return ((1 << codes) & mask) != 0
+
+    @classmethod
+    def _filter_by_grade(
+        cls, candidates: List[StockCandidate], mask: int
+    ) -> List[StockCandidate]:
+        """Keep the candidates whose grade bit is set in *mask*."""
+        if not candidates:
+            return []
+        keep = cls._grade_keep(candidates, mask)
+        return [candidates[i] for i in np.flatnonzero(keep).tolist()]
+
     # ── Position sizing helpers ───────────────────────────────────────────
 
     def _adjust_position(self, confidence: int, grade: str) -> float:
@@ -249,9 +715,7 @@ class BaseStrategy(ABC):
         """
         base_pct: float = getattr(self, "params", {}).get("position_pct", 10.0)
 
-        grade_multiplier = {"A": 1.0, "B": 0.8, "C": 0.5, "ETF": 0.7}.get(
-            grade, 0.5
-        )
+        grade_multiplier = _GRADE_POSITION_MULT.get(grade, 0.5)
         confidence_multiplier = max(confidence, 1) / 5.0
 
         adjusted = base_pct * grade_multiplier * confidence_multiplier
@@ -288,6 +752,19 @@ class BaseStrategy(ABC):
                 snapshot[key] = str(value)
         return snapshot
 
+    def _market_snapshot(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return :meth:`_capture_snapshot` of ``market_data["indicators"]``.
+
+        The converted snapshot is cached on *market_data* (shared by every
+        strategy for the tick), and each signal gets its own shallow copy
+        so journal writes never alias another signal's snapshot.
+        """
+        snapshot = market_data.get("indicators_snapshot")
+        if snapshot is None:
+            snapshot = self._capture_snapshot(market_data.get("indicators", {}))
+            market_data["indicators_snapshot"] = snapshot
+        return dict(snapshot)
+
     # ── Repr ──────────────────────────────────────────────────────────────
 
     def __repr__(self) -> str:
@@ -30,9 +30,11 @@ import structlog
 
 from kats.strategy.base_strategy import (
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    grade_mask,
 )
 
 logger = structlog.get_logger(__name__)
@@ -63,9 +65,23 @@ class CANSLIMBreakoutStrategy(BaseStrategy):
             "stop_loss_pct": 8,
             "target_1_pct": 20,
             "target_2_pct": 30,
-            "grade_target": ["A"],
+            "grade_target": frozenset({"A"}),
             "position_pct": 25.0,
         }
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._stop_mult: float = 1 - self.params["stop_loss_pct"] / 100
+        self._target_1_mult: float = 1 + self.params["target_1_pct"] / 100
+        self._target_2_mult: float = 1 + self.params["target_2_pct"] / 100
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_pct"],
+            target_prices_pct=(
+                self.params["target_1_pct"],
+                self.params["target_2_pct"],
+            ),
+            trailing_stop=True,
+            trailing_stop_pct=5.0,
+        )
 
     # ── CAN SLIM scoring ─────────────────────────────────────────────────
 
@@ -195,18 +211,19 @@ class CANSLIMBreakoutStrategy(BaseStrategy):
         self, candidates: List[StockCandidate]
     ) -> List[StockCandidate]:
         """Pre-filter to A-grade stocks with strong CAN SLIM fundamentals."""
-        filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
-            if c.eps_growth_qoq < self.params["eps_qoq_min"] * 0.5:
-                continue
-            if c.rs_rank < 60:
-                continue
-            if c.canslim_score >= self.params["canslim_score_min"] * 0.7:
-                filtered.append(c)
-
-        self.log.info("scan_complete", strategy="S3", matched=len(filtered))
+        # Relaxed pre-filter thresholds (full check in generate_signal)
+        eps_min = self.params["eps_qoq_min"] * 0.5
+        score_min = self.params["canslim_score_min"] * 0.7
+        filtered: List[StockCandidate] = [
+            c
+            for c in self._filter_by_grade(candidates, self._grade_mask)
+            if c.rs_rank >= 60
+            and c.eps_growth_qoq >= eps_min
+            and c.canslim_score >= score_min
+        ]
+
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="S3", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -240,7 +257,7 @@ class CANSLIMBreakoutStrategy(BaseStrategy):
         if vol_ratio < self.params["volume_breakout_ratio"]:
             return None
 
-        stop_loss = pivot * (1 - self.params["stop_loss_pct"] / 100)
+        stop_loss = pivot * self._stop_mult
 
         self.log.info(
             "signal_generated",
@@ -257,8 +274,8 @@ class CANSLIMBreakoutStrategy(BaseStrategy):
             entry_price=current_price,
             stop_loss=stop_loss,
             target_prices=[
-                current_price * (1 + self.params["target_1_pct"] / 100),
-                current_price * (1 + self.params["target_2_pct"] / 100),
+                current_price * self._target_1_mult,
+                current_price * self._target_2_mult,
                 0,  # trailing stop
             ],
             position_pct=self._adjust_position(stock.confidence, stock.grade),
@@ -269,20 +286,10 @@ class CANSLIMBreakoutStrategy(BaseStrategy):
                 f"거래량 {vol_ratio:.1f}배, "
                 f"EPS +{stock.eps_growth_qoq:.0f}%"
             ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_pct"],
-            "target_prices_pct": [
-                self.params["target_1_pct"],
-                self.params["target_2_pct"],
-            ],
-            "trailing_stop": True,
-            "trailing_stop_pct": 5.0,
-            "time_exit": None,
-            "max_holding_hours": None,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
@@ -28,10 +28,16 @@ import numpy as np
 import structlog
 
 from kats.strategy.base_strategy import (
+    COL_CLOSE,
+    COL_OPEN,
+    COL_VOLUME,
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    grade_mask,
+    prepare_market_data,
 )
 
 logger = structlog.get_logger(__name__)
@@ -56,9 +62,18 @@ class DeadCatBounceStrategy(BaseStrategy):
             "target_pct": 4,
             "stop_loss_pct": 2,
             "max_holding_hours": 4,
-            "grade_target": ["A"],
+            "grade_target": frozenset({"A"}),
             "position_pct": 12.5,
         }
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._stop_mult: float = 1 - self.params["stop_loss_pct"] / 100
+        self._target_mult: float = 1 + self.params["target_pct"] / 100
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_pct"],
+            target_prices_pct=(self.params["target_pct"],),
+            max_holding_hours=self.params["max_holding_hours"],
+        )
 
     # ── Helpers ───────────────────────────────────────────────────────────
 
@@ -71,31 +86,27 @@ class DeadCatBounceStrategy(BaseStrategy):
 
     @staticmethod
     def _detect_volume_reversal(
-        minute_candles: Any,
+        market_data: Dict[str, Any],
         avg_minute_volume: float,
         spike_ratio: float,
     ) -> bool:
         """Detect a bullish volume reversal candle.
 
+        *market_data* must have been passed through
+        :func:`prepare_market_data`.
+
         Conditions:
             * Last candle is bullish (close > open).
             * Volume is >= spike_ratio * average minute volume.
         """
-        try:
-            opens = minute_candles["open"].values
-            closes = minute_candles["close"].values
-            volumes = minute_candles["volume"].values
-        except (KeyError, AttributeError):
+        if not market_data["minute_candles_ok"]:
             return False
 
-        if len(opens) < 1:
-            return False
+        last = market_data["minute_ohlcv"][-1]
+        last_bullish = last[COL_CLOSE] > last[COL_OPEN]
+        vol_spike = last[COL_VOLUME] >= avg_minute_volume * spike_ratio
 
-        last_bullish = closes[-1] > opens[-1]
-        last_vol = float(volumes[-1])
-        vol_spike = last_vol >= avg_minute_volume * spike_ratio
-
-        return last_bullish and vol_spike
+        return bool(last_bullish and vol_spike)
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
@@ -104,15 +115,14 @@ class DeadCatBounceStrategy(BaseStrategy):
     ) -> List[StockCandidate]:
         """Filter to A-grade large-cap stocks only."""
         min_market_cap = 1_000_000_000_000  # 1 조 원
-        filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
-            if c.market_cap < min_market_cap:
-                continue
-            filtered.append(c)
-
-        self.log.info("scan_complete", strategy="B1", matched=len(filtered))
+        filtered: List[StockCandidate] = [
+            c
+            for c in self._filter_by_grade(candidates, self._grade_mask)
+            if c.market_cap >= min_market_cap
+        ]
+
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="B1", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -125,7 +135,6 @@ class DeadCatBounceStrategy(BaseStrategy):
         indicators: Dict[str, Any] = market_data.get("indicators", {})
         prev_close: float = market_data["prev_day"]["close"]
         current_price: float = market_data["current_price"]
-        minute_candles = market_data.get("minute_candles")
         rsi: float = indicators.get("rsi_14", 50)
 
         # 1. Drop magnitude check
@@ -138,17 +147,14 @@ class DeadCatBounceStrategy(BaseStrategy):
             return None
 
         # 3. Volume reversal confirmation
-        avg_minute_vol = (
-            stock.avg_volume_20d / 390
-            if stock.avg_volume_20d > 0
-            else 0
-        )
         if not self._detect_volume_reversal(
-            minute_candles, avg_minute_vol, self.params["volume_spike_ratio"]
+            prepare_market_data(market_data),
+            stock.avg_minute_volume_20d,
+            self.params["volume_spike_ratio"],
         ):
             return None
 
-        stop_loss = current_price * (1 - self.params["stop_loss_pct"] / 100)
+        stop_loss = current_price * self._stop_mult
 
         self.log.info(
             "signal_generated",
@@ -164,7 +170,7 @@ class DeadCatBounceStrategy(BaseStrategy):
             entry_price=current_price,
             stop_loss=stop_loss,
             target_prices=[
-                current_price * (1 + self.params["target_pct"] / 100),
+                current_price * self._target_mult,
             ],
             position_pct=self._adjust_position(stock.confidence, stock.grade),
             confidence=min(stock.confidence, 3),
@@ -173,17 +179,10 @@ class DeadCatBounceStrategy(BaseStrategy):
                 f"RSI {rsi:.1f} 과매도, "
                 f"거래량 반전 확인 (최대 {self.params['max_holding_hours']}시간)"
             ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_pct"],
-            "target_prices_pct": [self.params["target_pct"]],
-            "trailing_stop": False,
-            "trailing_stop_pct": None,
-            "time_exit": None,
-            "max_holding_hours": self.params["max_holding_hours"],
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
@@ -27,9 +27,11 @@ import structlog
 
 from kats.strategy.base_strategy import (
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    grade_mask,
 )
 
 logger = structlog.get_logger(__name__)
@@ -48,7 +50,7 @@ class DividendSwitchingStrategy(BaseStrategy):
             (default 2).
         post_ex_rsi_threshold: RSI level below which a post-ex-date bounce
             entry is considered (default 35).
-        grade_target: Eligible stock grades (default ``["A"]``).
+        grade_target: Eligible stock grades (default ``{"A"}``).
         position_pct: Base position size (default 20 %).
 
     Category: NEUTRAL.
@@ -60,11 +62,16 @@ class DividendSwitchingStrategy(BaseStrategy):
             "min_dividend_yield": 3.0,
             "buy_days_before_ex": 2,
             "post_ex_rsi_threshold": 35,
-            "grade_target": ["A"],
+            "grade_target": frozenset({"A"}),
             "position_pct": 20.0,
         }
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
         # {stock_code: [{"ex_date": date, "dividend_yield": float, "stock_name": str}]}
         self.dividend_calendar: Dict[str, List[Dict[str, Any]]] = {}
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=5.0,
+            target_prices_pct=(3.0, 5.0),
+        )
 
     # ── Calendar management ───────────────────────────────────────────────
 
@@ -136,9 +143,7 @@ class DividendSwitchingStrategy(BaseStrategy):
         with adequate yield.
         """
         filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
+        for c in self._filter_by_grade(candidates, self._grade_mask):
             if c.stock_code not in self.dividend_calendar:
                 continue
             # Check if any upcoming event has sufficient yield
@@ -146,7 +151,8 @@ class DividendSwitchingStrategy(BaseStrategy):
                 if ev.get("dividend_yield", 0) >= self.params["min_dividend_yield"]:
                     filtered.append(c)
                     break
-        self.log.info("scan_complete", strategy="DS", matched=len(filtered))
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="DS", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -194,7 +200,7 @@ class DividendSwitchingStrategy(BaseStrategy):
                     f"{self.params['buy_days_before_ex']}일 전, "
                     f"배당수익률 {ev['dividend_yield']:.1f}%"
                 ),
-                indicators_snapshot=self._capture_snapshot(indicators),
+                indicators_snapshot=self._market_snapshot(market_data),
             )
 
         # --- Post-ex-date bounce signal ---
@@ -231,7 +237,7 @@ class DividendSwitchingStrategy(BaseStrategy):
                     f"배당락 후 반등: RSI {indicators.get('rsi_14', 0):.1f} "
                     f"과매도 반등 기회"
                 ),
-                indicators_snapshot=self._capture_snapshot(indicators),
+                indicators_snapshot=self._market_snapshot(market_data),
             )
 
         return None
@@ -282,9 +288,7 @@ class DividendSwitchingStrategy(BaseStrategy):
                         f"배당락일 {ev['ex_date']}, "
                         f"수익률 {ev['dividend_yield']:.1f}%"
                     ),
-                    indicators_snapshot=self._capture_snapshot(
-                        md.get("indicators", {})
-                    ),
+                    indicators_snapshot=self._market_snapshot(md),
                 )
             )
 
@@ -315,7 +319,7 @@ class DividendSwitchingStrategy(BaseStrategy):
                         f"배당락 후 반등: {ev.get('stock_name', code)} "
                         f"RSI {indicators.get('rsi_14', 0):.1f}"
                     ),
-                    indicators_snapshot=self._capture_snapshot(indicators),
+                    indicators_snapshot=self._market_snapshot(md),
                 )
             )
 
@@ -324,12 +328,5 @@ class DividendSwitchingStrategy(BaseStrategy):
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": 5.0,
-            "target_prices_pct": [3.0, 5.0],
-            "trailing_stop": False,
-            "trailing_stop_pct": None,
-            "time_exit": None,
-            "max_holding_hours": None,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
@@ -26,14 +26,22 @@ import numpy as np
 import structlog
 
 from kats.strategy.base_strategy import (
+    COL_LOW,
+    COL_VOLUME,
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    grade_mask,
+    prepare_market_data,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Signal rationale, rendered lazily by TradeSignal.reason
+_REASON_TEMPLATE = "Gap & Go: 갭 {gap:.1f}%, VWAP {vwap:,.0f}원 눌림 후 반등, 거래량 확인"
+
 
 class GapAndGoStrategy(BaseStrategy):
     """Gap & Go intraday pullback strategy.
@@ -54,58 +62,77 @@ class GapAndGoStrategy(BaseStrategy):
             "stop_loss_pct": 2.0,
             "target_1_pct": 3.0,
             "target_2_pct": 5.0,
-            "grade_target": ["B", "C"],
+            "grade_target": frozenset({"B", "C"}),
             "position_pct": 12.5,
         }
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._gap_min: float = float(self.params["gap_min_pct"])
+        self._gap_max: float = float(self.params["gap_max_pct"])
+        self._pullback_tol: float = float(self.params["pullback_vwap_tolerance_pct"])
+        self._vol_ratio: float = float(self.params["volume_confirmation_ratio"])
+        self._stop_mult: float = 1 - self.params["stop_loss_pct"] / 100
+        self._target_1_mult: float = 1 + self.params["target_1_pct"] / 100
+        self._target_2_mult: float = 1 + self.params["target_2_pct"] / 100
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_pct"],
+            target_prices_pct=(
+                self.params["target_1_pct"],
+                self.params["target_2_pct"],
+            ),
+            time_exit="MARKET_CLOSE",
+            max_holding_hours=6,
+        )
 
     # ── Helpers ───────────────────────────────────────────────────────────
 
     @staticmethod
-    def _calculate_gap_pct(prev_close: float, today_open: float) -> float:
-        """Return the gap percentage from previous close to today's open."""
-        if prev_close <= 0:
-            return 0.0
-        return (today_open - prev_close) / prev_close * 100
+    def _calculate_gap_pct(
+        prev_close: np.ndarray, today_open: np.ndarray
+    ) -> np.ndarray:
+        """Return the gap percentage from previous close to today's open.
+
+        Rows with a non-positive previous close yield ``0.0``.
+        """
+        gap = np.zeros_like(prev_close)
+        np.divide(
+            (today_open - prev_close) * 100,
+            prev_close,
+            out=gap,
+            where=prev_close > 0,
+        )
+        return gap
 
     @staticmethod
     def _detect_pullback_to_support(
-        minute_candles: Any,
-        vwap: float,
+        recent_lows: np.ndarray,
+        vwap: np.ndarray,
         tolerance_pct: float,
-    ) -> bool:
+    ) -> np.ndarray:
         """Check whether recent price action pulled back close to VWAP.
 
         A pullback is confirmed when the low of any of the last 5 candles
-        came within *tolerance_pct* of VWAP.
+        (one row of *recent_lows* per candidate, NaN-padded) came within
+        *tolerance_pct* of VWAP.
         """
-        try:
-            lows = minute_candles["low"].values[-5:]
-        except (KeyError, AttributeError, IndexError):
-            return False
-
-        if vwap <= 0:
-            return False
-
-        for low in lows:
-            dist = (low - vwap) / vwap * 100
-            if -tolerance_pct <= dist <= tolerance_pct:
-                return True
-        return False
+        valid = vwap > 0
+        safe_vwap = np.where(valid, vwap, 1.0)[:, None]
+        with np.errstate(invalid="ignore"):
+            dist = np.abs(recent_lows - safe_vwap) / safe_vwap * 100
+            near = (dist <= tolerance_pct).any(axis=1)
+        return valid & near
 
     @staticmethod
     def _confirm_bounce_volume(
-        minute_candles: Any,
-        avg_minute_volume: float,
+        last_volume: np.ndarray,
+        avg_minute_volume: np.ndarray,
         ratio: float,
-    ) -> bool:
+    ) -> np.ndarray:
         """Confirm that the most recent candle's volume exceeds *ratio*
-        times the average minute volume.
+        times the average minute volume (NaN volume never confirms).
         """
-        try:
-            last_vol = float(minute_candles["volume"].values[-1])
-        except (KeyError, AttributeError, IndexError):
-            return False
-        return last_vol >= avg_minute_volume * ratio
+        with np.errstate(invalid="ignore"):
+            return last_volume >= avg_minute_volume * ratio
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
@@ -115,9 +142,7 @@ class GapAndGoStrategy(BaseStrategy):
         """Pre-filter to liquid, lower-grade stocks that tend to gap."""
         min_turnover = 500_000_000  # 5 억 원
         filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
+        for c in self._filter_by_grade(candidates, self._grade_mask):
             if c.avg_turnover_20d < min_turnover:
                 continue
             # Prefer stocks with higher recent volatility
@@ -129,7 +154,8 @@ class GapAndGoStrategy(BaseStrategy):
                     continue
             filtered.append(c)
 
-        self.log.info("scan_complete", strategy="S2", matched=len(filtered))
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="S2", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -139,85 +165,165 @@ class GapAndGoStrategy(BaseStrategy):
         stock: StockCandidate,
         market_data: Dict[str, Any],
     ) -> Optional[TradeSignal]:
+        """Evaluate one stock with scalar checks.
+
+        The gap and VWAP conditions only need scalars, so they run before
+        the minute candles are converted; most calls exit there.
+        """
         indicators: Dict[str, Any] = market_data.get("indicators", {})
         prev_close: float = market_data["prev_day"]["close"]
-        today_open: float = market_data["today_open"]
         current_price: float = market_data["current_price"]
-        minute_candles = market_data.get("minute_candles")
         vwap: float = indicators.get("vwap", 0)
 
         # 1. Gap size validation
-        gap_pct = self._calculate_gap_pct(prev_close, today_open)
-        if not (self.params["gap_min_pct"] <= gap_pct <= self.params["gap_max_pct"]):
+        if prev_close <= 0:
+            return None
+        gap_pct = (market_data["today_open"] - prev_close) / prev_close * 100
+        if not (self._gap_min <= gap_pct <= self._gap_max):
+            return None
+
+        # 4. Price must still be above VWAP (momentum intact)
+        if vwap <= 0 or current_price < vwap:
             return None
 
+        prepare_market_data(market_data)
+        if not market_data["minute_candles_ok"]:
+            return None
+        tail = market_data["minute_tail5"]
+        lows = tail[:, COL_LOW].tolist()
+
         # 2. Pullback to VWAP / support
-        if not self._detect_pullback_to_support(
-            minute_candles, vwap, self.params["pullback_vwap_tolerance_pct"]
-        ):
+        tolerance = self._pullback_tol
+        if not any(abs(low - vwap) / vwap * 100 <= tolerance for low in lows):
             return None
 
         # 3. Volume confirmation on bounce
-        avg_minute_vol = (
-            stock.avg_volume_20d / 390  # ~390 trading minutes per day
-            if stock.avg_volume_20d > 0
-            else 0
-        )
-        if not self._confirm_bounce_volume(
-            minute_candles, avg_minute_vol, self.params["volume_confirmation_ratio"]
+        if not float(tail[-1, COL_VOLUME]) >= (
+            stock.avg_minute_volume_20d * self._vol_ratio
         ):
             return None
 
+        # Pullback low for tighter stop
+        stop_loss = max(current_price * self._stop_mult, min(lows) * 0.998)
+        return self._build_signal(
+            stock, market_data, current_price, stop_loss, gap_pct, vwap
+        )
+
+    async def generate_signals_batch(
+        self,
+        stocks: List[StockCandidate],
+        market_data_batch: List[Dict[str, Any]],
+    ) -> List[Optional[TradeSignal]]:
+        """Evaluate all *stocks* in one vectorised pass.
+
+        Per-candidate inputs are stacked into aligned arrays, the four entry
+        conditions are combined into a single boolean mask, and
+        :class:`TradeSignal` objects are built only for the survivors.
+        """
+        n = len(stocks)
+        signals: List[Optional[TradeSignal]] = [None] * n
+        if n == 0:
+            return signals
+
+        prev_close = np.empty(n)
+        today_open = np.empty(n)
+        current_price = np.empty(n)
+        vwap = np.empty(n)
+        avg_minute_vol = np.empty(n)
+        # Last 5 minute lows per candidate, NaN-padded on the left; filled
+        # in place so no per-candidate temporaries are allocated.
+        last_volume = np.full(n, np.nan)
+        recent_lows = np.full((n, 5), np.nan)
+
+        for i, (stock, market_data) in enumerate(zip(stocks, market_data_batch)):
+            indicators: Dict[str, Any] = market_data.get("indicators", {})
+            prev_close[i] = market_data["prev_day"]["close"]
+            today_open[i] = market_data["today_open"]
+            current_price[i] = market_data["current_price"]
+            vwap[i] = indicators.get("vwap", 0)
+            avg_minute_vol[i] = stock.avg_minute_volume_20d
+
+        # 1. Gap size validation
+        gap_pct = self._calculate_gap_pct(prev_close, today_open)
+        mask = (gap_pct >= self._gap_min) & (gap_pct <= self._gap_max)
+
         # 4. Price must still be above VWAP (momentum intact)
-        if current_price < vwap:
-            return None
+        mask &= current_price >= vwap
 
-        stop_loss = current_price * (1 - self.params["stop_loss_pct"] / 100)
+        # Minute candles are converted only for rows still in the running
+        for i in np.flatnonzero(mask).tolist():
+            market_data = market_data_batch[i]
+            prepare_market_data(market_data)
+            if market_data["minute_candles_ok"]:
+                tail = market_data["minute_tail5"]
+                recent_lows[i, 5 - tail.shape[0]:] = tail[:, COL_LOW]
+                last_volume[i] = tail[-1, COL_VOLUME]
 
-        # Pullback low for tighter stop
-        try:
-            recent_low = float(np.min(minute_candles["low"].values[-5:]))
-            stop_loss = max(stop_loss, recent_low * 0.998)
-        except (KeyError, AttributeError, IndexError, ValueError):
-            pass
-
-        self.log.info(
-            "signal_generated",
-            stock=stock.stock_code,
-            gap_pct=round(gap_pct, 2),
-            vwap=round(vwap),
+        # 2. Pullback to VWAP / support
+        mask &= self._detect_pullback_to_support(
+            recent_lows, vwap, self._pullback_tol
         )
 
+        # 3. Volume confirmation on bounce
+        mask &= self._confirm_bounce_volume(
+            last_volume, avg_minute_vol, self._vol_ratio
+        )
+
+        hits = np.flatnonzero(mask)
+        if hits.size == 0:
+            return signals
+
+        # Pullback low for tighter stop (survivors always have a low near VWAP)
+        stop_loss = np.maximum(
+            current_price[hits] * self._stop_mult,
+            np.nanmin(recent_lows[hits], axis=1) * 0.998,
+        )
+
+        for j, i in enumerate(hits.tolist()):
+            signals[i] = self._build_signal(
+                stocks[i],
+                market_data_batch[i],
+                float(current_price[i]),
+                float(stop_loss[j]),
+                float(gap_pct[i]),
+                float(vwap[i]),
+            )
+
+        return signals
+
+    def _build_signal(
+        self,
+        stock: StockCandidate,
+        market_data: Dict[str, Any],
+        price: float,
+        stop_loss: float,
+        gap_pct: float,
+        vwap: float,
+    ) -> TradeSignal:
+        """Log and build the BUY signal for a stock that passed all checks."""
+        if self._info_enabled:
+            self.log.info(
+                "signal_generated",
+                stock=stock.stock_code,
+                gap_pct=round(gap_pct, 2),
+                vwap=round(vwap),
+            )
+
         return TradeSignal(
             stock_code=stock.stock_code,
             action="BUY",
             strategy_code="S2",
-            entry_price=current_price,
+            entry_price=price,
             stop_loss=stop_loss,
-            target_prices=[
-                current_price * (1 + self.params["target_1_pct"] / 100),
-                current_price * (1 + self.params["target_2_pct"] / 100),
-            ],
+            target_prices=[price * self._target_1_mult, price * self._target_2_mult],
             position_pct=self._adjust_position(stock.confidence, stock.grade),
             confidence=stock.confidence,
-            reason=(
-                f"Gap & Go: 갭 {gap_pct:.1f}%, VWAP {vwap:,.0f}원 눌림 후 반등, "
-                f"거래량 확인"
-            ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            reason=_REASON_TEMPLATE,
+            reason_args={"gap": gap_pct, "vwap": vwap},
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_pct"],
-            "target_prices_pct": [
-                self.params["target_1_pct"],
-                self.params["target_2_pct"],
-            ],
-            "trailing_stop": False,
-            "trailing_stop_pct": None,
-            "time_exit": "MARKET_CLOSE",
-            "max_holding_hours": 6,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
@@ -14,19 +14,51 @@ Suitable for KOSPI blue-chips with low volatility periods.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import structlog
 
 from kats.strategy.base_strategy import (
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    grade_mask,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Signal rationale, rendered lazily by TradeSignal.reason
+_REASON_TEMPLATE = "그리드 매매: 레벨 {level} ({action}) 가격 {price:,.0f}원 도달"
+
+# Distance sentinel for ineligible levels in the integer nearest-level search
+_NO_LEVEL = np.iinfo(np.int64).max
+
+
+@dataclass(slots=True)
+class GridState:
+    """Structure-of-arrays grid for a single stock.
+
+    Index ``i`` of every array describes grid level ``i`` (ascending price).
+
+    Attributes:
+        prices: Level prices in KRW (rounded to whole won).
+        is_buy: ``True`` for BUY levels (below center), ``False`` for SELL.
+        filled: ``True`` once the level has produced a signal.
+    """
+
+    prices: np.ndarray
+    is_buy: np.ndarray
+    filled: np.ndarray
+
+    @staticmethod
+    def action_of(is_buy: bool) -> str:
+        """Map a level's ``is_buy`` flag to its order action."""
+        return "BUY" if is_buy else "SELL"
+
 
 class GridTradingStrategy(BaseStrategy):
     """Mechanical grid trading strategy.
@@ -47,45 +79,52 @@ class GridTradingStrategy(BaseStrategy):
             "grid_range_pct": 10,
             "order_size_pct": 5,
             "max_position_pct": 30,
-            "grade_target": ["A", "B", "ETF"],
+            "grade_target": frozenset({"A", "B", "ETF"}),
             "position_pct": 5.0,
         }
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._grid_count: int = int(self.params["grid_count"])
+        self._grid_range_half: float = self.params["grid_range_pct"] / 200.0
+        self._order_size_pct: float = float(self.params["order_size_pct"])
+        self._max_position_pct: float = float(self.params["max_position_pct"])
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        # Normalised level offsets (1 +/- half-range) and BUY flags are
+        # fixed by params, so each grid is one scalar multiply.
+        self._grid_offsets: np.ndarray = 1.0 + np.linspace(
+            -self._grid_range_half, self._grid_range_half, self._grid_count + 1
+        )
+        self._grid_is_buy: np.ndarray = (
+            np.arange(self._grid_count + 1) * 2 < self._grid_count
+        )
+        self._grid_is_buy.flags.writeable = False  # shared by every GridState
         # Active grid state per stock (populated by calculate_grid)
-        self._active_grids: Dict[str, List[Dict[str, Any]]] = {}
+        self._active_grids: Dict[str, GridState] = {}
+        self._exit_rules: ExitRules = ExitRules(stop_loss_pct=2.0)
 
     # ── Grid calculation ──────────────────────────────────────────────────
 
-    def calculate_grid(self, center_price: float) -> List[Dict[str, Any]]:
+    def calculate_grid(self, center_price: float) -> GridState:
         """Compute evenly-spaced grid levels around *center_price*.
 
         Returns:
-            List of grid-level dicts with keys:
-                ``level``, ``price``, ``action``, ``filled``.
+            A :class:`GridState` with ``grid_count + 1`` levels.
             Levels below center are BUY; levels at or above center are SELL.
         """
-        half_range = center_price * self.params["grid_range_pct"] / 100 / 2
-        grid_step = (half_range * 2) / self.params["grid_count"]
-
-        grids: List[Dict[str, Any]] = []
-        for i in range(self.params["grid_count"] + 1):
-            price = center_price - half_range + (grid_step * i)
-            action = "BUY" if price < center_price else "SELL"
-            grids.append(
-                {
-                    "level": i,
-                    "price": round(price),
-                    "action": action,
-                    "filled": False,
-                }
-            )
-        self.log.info(
-            "grid_calculated",
-            center=center_price,
-            levels=len(grids),
-            low=grids[0]["price"],
-            high=grids[-1]["price"],
+        prices = np.rint(center_price * self._grid_offsets).astype(np.int64)
+        grid = GridState(
+            prices=prices,
+            is_buy=self._grid_is_buy,
+            filled=np.zeros(prices.size, dtype=bool),
         )
-        return grids
+        if self._info_enabled:
+            self.log.info(
+                "grid_calculated",
+                center=center_price,
+                levels=prices.size,
+                low=int(prices[0]),
+                high=int(prices[-1]),
+            )
+        return grid
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
@@ -100,9 +139,7 @@ class GridTradingStrategy(BaseStrategy):
             * Price within 25 % of 52-week midpoint (range-bound proxy).
         """
         filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
+        for c in self._filter_by_grade(candidates, self._grade_mask):
             # Prefer range-bound stocks
             if c.trend_score > 60:
                 continue
@@ -114,7 +151,8 @@ class GridTradingStrategy(BaseStrategy):
                 continue
             filtered.append(c)
 
-        self.log.info("scan_complete", strategy="GR", matched=len(filtered))
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="GR", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -125,103 +163,88 @@ class GridTradingStrategy(BaseStrategy):
         market_data: Dict[str, Any],
     ) -> Optional[TradeSignal]:
         current_price: float = market_data["current_price"]
-        indicators: Dict[str, Any] = market_data.get("indicators", {})
         code = stock.stock_code
 
         # Initialise grid if not set for this stock
         if code not in self._active_grids:
             self._active_grids[code] = self.calculate_grid(current_price)
 
-        grids = self._active_grids[code]
+        grid = self._active_grids[code]
+        grid_low = int(grid.prices[0])
+        grid_high = int(grid.prices[-1])
 
         # Check if price has left the grid entirely
-        if current_price < grids[0]["price"] or current_price > grids[-1]["price"]:
+        if current_price < grid_low or current_price > grid_high:
             self.log.warning(
                 "grid_breached",
                 stock=code,
                 price=current_price,
-                grid_low=grids[0]["price"],
-                grid_high=grids[-1]["price"],
+                grid_low=grid_low,
+                grid_high=grid_high,
             )
             # Remove grid -- strategy paused for this stock
             del self._active_grids[code]
             return None
 
-        # Find the nearest unfilled grid level
-        nearest_level: Optional[Dict[str, Any]] = None
-        min_distance = float("inf")
-        for level in grids:
-            if level["filled"]:
-                continue
-            dist = abs(current_price - level["price"])
-            # Only trigger if price is within 0.3 % of a grid line
-            if dist / level["price"] * 100 <= 0.3 and dist < min_distance:
-                min_distance = dist
-                nearest_level = level
-
-        if nearest_level is None:
+        # Find the nearest unfilled grid level within 0.3 % of a grid line.
+        # KRX prices are whole won, so compare in integers:
+        # dist / price * 100 <= 0.3  <=>  1000 * dist <= 3 * price
+        current_won = int(round(current_price))
+        dist = np.abs(current_won - grid.prices)
+        eligible = ~grid.filled & (1000 * dist <= 3 * grid.prices)
+        if not eligible.any():
             return None
+        idx = int(np.argmin(np.where(eligible, dist, _NO_LEVEL)))
+        level_price = int(grid.prices[idx])
+        action = GridState.action_of(bool(grid.is_buy[idx]))
 
         # Enforce max position
-        filled_count = sum(1 for g in grids if g["filled"] and g["action"] == "BUY")
-        cumulative_pct = filled_count * self.params["order_size_pct"]
-        if (
-            nearest_level["action"] == "BUY"
-            and cumulative_pct >= self.params["max_position_pct"]
-        ):
+        filled_count = int(np.count_nonzero(grid.filled & grid.is_buy))
+        cumulative_pct = filled_count * self._order_size_pct
+        if action == "BUY" and cumulative_pct >= self._max_position_pct:
             self.log.debug("max_grid_position_reached", stock=code)
             return None
 
         # Mark as filled
-        nearest_level["filled"] = True
+        grid.filled[idx] = True
 
         # Stop loss = grid low boundary
-        stop_loss = grids[0]["price"] * 0.98
-
-        # Target prices = next grid levels in opposite direction
-        target_prices = [
-            g["price"]
-            for g in grids
-            if not g["filled"]
-            and g["action"] != nearest_level["action"]
-        ][:3] or [current_price * 1.03]
-
-        self.log.info(
-            "grid_signal",
-            stock=code,
-            action=nearest_level["action"],
-            level=nearest_level["level"],
-            price=nearest_level["price"],
+        stop_loss = grid_low * 0.98
+
+        # Target prices = next unfilled grid levels in opposite direction
+        opposite = grid.is_buy != grid.is_buy[idx]
+        candidates = grid.prices[~grid.filled & opposite][:3]
+        target_prices = (
+            candidates.tolist() if candidates.size else [current_price * 1.03]
         )
 
+        if self._info_enabled:
+            self.log.info(
+                "grid_signal",
+                stock=code,
+                action=action,
+                level=idx,
+                price=level_price,
+            )
+
         return TradeSignal(
             stock_code=code,
-            action=nearest_level["action"],
+            action=action,
             strategy_code="GR",
             entry_price=current_price,
             stop_loss=stop_loss,
             target_prices=target_prices,
-            position_pct=self.params["order_size_pct"],
+            position_pct=self._order_size_pct,
             confidence=min(stock.confidence, 3),
-            reason=(
-                f"그리드 매매: 레벨 {nearest_level['level']} "
-                f"({nearest_level['action']}) "
-                f"가격 {nearest_level['price']:,.0f}원 도달"
-            ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            reason=_REASON_TEMPLATE,
+            reason_args={"level": idx, "action": action, "price": level_price},
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": 2.0,
-            "target_prices_pct": [],
-            "trailing_stop": False,
-            "trailing_stop_pct": None,
-            "time_exit": None,
-            "max_holding_hours": None,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
 
     # ── Utilities ─────────────────────────────────────────────────────────
 
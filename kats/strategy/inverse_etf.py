@@ -21,12 +21,13 @@ References:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
 from kats.strategy.base_strategy import (
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
@@ -34,6 +35,9 @@ from kats.strategy.base_strategy import (
 
 logger = structlog.get_logger(__name__)
 
+# Signal rationale, rendered lazily by TradeSignal.reason
+_REASON_TEMPLATE = "인버스 ETF 매수: {name}, KOSPI 하락추세 확인 (MA50, MA200 하회, MACD 하락)"
+
 # Known Korean inverse ETFs
 INVERSE_ETF_CODES: Dict[str, str] = {
     "114800": "KODEX 인버스",
@@ -58,10 +62,21 @@ class InverseETFStrategy(BaseStrategy):
         self.params: Dict[str, Any] = {
             "target_pct": 5.0,
             "stop_loss_pct": 3.0,
-            "grade_target": ["ETF"],
+            "grade_target": frozenset({"ETF"}),
             "position_pct": 17.5,
-            "inverse_etf_codes": list(INVERSE_ETF_CODES.keys()),
+            "inverse_etf_codes": frozenset(INVERSE_ETF_CODES),
         }
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._stop_mult: float = 1 - self.params["stop_loss_pct"] / 100
+        self._target_mult: float = 1 + self.params["target_pct"] / 100
+        # KOSPI regime verdict memoised on the KOSPI values it came from;
+        # every ETF candidate in a tick shares the same index data.
+        self._regime_key: Optional[Tuple[Any, ...]] = None
+        self._regime_state: Tuple[bool, bool] = (False, False)
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_pct"],
+            target_prices_pct=(self.params["target_pct"],),
+        )
 
     # ── Market condition checks ───────────────────────────────────────────
 
@@ -98,15 +113,41 @@ class InverseETFStrategy(BaseStrategy):
         ma50 = kospi_indicators.get("kospi_ma50", 0)
         return price > ma50 if (price > 0 and ma50 > 0) else False
 
+    def _bear_regime(self, kospi_indicators: Dict[str, Any]) -> Tuple[bool, bool]:
+        """Return ``(entry_ok, exit_condition)`` for the KOSPI state.
+
+        ``entry_ok`` is bear market + declining trend; ``exit_condition``
+        is set when KOSPI is back above MA50.  The helpers above are only
+        re-evaluated when the KOSPI inputs change.
+        """
+        key = (
+            kospi_indicators.get("kospi_close", 0),
+            kospi_indicators.get("kospi_ma50", 0),
+            kospi_indicators.get("kospi_ma200", 0),
+            kospi_indicators.get("kospi_macd"),
+            kospi_indicators.get("kospi_macd_signal"),
+        )
+        if key != self._regime_key:
+            entry_ok = self._is_bear_market(kospi_indicators) and (
+                self._is_trend_declining(kospi_indicators)
+            )
+            self._regime_key = key
+            self._regime_state = (
+                entry_ok,
+                entry_ok and self._should_exit_bear(kospi_indicators),
+            )
+        return self._regime_state
+
     # ── Scan ──────────────────────────────────────────────────────────────
 
     async def scan(
         self, candidates: List[StockCandidate]
     ) -> List[StockCandidate]:
         """Filter candidates to inverse ETFs only."""
-        etf_codes = set(self.params["inverse_etf_codes"])
+        etf_codes = self.params["inverse_etf_codes"]
         filtered = [c for c in candidates if c.stock_code in etf_codes]
-        self.log.info("scan_complete", strategy="B2", matched=len(filtered))
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="B2", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -124,27 +165,28 @@ class InverseETFStrategy(BaseStrategy):
             return None
 
         # Broad market must be bearish
-        if not self._is_bear_market(indicators):
-            return None
-        if not self._is_trend_declining(indicators):
+        entry_ok, exit_condition = self._bear_regime(indicators)
+        if not entry_ok:
             return None
 
         # Check if we should be exiting instead
-        if self._should_exit_bear(indicators):
-            self.log.info(
-                "bear_exit_condition",
-                stock=stock.stock_code,
-                note="KOSPI above MA50 -- skip new entry",
-            )
+        if exit_condition:
+            if self._info_enabled:
+                self.log.info(
+                    "bear_exit_condition",
+                    stock=stock.stock_code,
+                    note="KOSPI above MA50 -- skip new entry",
+                )
             return None
 
-        stop_loss = current_price * (1 - self.params["stop_loss_pct"] / 100)
+        stop_loss = current_price * self._stop_mult
 
-        self.log.info(
-            "signal_generated",
-            stock=stock.stock_code,
-            etf_name=INVERSE_ETF_CODES.get(stock.stock_code, "Unknown"),
-        )
+        if self._info_enabled:
+            self.log.info(
+                "signal_generated",
+                stock=stock.stock_code,
+                etf_name=INVERSE_ETF_CODES.get(stock.stock_code, "Unknown"),
+            )
 
         return TradeSignal(
             stock_code=stock.stock_code,
@@ -153,26 +195,18 @@ class InverseETFStrategy(BaseStrategy):
             entry_price=current_price,
             stop_loss=stop_loss,
             target_prices=[
-                current_price * (1 + self.params["target_pct"] / 100),
+                current_price * self._target_mult,
             ],
             position_pct=self._adjust_position(stock.confidence, stock.grade),
             confidence=min(stock.confidence, 3),
-            reason=(
-                f"인버스 ETF 매수: "
-                f"{INVERSE_ETF_CODES.get(stock.stock_code, stock.stock_code)}, "
-                f"KOSPI 하락추세 확인 (MA50, MA200 하회, MACD 하락)"
-            ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            reason=_REASON_TEMPLATE,
+            reason_args={
+                "name": INVERSE_ETF_CODES.get(stock.stock_code, stock.stock_code),
+            },
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_pct"],
-            "target_prices_pct": [self.params["target_pct"]],
-            "trailing_stop": False,
-            "trailing_stop_pct": None,
-            "time_exit": None,
-            "max_holding_hours": None,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
@@ -21,21 +21,37 @@ References:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set
+import re
+from typing import Any, Dict, FrozenSet, List, Optional
 
+import numpy as np
 import structlog
 
 from kats.strategy.base_strategy import (
+    COL_CLOSE,
+    COL_LOW,
+    COL_OPEN,
+    COL_VOLUME,
+    OHLCV_COLUMNS,
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    grade_mask,
+    prepare_market_data,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Signal rationale, rendered lazily by TradeSignal.reason
+_REASON_TEMPLATE = (
+    "과매도 역발상: RSI {rsi:.1f}, BB 하단 {bb_lower:,.0f}원 터치, "
+    "방어섹터({sector}), 거래량 반전"
+)
+
 # Defensive sectors in KRX classification (Korean sector names)
-DEFENSIVE_SECTORS: Set[str] = {
+DEFENSIVE_SECTORS: FrozenSet[str] = frozenset({
     "전기가스업",         # Utilities
     "전력",
     "가스",
@@ -48,7 +64,7 @@ DEFENSIVE_SECTORS: Set[str] = {
     "헬스케어",
     "제약",
     "바이오",
-}
+})
 
 
 class OversoldReversalStrategy(BaseStrategy):
@@ -70,75 +86,84 @@ class OversoldReversalStrategy(BaseStrategy):
             "target_pct": 5.0,
             "stop_loss_pct": 3.0,
             "max_holding_days": 2,
-            "grade_target": ["A"],
+            "grade_target": frozenset({"A"}),
             "position_pct": 12.5,
             "defensive_sectors": DEFENSIVE_SECTORS,
         }
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._rsi_threshold: float = float(self.params["rsi_threshold"])
+        self._bb_touch_pct: float = float(self.params["bb_lower_touch_pct"])
+        self._spike_ratio: float = float(self.params["volume_spike_ratio"])
+        self._stop_mult: float = 1 - self.params["stop_loss_pct"] / 100
+        self._target_mult: float = 1 + self.params["target_pct"] / 100
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        # One alternation pattern replaces the per-keyword substring loop;
+        # results are memoised per sector name (KRX sectors are a fixed set).
+        self._defensive_pattern: re.Pattern[str] = re.compile(
+            "|".join(map(re.escape, sorted(self.params["defensive_sectors"])))
+        )
+        self._defensive_by_sector: Dict[str, bool] = {}
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_pct"],
+            target_prices_pct=(self.params["target_pct"],),
+            max_holding_hours=self.params["max_holding_days"] * 6,  # ~6 trading hrs/day
+        )
 
     # ── Helpers ───────────────────────────────────────────────────────────
 
     @staticmethod
     def _is_bb_lower_touch(
-        current_price: float,
-        bb_lower: float,
+        current_price: np.ndarray,
+        bb_lower: np.ndarray,
         tolerance_pct: float = 0.5,
-    ) -> bool:
-        """Check if price is at or below the lower Bollinger Band."""
-        if bb_lower <= 0:
-            return False
-        distance_pct = (current_price - bb_lower) / bb_lower * 100
-        return distance_pct <= tolerance_pct
+    ) -> np.ndarray:
+        """Check, per row, if price is at or below the lower Bollinger Band.
+
+        Rows with a non-positive band never qualify.
+        """
+        valid = bb_lower > 0
+        safe_lower = np.where(valid, bb_lower, 1.0)
+        distance_pct = (current_price - safe_lower) / safe_lower * 100
+        return valid & (distance_pct <= tolerance_pct)
 
     @staticmethod
     def _detect_reversal_candle(
-        minute_candles: Any,
-        avg_minute_vol: float,
+        last_candles: np.ndarray,
+        avg_minute_vol: np.ndarray,
         spike_ratio: float,
-    ) -> bool:
-        """Detect a bullish reversal candle with a volume spike.
+    ) -> np.ndarray:
+        """Detect, per row, a bullish reversal candle with a volume spike.
+
+        *last_candles* holds the latest minute candle of each candidate in
+        :data:`OHLCV_COLUMNS` order (NaN rows never qualify).
 
         Conditions:
             * Bullish candle (close > open).
             * Long lower shadow (wick >= body, indicating buying pressure).
             * Volume >= spike_ratio * average minute volume.
         """
-        try:
-            opens = minute_candles["open"].values
-            closes = minute_candles["close"].values
-            highs = minute_candles["high"].values
-            lows = minute_candles["low"].values
-            volumes = minute_candles["volume"].values
-        except (KeyError, AttributeError):
-            return False
-
-        if len(opens) < 1:
-            return False
-
-        o, c, h, l, v = opens[-1], closes[-1], highs[-1], lows[-1], volumes[-1]
-
-        # Must be bullish
-        if c <= o:
-            return False
+        o = last_candles[:, COL_OPEN]
+        l = last_candles[:, COL_LOW]
+        c = last_candles[:, COL_CLOSE]
+        v = last_candles[:, COL_VOLUME]
 
         body = c - o
         lower_shadow = o - l  # distance from open to low
-
-        # Lower shadow should be significant (buying absorbed selling)
-        if body <= 0 or lower_shadow < body * 0.5:
-            return False
-
-        # Volume spike
-        if float(v) < avg_minute_vol * spike_ratio:
-            return False
-
-        return True
+        with np.errstate(invalid="ignore"):
+            return (
+                (body > 0)  # must be bullish
+                # Lower shadow should be significant (buying absorbed selling)
+                & (lower_shadow >= body * 0.5)
+                & (v >= avg_minute_vol * spike_ratio)  # volume spike
+            )
 
     def _is_defensive_sector(self, sector: str) -> bool:
         """Check if the stock's sector qualifies as defensive."""
-        for ds in self.params["defensive_sectors"]:
-            if ds in sector:
-                return True
-        return False
+        is_defensive = self._defensive_by_sector.get(sector)
+        if is_defensive is None:
+            is_defensive = self._defensive_pattern.search(sector) is not None
+            self._defensive_by_sector[sector] = is_defensive
+        return is_defensive
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
@@ -147,14 +172,13 @@ class OversoldReversalStrategy(BaseStrategy):
     ) -> List[StockCandidate]:
         """Filter to A-grade defensive-sector stocks."""
         filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
+        for c in self._filter_by_grade(candidates, self._grade_mask):
             if not self._is_defensive_sector(c.sector):
                 continue
             filtered.append(c)
 
-        self.log.info("scan_complete", strategy="B4", matched=len(filtered))
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="B4", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -164,8 +188,12 @@ class OversoldReversalStrategy(BaseStrategy):
         stock: StockCandidate,
         market_data: Dict[str, Any],
     ) -> Optional[TradeSignal]:
+        """Evaluate one stock with scalar guards.
+
+        Minute candles are converted only once the sector, RSI and
+        BB-touch checks pass.
+        """
         indicators: Dict[str, Any] = market_data.get("indicators", {})
-        minute_candles = market_data.get("minute_candles")
         current_price: float = market_data["current_price"]
         rsi: float = indicators.get("rsi_14", 50)
         bb_lower: float = indicators.get("bb_lower", 0)
@@ -175,63 +203,124 @@ class OversoldReversalStrategy(BaseStrategy):
             return None
 
         # 2. RSI extreme oversold
-        if rsi >= self.params["rsi_threshold"]:
+        if rsi >= self._rsi_threshold:
             return None
 
         # 3. BB lower band touch
-        if not self._is_bb_lower_touch(
-            current_price, bb_lower, self.params["bb_lower_touch_pct"]
+        if bb_lower <= 0 or (
+            (current_price - bb_lower) / bb_lower * 100 > self._bb_touch_pct
         ):
             return None
 
         # 4. Volume spike reversal candle
-        avg_minute_vol = (
-            stock.avg_volume_20d / 390
-            if stock.avg_volume_20d > 0
-            else 0
-        )
-        if not self._detect_reversal_candle(
-            minute_candles, avg_minute_vol, self.params["volume_spike_ratio"]
+        prepare_market_data(market_data)
+        if not market_data["minute_candles_ok"]:
+            return None
+        o, _, l, c, v = market_data["minute_ohlcv"][-1].tolist()
+        body = c - o
+        if not (
+            body > 0
+            and o - l >= body * 0.5
+            and v >= stock.avg_minute_volume_20d * self._spike_ratio
         ):
             return None
 
-        stop_loss = current_price * (1 - self.params["stop_loss_pct"] / 100)
+        return self._build_signal(stock, market_data, current_price, rsi, bb_lower)
 
-        self.log.info(
-            "signal_generated",
-            stock=stock.stock_code,
-            sector=stock.sector,
-            rsi=round(rsi, 1),
-            bb_lower=round(bb_lower),
+    async def generate_signals_batch(
+        self,
+        stocks: List[StockCandidate],
+        market_data_batch: List[Dict[str, Any]],
+    ) -> List[Optional[TradeSignal]]:
+        """Evaluate all *stocks* with one fused guard predicate.
+
+        Sector, RSI and BB-touch checks are combined into a single mask
+        over the batch; the reversal-candle check then runs only on the
+        rows that survive, and signals are allocated for the final hits.
+        """
+        n = len(stocks)
+        signals: List[Optional[TradeSignal]] = [None] * n
+        if n == 0:
+            return signals
+
+        current_price = np.empty(n)
+        rsi = np.empty(n)
+        bb_lower = np.empty(n)
+        defensive = np.empty(n, dtype=bool)
+        for i, (stock, market_data) in enumerate(zip(stocks, market_data_batch)):
+            indicators: Dict[str, Any] = market_data.get("indicators", {})
+            current_price[i] = market_data["current_price"]
+            rsi[i] = indicators.get("rsi_14", 50)
+            bb_lower[i] = indicators.get("bb_lower", 0)
+            defensive[i] = self._is_defensive_sector(stock.sector)
+
+        # 1-3. Defensive sector + RSI extreme oversold + BB lower band touch
+        mask = (
+            defensive
+            & (rsi < self._rsi_threshold)
+            & self._is_bb_lower_touch(current_price, bb_lower, self._bb_touch_pct)
         )
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return signals
+
+        # 4. Volume spike reversal candle (survivors only)
+        last_candles = np.full((candidates.size, len(OHLCV_COLUMNS)), np.nan)
+        avg_minute_vol = np.empty(candidates.size)
+        for j, i in enumerate(candidates.tolist()):
+            market_data = prepare_market_data(market_data_batch[i])
+            if market_data["minute_candles_ok"]:
+                last_candles[j] = market_data["minute_ohlcv"][-1]
+            avg_minute_vol[j] = stocks[i].avg_minute_volume_20d
+        reversal = self._detect_reversal_candle(
+            last_candles, avg_minute_vol, self._spike_ratio
+        )
+
+        for i in candidates[reversal].tolist():
+            market_data = market_data_batch[i]
+            signals[i] = self._build_signal(
+                stocks[i],
+                market_data,
+                market_data["current_price"],
+                float(rsi[i]),
+                float(bb_lower[i]),
+            )
+
+        return signals
+
+    def _build_signal(
+        self,
+        stock: StockCandidate,
+        market_data: Dict[str, Any],
+        price: float,
+        rsi: float,
+        bb_lower: float,
+    ) -> TradeSignal:
+        """Log and build the BUY signal for a stock that passed all checks."""
+        if self._info_enabled:
+            self.log.info(
+                "signal_generated",
+                stock=stock.stock_code,
+                sector=stock.sector,
+                rsi=round(rsi, 1),
+                bb_lower=round(bb_lower),
+            )
 
         return TradeSignal(
             stock_code=stock.stock_code,
             action="BUY",
             strategy_code="B4",
-            entry_price=current_price,
-            stop_loss=stop_loss,
-            target_prices=[
-                current_price * (1 + self.params["target_pct"] / 100),
-            ],
+            entry_price=price,
+            stop_loss=price * self._stop_mult,
+            target_prices=[price * self._target_mult],
             position_pct=self._adjust_position(stock.confidence, stock.grade),
             confidence=min(stock.confidence, 3),
-            reason=(
-                f"과매도 역발상: RSI {rsi:.1f}, "
-                f"BB 하단 {bb_lower:,.0f}원 터치, "
-                f"방어섹터({stock.sector}), 거래량 반전"
-            ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            reason=_REASON_TEMPLATE,
+            reason_args={"rsi": rsi, "bb_lower": bb_lower, "sector": stock.sector},
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_pct"],
-            "target_prices_pct": [self.params["target_pct"]],
-            "trailing_stop": False,
-            "trailing_stop_pct": None,
-            "time_exit": None,
-            "max_holding_hours": self.params["max_holding_days"] * 6,  # ~6 trading hrs/day
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
@@ -21,20 +21,35 @@ References:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import structlog
 
+from kats.strategy import _fast
 from kats.strategy.base_strategy import (
+    COL_CLOSE,
+    COL_HIGH,
+    COL_LOW,
+    COL_OPEN,
+    OHLCV_COLUMNS,
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    grade_mask,
+    prepare_daily_data,
+    prepare_market_data,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Signal rationales, rendered lazily by TradeSignal.reason
+_SELL_REASON = "레인지 매도: 저항 {resistance:,.0f}원 도달, 채널 [{support:,.0f} ~ {resistance:,.0f}]"
+_BUY_REASON = "레인지 매수: 지지 {support:,.0f}원 반등, 채널 [{support:,.0f} ~ {resistance:,.0f}]"
+_BUY_SQUEEZE_REASON = _BUY_REASON + ", BB 스퀴즈"
+
 
 class RangeTradingStrategy(BaseStrategy):
     """Support/resistance range trading with BB squeeze confirmation.
@@ -56,100 +71,43 @@ class RangeTradingStrategy(BaseStrategy):
             "resistance_proximity_pct": 1.5,
             "stop_loss_pct": 3.0,
             "target_pct": 5.0,
-            "grade_target": ["A", "B"],
+            "grade_target": frozenset({"A", "B"}),
             "position_pct": 12.5,
         }
-
-    # ── Channel detection ─────────────────────────────────────────────────
-
-    @staticmethod
-    def _detect_channel(
-        daily_prices: Any,
-        lookback: int = 30,
-        max_range_pct: float = 15.0,
-    ) -> Optional[Tuple[float, float]]:
-        """Detect a horizontal price channel (support, resistance).
-
-        Returns:
-            Tuple of (support, resistance) prices, or ``None`` if no
-            valid channel is found.
-
-        A channel is valid when the range (resistance - support) is
-        <= *max_range_pct* of the midpoint.
-        """
-        try:
-            highs = daily_prices["high"].values[-lookback:]
-            lows = daily_prices["low"].values[-lookback:]
-        except (KeyError, AttributeError, IndexError):
-            return None
-
-        if len(highs) < 10:
-            return None
-
-        resistance = float(np.max(highs))
-        support = float(np.min(lows))
-
-        midpoint = (resistance + support) / 2
-        if midpoint <= 0:
-            return None
-
-        range_pct = (resistance - support) / midpoint * 100
-        if range_pct > max_range_pct:
-            return None
-
-        return (support, resistance)
-
-    # ── Bollinger Band squeeze ────────────────────────────────────────────
-
-    @staticmethod
-    def _is_bb_squeeze(
-        indicators: Dict[str, Any],
-        current_price: float,
-        threshold: float = 0.04,
-    ) -> bool:
-        """Check if Bollinger Bands are in a squeeze (low volatility).
-
-        A squeeze occurs when BB width (upper - lower) / price < threshold.
-        """
-        bb_upper = indicators.get("bb_upper", 0)
-        bb_lower = indicators.get("bb_lower", 0)
-
-        if current_price <= 0 or bb_upper <= 0 or bb_lower <= 0:
-            return False
-
-        bb_width_ratio = (bb_upper - bb_lower) / current_price
-        return bb_width_ratio <= threshold
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._stop_mult: float = 1 - self.params["stop_loss_pct"] / 100
+        self._position_pct: float = float(self.params["position_pct"])
+        # Thresholds for the fused channel/squeeze/proximity check
+        self._kernel_params = _fast.RangeParams(
+            lookback=int(self.params["channel_lookback_days"]),
+            max_range_pct=float(self.params["channel_max_range_pct"]),
+            squeeze_threshold=float(self.params["bb_squeeze_threshold"]),
+            support_prox_pct=float(self.params["support_proximity_pct"]),
+            resistance_prox_pct=float(self.params["resistance_proximity_pct"]),
+        )
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_pct"],
+            target_prices_pct=(self.params["target_pct"],),
+        )
 
     # ── Bullish reversal candle ───────────────────────────────────────────
 
     @staticmethod
-    def _is_bullish_reversal(minute_candles: Any) -> bool:
-        """Detect a bullish reversal pattern in recent candles.
+    def _bullish_reversal_batch(last_candles: np.ndarray) -> np.ndarray:
+        """Detect, per row, a bullish reversal in the latest minute candle.
 
-        Simple check: last candle is bullish (close > open) and its body
+        *last_candles* holds one candle per candidate in
+        :data:`OHLCV_COLUMNS` order (NaN rows never qualify).  A row
+        qualifies when the candle is bullish (close > open) and its body
         covers at least 60 % of the candle range (strong close).
         """
-        try:
-            opens = minute_candles["open"].values
-            closes = minute_candles["close"].values
-            highs = minute_candles["high"].values
-            lows = minute_candles["low"].values
-        except (KeyError, AttributeError):
-            return False
-
-        if len(opens) < 1:
-            return False
-
-        o, c, h, l = opens[-1], closes[-1], highs[-1], lows[-1]
-        if c <= o:
-            return False
-
+        o = last_candles[:, COL_OPEN]
+        h = last_candles[:, COL_HIGH]
+        l = last_candles[:, COL_LOW]
+        c = last_candles[:, COL_CLOSE]
         candle_range = h - l
-        if candle_range <= 0:
-            return False
-
-        body_ratio = (c - o) / candle_range
-        return body_ratio >= 0.6
+        return (c > o) & (candle_range > 0) & ((c - o) >= 0.6 * candle_range)
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
@@ -157,16 +115,15 @@ class RangeTradingStrategy(BaseStrategy):
         self, candidates: List[StockCandidate]
     ) -> List[StockCandidate]:
         """Filter to range-bound A-B grade stocks."""
-        filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
-            # Prefer stocks with low trend score (range-bound)
-            if c.trend_score > 50:
-                continue
-            filtered.append(c)
-
-        self.log.info("scan_complete", strategy="B3", matched=len(filtered))
+        # Prefer stocks with low trend score (range-bound)
+        filtered: List[StockCandidate] = [
+            c
+            for c in self._filter_by_grade(candidates, self._grade_mask)
+            if c.trend_score <= 50
+        ]
+
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="B3", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -176,65 +133,82 @@ class RangeTradingStrategy(BaseStrategy):
         stock: StockCandidate,
         market_data: Dict[str, Any],
     ) -> Optional[TradeSignal]:
-        indicators: Dict[str, Any] = market_data.get("indicators", {})
-        daily_prices = market_data.get("daily_prices")
-        minute_candles = market_data.get("minute_candles")
-        current_price: float = market_data["current_price"]
+        signals = await self.generate_signals_batch([stock], [market_data])
+        return signals[0]
 
-        # 1. Detect price channel
-        channel = self._detect_channel(
-            daily_prices,
-            self.params["channel_lookback_days"],
-            self.params["channel_max_range_pct"],
-        )
-        if channel is None:
-            return None
+    async def generate_signals_batch(
+        self,
+        stocks: List[StockCandidate],
+        market_data_batch: List[Dict[str, Any]],
+    ) -> List[Optional[TradeSignal]]:
+        """Evaluate all *stocks*, checking reversal candles in one pass.
+
+        The latest minute candle of every candidate is stacked and tested
+        with :meth:`_bullish_reversal_batch`; the per-stock channel logic
+        then reads its precomputed flag.
+        """
+        n = len(stocks)
+        if n == 0:
+            return []
+
+        last_candles = np.full((n, len(OHLCV_COLUMNS)), np.nan)
+        for i, market_data in enumerate(market_data_batch):
+            prepare_market_data(market_data)
+            if market_data["minute_candles_ok"]:
+                last_candles[i] = market_data["minute_ohlcv"][-1]
+        reversal_ok = self._bullish_reversal_batch(last_candles)
+
+        return [
+            self._evaluate(stock, market_data, bool(reversal))
+            for stock, market_data, reversal in zip(
+                stocks, market_data_batch, reversal_ok.tolist()
+            )
+        ]
+
+    def _evaluate(
+        self,
+        stock: StockCandidate,
+        market_data: Dict[str, Any],
+        reversal_ok: bool,
+    ) -> Optional[TradeSignal]:
+        """Channel / squeeze / proximity logic for one candidate.
 
-        support, resistance = channel
+        The whole decision runs in :func:`_fast.range_decision`; this
+        method only unpacks inputs and builds the signal.
+        """
+        indicators: Dict[str, Any] = market_data.get("indicators", {})
+        daily = prepare_daily_data(market_data)
+        current_price: float = market_data["current_price"]
 
-        # 2. BB squeeze confirmation
-        squeeze = self._is_bb_squeeze(
-            indicators, current_price, self.params["bb_squeeze_threshold"]
+        action, support, resistance, squeeze = _fast.range_decision(
+            daily.high,
+            daily.low,
+            current_price,
+            indicators.get("bb_upper", 0),
+            indicators.get("bb_lower", 0),
+            reversal_ok,
+            self._kernel_params,
         )
-
-        # 3. Price near support (buy zone)
-        if support <= 0:
-            return None
-        distance_to_support_pct = (current_price - support) / support * 100
-        near_support = distance_to_support_pct <= self.params["support_proximity_pct"]
-
-        if not near_support:
-            # Check near resistance for sell signal
-            if resistance > 0:
-                distance_to_resistance_pct = (
-                    (resistance - current_price) / resistance * 100
-                )
-                if distance_to_resistance_pct <= self.params["resistance_proximity_pct"]:
-                    # Sell signal at resistance
-                    return TradeSignal(
-                        stock_code=stock.stock_code,
-                        action="SELL",
-                        strategy_code="B3",
-                        entry_price=current_price,
-                        stop_loss=resistance * 1.02,
-                        target_prices=[support * 1.01],
-                        position_pct=self.params["position_pct"],
-                        confidence=min(stock.confidence, 3),
-                        reason=(
-                            f"레인지 매도: 저항 {resistance:,.0f}원 도달, "
-                            f"채널 [{support:,.0f} ~ {resistance:,.0f}]"
-                        ),
-                        indicators_snapshot=self._capture_snapshot(indicators),
-                    )
+        if action == _fast.RANGE_NONE:
             return None
 
-        # 4. Bullish reversal confirmation at support
-        if not self._is_bullish_reversal(minute_candles):
-            # If BB squeeze is present, lower the bar
-            if not squeeze:
-                return None
-
-        stop_loss = support * (1 - self.params["stop_loss_pct"] / 100)
+        if action == _fast.RANGE_SELL:
+            # Sell signal at resistance
+            return TradeSignal(
+                stock_code=stock.stock_code,
+                action="SELL",
+                strategy_code="B3",
+                entry_price=current_price,
+                stop_loss=resistance * 1.02,
+                target_prices=[support * 1.01],
+                position_pct=self._position_pct,
+                confidence=min(stock.confidence, 3),
+                reason=_SELL_REASON,
+                reason_args={"support": support, "resistance": resistance},
+                indicators_snapshot=self._market_snapshot(market_data),
+            )
+
+        stop_loss = support * self._stop_mult
 
         self.log.info(
             "signal_generated",
@@ -255,22 +229,12 @@ class RangeTradingStrategy(BaseStrategy):
             ],
             position_pct=self._adjust_position(stock.confidence, stock.grade),
             confidence=min(stock.confidence, 3),
-            reason=(
-                f"레인지 매수: 지지 {support:,.0f}원 반등, "
-                f"채널 [{support:,.0f} ~ {resistance:,.0f}]"
-                f"{', BB 스퀴즈' if squeeze else ''}"
-            ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            reason=_BUY_SQUEEZE_REASON if squeeze else _BUY_REASON,
+            reason_args={"support": support, "resistance": resistance},
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_pct"],
-            "target_prices_pct": [self.params["target_pct"]],
-            "trailing_stop": False,
-            "trailing_stop_pct": None,
-            "time_exit": None,
-            "max_holding_hours": None,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
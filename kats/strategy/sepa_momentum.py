@@ -25,15 +25,30 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 import structlog
 
+from kats.strategy import _fast
 from kats.strategy.base_strategy import (
+    CANDIDATE_FIELDS,
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    candidate_arrays,
+    candidate_matrix,
+    grade_mask,
+    prepare_daily_data,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Signal rationale, rendered lazily by TradeSignal.reason
+_REASON_TEMPLATE = "SEPA 모멘텀 돌파: VCP 패턴 완성, 피벗 {pivot:,.0f}원 돌파, 거래량 {vol_ratio:.1f}배"
+
+# Columns of ``candidate_matrix`` holding price, MA50, MA150, MA200
+_MA_CHAIN = slice(
+    CANDIDATE_FIELDS.index("price"), CANDIDATE_FIELDS.index("ma_200") + 1
+)
+
 
 class SEPAMomentumStrategy(BaseStrategy):
     """Minervini SEPA momentum breakout -- trend-following strategy.
@@ -54,83 +69,40 @@ class SEPAMomentumStrategy(BaseStrategy):
             "stop_loss_pct": 7,
             "target_1_pct": 10,
             "target_2_pct": 20,
-            "grade_target": ["B"],
+            "grade_target": frozenset({"B"}),
             "position_pct": 17.5,
         }
-
-    # ── VCP detection ─────────────────────────────────────────────────────
-
-    @staticmethod
-    def _detect_vcp(
-        daily_prices: Any,
-        min_contractions: int = 3,
-    ) -> bool:
-        """Detect Volatility Contraction Pattern in *daily_prices*.
-
-        A VCP is identified by successive swing ranges (high-low within a
-        consolidation) that become progressively tighter.  We require at
-        least *min_contractions* such contractions.
-
-        Args:
-            daily_prices: DataFrame with ``high`` and ``low`` columns,
-                ordered chronologically (oldest first).
-            min_contractions: Minimum number of tightening swings.
-
-        Returns:
-            ``True`` if a valid VCP is detected.
-        """
-        try:
-            highs = daily_prices["high"].values
-            lows = daily_prices["low"].values
-        except (KeyError, AttributeError):
-            return False
-
-        if len(highs) < 40:
-            return False
-
-        # Analyse the last 60 bars (or available) for consolidation
-        window = min(60, len(highs))
-        highs = highs[-window:]
-        lows = lows[-window:]
-
-        # Split into segments and measure each segment's range
-        segment_size = window // (min_contractions + 1)
-        if segment_size < 5:
-            return False
-
-        ranges: List[float] = []
-        for i in range(min_contractions + 1):
-            start = i * segment_size
-            end = start + segment_size
-            seg_range = float(np.max(highs[start:end]) - np.min(lows[start:end]))
-            ranges.append(seg_range)
-
-        # Count how many successive ranges are tighter
-        contractions = 0
-        for i in range(1, len(ranges)):
-            if ranges[i] < ranges[i - 1]:
-                contractions += 1
-
-        return contractions >= min_contractions
-
-    @staticmethod
-    def _calculate_pivot(daily_prices: Any) -> float:
-        """Calculate the pivot (breakout) price from a VCP pattern.
-
-        The pivot is the highest high in the most recent tight consolidation
-        (last 10 bars).
-        """
-        try:
-            recent_highs = daily_prices["high"].values[-10:]
-        except (KeyError, AttributeError, IndexError):
-            return 0.0
-        return float(np.max(recent_highs))
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._eps_min: float = float(self.params["eps_min_growth"])
+        self._revenue_min: float = float(self.params["revenue_min_growth"])
+        self._stop_mult: float = 1 - self.params["stop_loss_pct"] / 100
+        self._target_1_mult: float = 1 + self.params["target_1_pct"] / 100
+        self._target_2_mult: float = 1 + self.params["target_2_pct"] / 100
+        # Thresholds for the fused VCP/pivot/volume/fundamentals check
+        self._kernel_params = _fast.SEPAParams(
+            min_contractions=int(self.params["vcp_contractions"]),
+            pivot_window=10,
+            vol_breakout=float(self.params["volume_breakout_ratio"]),
+            eps_min=self._eps_min,
+            revenue_min=self._revenue_min,
+        )
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_pct"],
+            target_prices_pct=(
+                self.params["target_1_pct"],
+                self.params["target_2_pct"],
+            ),
+            trailing_stop=True,
+            trailing_stop_pct=5.0,
+        )
 
     # ── Minervini Trend Template check ────────────────────────────────────
 
     @staticmethod
-    def _passes_trend_template(stock: StockCandidate) -> bool:
-        """Verify the Minervini Trend Template conditions:
+    def _trend_template_mask(arr: np.ndarray) -> np.ndarray:
+        """Verify the Minervini Trend Template for every row of *arr*
+        (a :func:`candidate_arrays` block):
 
         1. Price > MA50 > MA150 > MA200
         2. MA200 slope is positive (rising for >= 1 month)
@@ -138,23 +110,29 @@ class SEPAMomentumStrategy(BaseStrategy):
         4. Price is within 25 % of 52-week high
         5. RS rank >= 70
         """
-        if not (stock.price > stock.ma_50 > stock.ma_150 > stock.ma_200):
-            return False
-        if stock.ma_200_slope <= 0:
-            return False
-        if stock.week52_low <= 0:
-            return False
-        above_low_pct = (stock.price - stock.week52_low) / stock.week52_low * 100
-        if above_low_pct < 30:
-            return False
-        if stock.week52_high <= 0:
-            return False
-        below_high_pct = (stock.week52_high - stock.price) / stock.week52_high * 100
-        if below_high_pct > 25:
-            return False
-        if stock.rs_rank < 70:
-            return False
-        return True
+        price = arr["price"]
+        low = arr["week52_low"]
+        high = arr["week52_high"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            above_low_pct = (price - low) / low * 100
+            below_high_pct = (high - price) / high * 100
+
+        # Price, MA50, MA150, MA200 are adjacent columns: one (N, 3)
+        # comparison checks the whole chain for every row.
+        chain = candidate_matrix(arr)[:, _MA_CHAIN]
+        monotone = np.all(chain[:, :-1] > chain[:, 1:], axis=1)
+
+        return np.logical_and.reduce(
+            [
+                monotone,
+                arr["ma_200_slope"] > 0,
+                low > 0,
+                above_low_pct >= 30,
+                high > 0,
+                below_high_pct <= 25,
+                arr["rs_rank"] >= 70,
+            ]
+        )
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
@@ -164,19 +142,17 @@ class SEPAMomentumStrategy(BaseStrategy):
         """Filter candidates through Minervini Trend Template + fundamental
         growth criteria.
         """
-        filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
-            if c.eps_growth_qoq < self.params["eps_min_growth"]:
-                continue
-            if c.revenue_growth < self.params["revenue_min_growth"]:
-                continue
-            if not self._passes_trend_template(c):
-                continue
-            filtered.append(c)
-
-        self.log.info("scan_complete", strategy="S1", matched=len(filtered))
+        arr = candidate_arrays(candidates)
+        mask = (
+            self._grade_keep(candidates, self._grade_mask)
+            & (arr["eps_growth_qoq"] >= self._eps_min)
+            & (arr["revenue_growth"] >= self._revenue_min)
+            & self._trend_template_mask(arr)
+        )
+        filtered = [candidates[i] for i in np.flatnonzero(mask).tolist()]
+
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="S1", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -187,37 +163,33 @@ class SEPAMomentumStrategy(BaseStrategy):
         market_data: Dict[str, Any],
     ) -> Optional[TradeSignal]:
         indicators: Dict[str, Any] = market_data.get("indicators", {})
-        daily_prices = market_data.get("daily_prices")
+        daily = prepare_daily_data(market_data)
         current_price: float = market_data["current_price"]
         current_volume: int = market_data.get("current_volume", 0)
 
-        # 1. VCP pattern confirmation
-        if not self._detect_vcp(
-            daily_prices, self.params["vcp_contractions"]
-        ):
-            return None
-
-        # 2. Pivot breakout
-        pivot = self._calculate_pivot(daily_prices)
-        if pivot <= 0 or current_price < pivot:
-            return None
-
-        # 3. Volume confirmation (>= 1.5x average)
         vol_ratio = (
             current_volume / stock.avg_volume_20d
             if stock.avg_volume_20d > 0
             else 0
         )
-        if vol_ratio < self.params["volume_breakout_ratio"]:
-            return None
 
-        # 4. Fundamental re-check (belt & suspenders)
-        if stock.eps_growth_qoq < self.params["eps_min_growth"]:
-            return None
-        if stock.revenue_growth < self.params["revenue_min_growth"]:
+        # VCP, pivot breakout, volume (>= 1.5x average) and fundamental
+        # re-check in one call.  The pivot is streamed by StrategySelector
+        # when available (O(1) per new bar); -1 asks the kernel for it.
+        pivot = _fast.sepa_breakout(
+            daily.high,
+            daily.low,
+            current_price,
+            indicators.get("pivot_high", -1.0),
+            vol_ratio,
+            stock.eps_growth_qoq,
+            stock.revenue_growth,
+            self._kernel_params,
+        )
+        if pivot <= 0:
             return None
 
-        stop_loss = pivot * (1 - self.params["stop_loss_pct"] / 100)
+        stop_loss = pivot * self._stop_mult
 
         self.log.info(
             "signal_generated",
@@ -233,31 +205,18 @@ class SEPAMomentumStrategy(BaseStrategy):
             entry_price=current_price,
             stop_loss=stop_loss,
             target_prices=[
-                current_price * (1 + self.params["target_1_pct"] / 100),
-                current_price * (1 + self.params["target_2_pct"] / 100),
+                current_price * self._target_1_mult,
+                current_price * self._target_2_mult,
                 0,  # trailing stop
             ],
             position_pct=self._adjust_position(stock.confidence, stock.grade),
             confidence=stock.confidence,
-            reason=(
-                f"SEPA 모멘텀 돌파: VCP 패턴 완성, "
-                f"피벗 {pivot:,.0f}원 돌파, "
-                f"거래량 {vol_ratio:.1f}배"
-            ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            reason=_REASON_TEMPLATE,
+            reason_args={"pivot": pivot, "vol_ratio": vol_ratio},
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_pct"],
-            "target_prices_pct": [
-                self.params["target_1_pct"],
-                self.params["target_2_pct"],
-            ],
-            "trailing_stop": True,
-            "trailing_stop_pct": 5.0,
-            "time_exit": None,
-            "max_holding_hours": None,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
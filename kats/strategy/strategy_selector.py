@@ -20,11 +20,22 @@ References:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import structlog
 
-from kats.strategy.base_strategy import BaseStrategy, MarketRegime
+from kats.strategy._fast import RollingMax
+from kats.strategy.base_strategy import (
+    BaseStrategy,
+    MarketRegime,
+    StockCandidate,
+    StreamingBB,
+    prepare_daily_data,
+    scan_cycle,
+)
 from kats.strategy.canslim_breakout import CANSLIMBreakoutStrategy
 from kats.strategy.dead_cat_bounce import DeadCatBounceStrategy
 from kats.strategy.dividend_switching import DividendSwitchingStrategy
@@ -40,6 +51,85 @@ from kats.strategy.volatility_breakout import VolatilityBreakoutStrategy
 
 logger = structlog.get_logger(__name__)
 
+# Daily Bollinger Band window shared by the range / oversold strategies
+BB_PERIOD = 20
+# SEPA pivot: highest high of the most recent tight consolidation
+PIVOT_WINDOW = 10
+
+
+# Bars compared to recognise an undated window as unchanged
+_TAIL_BARS = max(BB_PERIOD, PIVOT_WINDOW)
+
+
+def _bar_dates(daily_prices: Any) -> Optional[np.ndarray]:
+    """Return the ``date`` column of *daily_prices*, or ``None``."""
+    try:
+        dates = np.asarray(daily_prices["date"])
+    except (KeyError, TypeError, ValueError, IndexError):
+        return None
+    return dates if dates.ndim == 1 and dates.size else None
+
+
+@dataclass(slots=True)
+class _DailyIndicatorState:
+    """Streaming daily indicators for one stock, and the newest daily bar
+    they have consumed.
+
+    Dated windows are matched on ``last_date`` plus that bar's
+    ``(close, high)``; undated ones on the last :data:`_TAIL_BARS` closes
+    and highs, which only tells whether anything changed.
+    """
+
+    bb: StreamingBB = field(default_factory=lambda: StreamingBB(BB_PERIOD))
+    pivot_max: RollingMax = field(
+        default_factory=lambda: RollingMax(PIVOT_WINDOW)
+    )
+    last_date: Any = None
+    last_bar: Tuple[float, float] = (0.0, 0.0)
+    tail: bytes = b""
+
+    def resume_at(
+        self,
+        dates: Optional[np.ndarray],
+        closes: np.ndarray,
+        highs: np.ndarray,
+    ) -> int:
+        """Index of the first bar not consumed yet, or ``-1`` when the
+        consumed bars are not in the window as recorded (rebuild).
+        """
+        if dates is None:
+            if self.last_date is None and self.tail == _tail_key(closes, highs):
+                return closes.size
+            return -1
+        if self.last_date is None:
+            return -1
+        hits = np.flatnonzero(dates == self.last_date)
+        if hits.size == 0:
+            return -1
+        i = int(hits[-1])
+        if (float(closes[i]), float(highs[i])) != self.last_bar:
+            return -1
+        return i + 1
+
+    def consumed(
+        self,
+        dates: Optional[np.ndarray],
+        closes: np.ndarray,
+        highs: np.ndarray,
+    ) -> None:
+        """Record the window's newest bar as consumed."""
+        if dates is None:
+            self.last_date = None
+            self.tail = _tail_key(closes, highs)
+        else:
+            self.last_date = dates[-1]
+            self.tail = b""
+        self.last_bar = (float(closes[-1]), float(highs[-1]))
+
+
+def _tail_key(closes: np.ndarray, highs: np.ndarray) -> bytes:
+    return closes[-_TAIL_BARS:].tobytes() + highs[-_TAIL_BARS:].tobytes()
+
 
 class StrategySelector:
     """Regime-aware strategy router.
@@ -51,20 +141,19 @@ class StrategySelector:
 
         selector = StrategySelector()
         regime = selector.detect_regime(kospi_data)
-        strategies = selector.select_strategies(regime)
-        for strategy in strategies:
-            candidates = await strategy.scan(all_candidates)
+        scans = await selector.run_all_scans(regime, all_candidates)
+        for code, candidates in scans.items():
             ...
     """
 
     # ── Regime-to-strategy mapping ────────────────────────────────────────
 
-    STRATEGY_MAP: Dict[MarketRegime, List[str]] = {
-        MarketRegime.STRONG_BULL: ["S1", "S2", "S3", "S4", "S5", "VB", "GR"],
-        MarketRegime.BULL:        ["S1", "S3", "S4", "S5", "VB", "GR"],
-        MarketRegime.SIDEWAYS:    ["S5", "VB", "GR", "B3"],
-        MarketRegime.BEAR:        ["B1", "B2", "B3", "B4", "GR"],
-        MarketRegime.STRONG_BEAR: ["B1", "B2", "B4"],
+    STRATEGY_MAP: Dict[MarketRegime, Tuple[str, ...]] = {
+        MarketRegime.STRONG_BULL: ("S1", "S2", "S3", "S4", "S5", "VB", "GR"),
+        MarketRegime.BULL:        ("S1", "S3", "S4", "S5", "VB", "GR"),
+        MarketRegime.SIDEWAYS:    ("S5", "VB", "GR", "B3"),
+        MarketRegime.BEAR:        ("B1", "B2", "B3", "B4", "GR"),
+        MarketRegime.STRONG_BEAR: ("B1", "B2", "B4"),
     }
 
     def __init__(self) -> None:
@@ -91,6 +180,27 @@ class StrategySelector:
             s.strategy_code: s for s in self.all_strategies
         }
 
+        # Strategy membership as bitmasks over all_strategies positions:
+        # one mask per regime (fixed) and one for the active set.
+        self._strategy_bit: Dict[str, int] = {
+            s.strategy_code: 1 << i for i, s in enumerate(self.all_strategies)
+        }
+        self._regime_mask: Dict[MarketRegime, int] = {
+            regime: self._codes_mask(codes)
+            for regime, codes in self.STRATEGY_MAP.items()
+        }
+        self._active_mask: int = self._codes_mask(
+            s.strategy_code for s in self.all_strategies if s.is_active
+        )
+
+        # Active strategies per regime, rebuilt on (de)activation
+        self._regime_index: Dict[MarketRegime, List[BaseStrategy]] = {}
+        self._rebuild_regime_index()
+
+        # Streaming daily indicators per stock (only newly appended daily
+        # bars are pushed on each refresh)
+        self._daily_cache: Dict[str, _DailyIndicatorState] = {}
+
         self.log.info(
             "initialised",
             total_strategies=len(self.all_strategies),
@@ -169,24 +279,123 @@ class StrategySelector:
         """Return active strategy instances applicable to *regime*.
 
         Strategies that have been deactivated (``is_active == False``) are
-        excluded even if they appear in the regime mapping.
+        excluded even if they appear in the regime mapping.  The returned
+        list is a shared cache entry; callers must not mutate it.
         """
-        codes = self.STRATEGY_MAP.get(regime, [])
-        selected = [
-            s
-            for s in self.all_strategies
-            if s.strategy_code in codes and s.is_active
-        ]
+        selected = self._regime_index.get(regime, [])
 
         self.log.info(
             "strategies_selected",
             regime=regime.value,
-            requested_codes=codes,
+            requested_codes=list(self.STRATEGY_MAP.get(regime, ())),
             active_codes=[s.strategy_code for s in selected],
         )
 
         return selected
 
+    async def run_all_scans(
+        self,
+        regime: MarketRegime,
+        candidates: List[StockCandidate],
+    ) -> Dict[str, List[StockCandidate]]:
+        """Run ``scan()`` of every strategy selected for *regime*.
+
+        The scans are fanned out with :func:`asyncio.gather`, so strategies
+        whose scan awaits I/O overlap, and array-based scans share the one
+        ``candidate_arrays`` conversion made for this cycle.
+
+        Returns:
+            ``{strategy_code: matched candidates}`` in selection order.
+        """
+        strategies = self.select_strategies(regime)
+        with scan_cycle(candidates):
+            results = await asyncio.gather(
+                *(s.scan(candidates) for s in strategies)
+            )
+        return {
+            s.strategy_code: matched for s, matched in zip(strategies, results)
+        }
+
+    def _codes_mask(self, codes: Iterable[str]) -> int:
+        """Return the OR of the selector bits of *codes* (unknown codes
+        contribute nothing).
+        """
+        mask = 0
+        for code in codes:
+            mask |= self._strategy_bit.get(code, 0)
+        return mask
+
+    def _rebuild_regime_index(self) -> None:
+        """Recompute the active strategy list for every regime.
+
+        Each list is the set bits of ``regime mask & active mask``, in
+        ``all_strategies`` order, as selection always has.
+        """
+        strategies = self.all_strategies
+        self._regime_index = {
+            regime: [
+                s
+                for i, s in enumerate(strategies)
+                if (mask & self._active_mask) >> i & 1
+            ]
+            for regime, mask in self._regime_mask.items()
+        }
+
+    # ── Indicator cache ───────────────────────────────────────────────────
+
+    def update_daily_indicators(
+        self, stock_code: str, market_data: Dict[str, Any]
+    ) -> None:
+        """Advance *stock_code*'s streaming daily indicators and publish them.
+
+        Daily bars newer than the last one consumed are pushed into a
+        per-stock :class:`StreamingBB` (closes) and :class:`RollingMax`
+        (highs), O(1) per new bar.  Bars are recognised by their ``date``
+        column, so a fixed-length window that rolls forward still feeds
+        the new day.  When the consumed bar is gone or was revised (or an
+        undated window changed at all), the state is rebuilt from the
+        latest bars.
+
+        ``bb_upper`` / ``bb_lower`` (once the band window is warm) and
+        ``pivot_high`` are published in ``market_data["indicators"]`` only
+        where the data hub did not provide them; the hub's dict, which is
+        shared across ticks, is copied rather than modified.
+        """
+        daily = prepare_daily_data(market_data)
+        size = min(daily.close.size, daily.high.size)
+        if size == 0:
+            return
+        closes = daily.close[-size:]
+        highs = daily.high[-size:]
+        dates = _bar_dates(market_data.get("daily_prices"))
+        if dates is not None and dates.size != daily.close.size:
+            dates = None
+        elif dates is not None:
+            dates = dates[-size:]
+
+        state = self._daily_cache.get(stock_code)
+        start = -1 if state is None else state.resume_at(dates, closes, highs)
+        if start < 0:
+            state = self._daily_cache[stock_code] = _DailyIndicatorState()
+            start = max(size - max(BB_PERIOD, PIVOT_WINDOW), 0)
+
+        for price in closes[max(start, size - BB_PERIOD):].tolist():
+            state.bb.update(price)
+        for high in highs[max(start, size - PIVOT_WINDOW):].tolist():
+            state.pivot_max.push(high)
+        state.consumed(dates, closes, highs)
+
+        computed: Dict[str, float] = {"pivot_high": state.pivot_max.max()}
+        if state.bb.ready:
+            upper, _, lower = state.bb.bands()
+            computed["bb_upper"] = upper
+            computed["bb_lower"] = lower
+
+        indicators = market_data.get("indicators") or {}
+        missing = {k: v for k, v in computed.items() if k not in indicators}
+        if missing:
+            market_data["indicators"] = {**indicators, **missing}
+
     # ── Utility methods ───────────────────────────────────────────────────
 
     def get_strategy(self, code: str) -> Optional[BaseStrategy]:
@@ -203,6 +412,8 @@ class StrategySelector:
             self.log.warning("deactivate_not_found", code=code)
             return False
         strategy.is_active = False
+        self._active_mask &= ~self._strategy_bit[code]
+        self._rebuild_regime_index()
         self.log.info("strategy_deactivated", code=code)
         return True
 
@@ -216,6 +427,8 @@ class StrategySelector:
             self.log.warning("activate_not_found", code=code)
             return False
         strategy.is_active = True
+        self._active_mask |= self._strategy_bit[code]
+        self._rebuild_regime_index()
         self.log.info("strategy_activated", code=code)
         return True
 
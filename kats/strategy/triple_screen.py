@@ -22,6 +22,8 @@ References:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import numpy as np
@@ -29,13 +31,116 @@ import structlog
 
 from kats.strategy.base_strategy import (
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    candidate_arrays,
+    grade_mask,
 )
+from kats.utils._njit import NUMBA_AVAILABLE, njit
 
 logger = structlog.get_logger(__name__)
 
+# Signal rationale, rendered lazily by TradeSignal.reason
+_REASON_TEMPLATE = (
+    "Triple Screen: 주간 상승추세(MACD-H), "
+    "일봉 눌림(FI={force_idx:,.0f}), "
+    "분봉 돌파({buy_stop:,.0f}원)"
+)
+
+
+@lru_cache(maxsize=64)
+def _ema_weights(n: int, period: int) -> np.ndarray:
+    """Return weights *w* such that ``w @ x`` is the final value of an EMA
+    of *period* over the *n* values of *x*, seeded with ``x[0]``.
+
+    ``w[i] = alpha * (1 - alpha) ** (n - 1 - i)`` for ``i >= 1`` and
+    ``w[0] = (1 - alpha) ** (n - 1)``.  The array is read-only because it
+    is shared by every caller with the same ``(n, period)``.
+    """
+    alpha = 2.0 / (period + 1)
+    w = (1 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    w[1:] *= alpha
+    w.flags.writeable = False
+    return w
+
+
+# Folded bars whose closes / volumes must be unchanged to reuse the EMA;
+# older bars weigh (1 - alpha) ** 20 or less in it.
+_FI_TAIL_BARS = 20
+
+
+@dataclass(slots=True)
+class _ForceIndexState:
+    """Force Index EMA folded through one daily bar.
+
+    The bar is found again by its ``date`` when the history has one, else
+    by its index; either way the closes / volumes of the bars ending
+    there (``tail_closes`` / ``tail_volumes``) must be unchanged, so a
+    shifted or revised window is not mistaken for the folded one.
+    """
+
+    period: int
+    bar: int
+    date: Any
+    tail_closes: np.ndarray
+    tail_volumes: np.ndarray
+    ema: float
+
+    def locate(
+        self,
+        dates: Optional[np.ndarray],
+        closes: np.ndarray,
+        volumes: np.ndarray,
+        last: int,
+    ) -> int:
+        """Index of the folded bar within ``[0, last]``, or ``-1``.
+
+        A dated bar is looked for at ``last`` (same day polled again) and
+        ``last - 1`` (one new day) before searching the rest of the
+        window from the end.
+        """
+        if dates is not None:
+            if self.date is None:
+                return -1
+            if dates[last] == self.date:
+                i = last
+            elif last >= 1 and dates[last - 1] == self.date:
+                i = last - 1
+            else:
+                hits = np.flatnonzero(dates[: max(last - 1, 0)] == self.date)
+                if hits.size == 0:
+                    return -1
+                i = int(hits[-1])
+        else:
+            if self.date is not None or self.bar > last:
+                return -1
+            i = self.bar
+        lo = max(i + 1 - _FI_TAIL_BARS, 0)
+        if not (
+            np.array_equal(closes[lo : i + 1], self.tail_closes)
+            and np.array_equal(volumes[lo : i + 1], self.tail_volumes)
+        ):
+            return -1
+        return i
+
+
+@njit(cache=True, fastmath=True)
+def _force_index_kernel(
+    closes: np.ndarray, volumes: np.ndarray, period: int
+) -> float:
+    """Force Index EMA in one pass: each bar's raw force is computed and
+    folded into the EMA (seeded with the first one) without building the
+    series.  Compiled when Numba is installed.
+    """
+    alpha = 2.0 / (period + 1)
+    ema = (closes[1] - closes[0]) * volumes[1]
+    for i in range(2, closes.shape[0]):
+        raw_force = (closes[i] - closes[i - 1]) * volumes[i]
+        ema = alpha * raw_force + (1 - alpha) * ema
+    return ema
+
 
 class TripleScreenStrategy(BaseStrategy):
     """Elder's Triple Screen trend-following strategy.
@@ -61,9 +166,29 @@ class TripleScreenStrategy(BaseStrategy):
             "stop_loss_pct": 5.0,
             "target_1_pct": 8.0,
             "target_2_pct": 15.0,
-            "grade_target": ["A", "B"],
+            "grade_target": frozenset({"A", "B"}),
             "position_pct": 22.5,
         }
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._force_period: int = int(self.params["force_index_period"])
+        self._buy_stop_bars: int = int(self.params["trailing_buy_stop_bars"])
+        self._stop_mult: float = 1 - self.params["stop_loss_pct"] / 100
+        self._target_1_mult: float = 1 + self.params["target_1_pct"] / 100
+        self._target_2_mult: float = 1 + self.params["target_2_pct"] / 100
+        # Reused float64 buffer for the raw Force Index series
+        self._force_scratch: np.ndarray = np.empty(512)
+        # Per-stock incremental Force Index EMA
+        self._fi_state: Dict[str, _ForceIndexState] = {}
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_pct"],
+            target_prices_pct=(
+                self.params["target_1_pct"],
+                self.params["target_2_pct"],
+            ),
+            trailing_stop=True,
+            trailing_stop_pct=4.0,
+        )
 
     # ── Screen 1: Weekly trend via MACD Histogram ─────────────────────────
 
@@ -86,8 +211,11 @@ class TripleScreenStrategy(BaseStrategy):
 
         try:
             if hasattr(macd_h, "__len__") and len(macd_h) >= 2:
-                values = list(macd_h)
-                if values[-1] > values[-2]:
+                # Positional access to the last two bars only (no copy);
+                # pandas Series go through .iloc so a non-range index
+                # cannot be mistaken for labels.
+                values = getattr(macd_h, "iloc", macd_h)
+                if float(values[-1]) > float(values[-2]):
                     return "UP"
                 else:
                     return "DOWN"
@@ -100,13 +228,22 @@ class TripleScreenStrategy(BaseStrategy):
 
     # ── Screen 2: Daily oscillator via Force Index ────────────────────────
 
-    @staticmethod
     def _screen2_force_index(
+        self,
+        stock_code: str,
         daily_prices: Any,
         period: int = 2,
     ) -> Optional[float]:
         """Compute the Force Index (EMA of price-change * volume).
 
+        The EMA through the second-to-last bar is kept per stock, so a
+        call only steps over bars added since the previous one and then
+        applies the latest (possibly still forming) bar: O(1) per tick.
+        The folded bar is found again by its ``date`` (so a rolling
+        window resumes after it) or, for undated history, by position.
+        If it is gone, or the closes / volumes of the bars leading up to
+        it changed, the EMA is recomputed in full.
+
         Returns the latest Force Index value, or ``None``.
         """
         try:
@@ -118,17 +255,71 @@ class TripleScreenStrategy(BaseStrategy):
         if len(closes) < period + 2:
             return None
 
-        # Force = (close - prev_close) * volume
-        price_change = np.diff(closes)
-        raw_force = price_change * volumes[1:]
+        try:
+            dates = np.asarray(daily_prices["date"].values)
+        except (KeyError, AttributeError, TypeError):
+            dates = None
+        if dates is not None and dates.shape != closes.shape:
+            dates = None
 
-        # EMA smoothing
         alpha = 2.0 / (period + 1)
-        ema = raw_force[0]
-        for val in raw_force[1:]:
-            ema = alpha * val + (1 - alpha) * ema
+        last = len(closes) - 2  # last bar folded into the cached EMA
+        state = self._fi_state.get(stock_code)
+        start = -1
+        if state is not None and state.period == period:
+            start = state.locate(dates, closes, volumes, last)
+        if start < 0:
+            ema = self._force_index_full(
+                closes[: last + 1], volumes[: last + 1], period
+            )
+        else:
+            ema = state.ema
+            for i in range(start + 1, last + 1):
+                raw_force = float((closes[i] - closes[i - 1]) * volumes[i])
+                ema = alpha * raw_force + (1 - alpha) * ema
+        if start != last:
+            lo = max(last + 1 - _FI_TAIL_BARS, 0)
+            self._fi_state[stock_code] = _ForceIndexState(
+                period=period,
+                bar=last,
+                date=None if dates is None else dates[last],
+                tail_closes=closes[lo : last + 1].copy(),
+                tail_volumes=volumes[lo : last + 1].copy(),
+                ema=ema,
+            )
+
+        raw_force = float((closes[-1] - closes[-2]) * volumes[-1])
+        return alpha * raw_force + (1 - alpha) * ema
+
+    def _force_index_full(
+        self, closes: np.ndarray, volumes: np.ndarray, period: int
+    ) -> float:
+        """Force Index EMA over the whole of *closes* / *volumes*.
+
+        With Numba this is the fused :func:`_force_index_kernel`;
+        otherwise the raw force series is written into the instance
+        scratch buffer (grown on demand) and smoothed in closed form, so
+        a call allocates no temporaries.
+        """
+        if NUMBA_AVAILABLE:
+            return float(
+                _force_index_kernel(
+                    np.ascontiguousarray(closes, dtype=np.float64),
+                    np.ascontiguousarray(volumes, dtype=np.float64),
+                    period,
+                )
+            )
+
+        # Force = (close - prev_close) * volume
+        n = len(closes) - 1
+        if self._force_scratch.size < n:
+            self._force_scratch = np.empty(max(n, 2 * self._force_scratch.size))
+        raw_force = self._force_scratch[:n]
+        np.subtract(closes[1:], closes[:-1], out=raw_force)
+        np.multiply(raw_force, volumes[1:], out=raw_force)
 
-        return float(ema)
+        # EMA smoothing in closed form as one weighted sum
+        return float(np.dot(_ema_weights(raw_force.size, period), raw_force))
 
     # ── Screen 3: Trailing buy-stop entry ─────────────────────────────────
 
@@ -151,7 +342,8 @@ class TripleScreenStrategy(BaseStrategy):
         if len(highs) < lookback_bars:
             return None
 
-        return float(np.max(highs))
+        # Builtin max over a few bars beats NumPy's reduction setup
+        return float(max(highs.tolist()))
 
     # ── Previous swing low for stop ───────────────────────────────────────
 
@@ -162,7 +354,8 @@ class TripleScreenStrategy(BaseStrategy):
             lows = daily_prices["low"].values[-lookback:]
         except (KeyError, AttributeError, IndexError):
             return 0.0
-        return float(np.min(lows)) if len(lows) > 0 else 0.0
+        # Builtin min: faster than NumPy's reduction at ~20 bars
+        return float(min(lows.tolist())) if len(lows) > 0 else 0.0
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
@@ -170,19 +363,18 @@ class TripleScreenStrategy(BaseStrategy):
         self, candidates: List[StockCandidate]
     ) -> List[StockCandidate]:
         """Filter to A-B grade stocks in an established uptrend."""
-        filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
+        arr = candidate_arrays(candidates)
+        mask = (
+            self._grade_keep(candidates, self._grade_mask)
             # Must be above MA50 (basic uptrend filter)
-            if c.price < c.ma_50:
-                continue
+            & (arr["price"] >= arr["ma_50"])
             # Reasonable RS rank
-            if c.rs_rank < 50:
-                continue
-            filtered.append(c)
+            & (arr["rs_rank"] >= 50)
+        )
+        filtered = [candidates[i] for i in np.flatnonzero(mask).tolist()]
 
-        self.log.info("scan_complete", strategy="S4", matched=len(filtered))
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="S4", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -204,7 +396,7 @@ class TripleScreenStrategy(BaseStrategy):
 
         # Screen 2: Force Index should be negative (pullback in uptrend)
         force_idx = self._screen2_force_index(
-            daily_prices, self.params["force_index_period"]
+            stock.stock_code, daily_prices, self._force_period
         )
         if force_idx is None or force_idx >= 0:
             # Force Index positive means no pullback yet
@@ -212,14 +404,14 @@ class TripleScreenStrategy(BaseStrategy):
 
         # Screen 3: Price must have broken the trailing buy-stop
         buy_stop = self._screen3_trailing_buy_stop(
-            minute_candles, self.params["trailing_buy_stop_bars"]
+            minute_candles, self._buy_stop_bars
         )
         if buy_stop is None or current_price < buy_stop:
             return None
 
         # Stop loss at previous swing low or percentage, whichever is tighter
         swing_low = self._find_swing_low(daily_prices)
-        pct_stop = current_price * (1 - self.params["stop_loss_pct"] / 100)
+        pct_stop = current_price * self._stop_mult
         stop_loss = max(swing_low, pct_stop)
 
         self.log.info(
@@ -237,31 +429,18 @@ class TripleScreenStrategy(BaseStrategy):
             entry_price=current_price,
             stop_loss=stop_loss,
             target_prices=[
-                current_price * (1 + self.params["target_1_pct"] / 100),
-                current_price * (1 + self.params["target_2_pct"] / 100),
+                current_price * self._target_1_mult,
+                current_price * self._target_2_mult,
                 0,  # trailing stop
             ],
             position_pct=self._adjust_position(stock.confidence, stock.grade),
             confidence=stock.confidence,
-            reason=(
-                f"Triple Screen: 주간 상승추세(MACD-H), "
-                f"일봉 눌림(FI={force_idx:,.0f}), "
-                f"분봉 돌파({buy_stop:,.0f}원)"
-            ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            reason=_REASON_TEMPLATE,
+            reason_args={"force_idx": force_idx, "buy_stop": buy_stop},
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_pct"],
-            "target_prices_pct": [
-                self.params["target_1_pct"],
-                self.params["target_2_pct"],
-            ],
-            "trailing_stop": True,
-            "trailing_stop_pct": 4.0,
-            "time_exit": None,
-            "max_holding_hours": None,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
@@ -15,19 +15,30 @@ References:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import structlog
 
 from kats.strategy.base_strategy import (
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    candidate_arrays,
+    grade_mask,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Signal rationale, rendered lazily by TradeSignal.reason
+_REASON_TEMPLATE = (
+    "변동성 돌파: 시가 {today_open:,.0f} + "
+    "전일변동폭 {prev_range:,.0f} x K({k}) = "
+    "목표가 {breakout_price:,.0f}원 돌파"
+)
+
 
 class VolatilityBreakoutStrategy(BaseStrategy):
     """Larry Williams Volatility Breakout -- day-trade strategy.
@@ -54,8 +65,22 @@ class VolatilityBreakoutStrategy(BaseStrategy):
             "min_range_pct": 1.0,
             "stop_loss_pct": 2.0,
             "position_pct": 15.0,
-            "grade_target": ["A", "B"],
+            "grade_target": frozenset({"A", "B"}),
         }
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._min_range_pct: float = float(self.params["min_range_pct"])
+        self._k_factor: float = float(self.params["k_factor"])
+        self._stop_mult: float = 1 - self.params["stop_loss_pct"] / 100
+        # Per-stock (inputs, levels) from _breakout_levels; the inputs are
+        # fixed for the session, so each stock computes its levels once.
+        self._breakout_cache: Dict[
+            str, Tuple[Tuple[float, ...], Optional[Tuple[float, float, float]]]
+        ] = {}
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_pct"],
+            time_exit="MARKET_CLOSE",
+        )
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
@@ -67,16 +92,58 @@ class VolatilityBreakoutStrategy(BaseStrategy):
         liquidity.
         """
         min_turnover = 1_000_000_000  # 10 억 원
-        filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
-            if c.avg_turnover_20d < min_turnover:
-                continue
-            filtered.append(c)
-        self.log.info("scan_complete", strategy="VB", matched=len(filtered))
+        arr = candidate_arrays(candidates)
+        mask = self._grade_keep(candidates, self._grade_mask) & (
+            arr["avg_turnover_20d"] >= min_turnover
+        )
+        filtered = [candidates[i] for i in np.flatnonzero(mask).tolist()]
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="VB", matched=len(filtered))
         return filtered
 
+    # ── Breakout levels ───────────────────────────────────────────────────
+
+    def _breakout_levels(
+        self,
+        stock_code: str,
+        prev_day: Dict[str, float],
+        today_open: float,
+    ) -> Optional[Tuple[float, float, float]]:
+        """Return ``(breakout_price, stop_loss, prev_range)`` for the day,
+        or ``None`` when the previous range is too small to trade.
+
+        The levels depend only on the previous day's bar and today's open,
+        so they are cached per stock and recomputed only when those
+        inputs change (new session or a late ``today_open``).
+        """
+        key = (prev_day["high"], prev_day["low"], prev_day["close"], today_open)
+        cached = self._breakout_cache.get(stock_code)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        prev_high, prev_low, prev_close, _ = key
+        prev_range = prev_high - prev_low
+        levels: Optional[Tuple[float, float, float]] = None
+
+        # Guard: previous range too small (noise)
+        if prev_close > 0:
+            range_pct = (prev_range / prev_close) * 100
+            if range_pct < self._min_range_pct:
+                self.log.debug(
+                    "range_too_small",
+                    stock=stock_code,
+                    range_pct=round(range_pct, 2),
+                )
+            else:
+                levels = (
+                    today_open + prev_range * self._k_factor,
+                    today_open * self._stop_mult,
+                    prev_range,
+                )
+
+        self._breakout_cache[stock_code] = (key, levels)
+        return levels
+
     # ── Signal generation ─────────────────────────────────────────────────
 
     async def generate_signal(
@@ -84,36 +151,19 @@ class VolatilityBreakoutStrategy(BaseStrategy):
         stock: StockCandidate,
         market_data: Dict[str, Any],
     ) -> Optional[TradeSignal]:
-        prev_day = market_data["prev_day"]
-        prev_high: float = prev_day["high"]
-        prev_low: float = prev_day["low"]
-        prev_close: float = prev_day["close"]
-        prev_range: float = prev_high - prev_low
         today_open: float = market_data["today_open"]
         current_price: float = market_data["current_price"]
-        indicators: Dict[str, Any] = market_data.get("indicators", {})
 
-        # Guard: previous range too small (noise)
-        if prev_close <= 0:
-            return None
-        range_pct = (prev_range / prev_close) * 100
-        if range_pct < self.params["min_range_pct"]:
-            self.log.debug(
-                "range_too_small",
-                stock=stock.stock_code,
-                range_pct=round(range_pct, 2),
-            )
+        levels = self._breakout_levels(
+            stock.stock_code, market_data["prev_day"], today_open
+        )
+        if levels is None:
             return None
-
-        # Calculate breakout threshold
-        k = self.params["k_factor"]
-        breakout_price = today_open + prev_range * k
+        breakout_price, stop_loss, prev_range = levels
 
         if current_price < breakout_price:
             return None
 
-        stop_loss = today_open * (1 - self.params["stop_loss_pct"] / 100)
-
         self.log.info(
             "signal_generated",
             stock=stock.stock_code,
@@ -130,22 +180,17 @@ class VolatilityBreakoutStrategy(BaseStrategy):
             target_prices=[0],  # 0 means exit at market close
             position_pct=self._adjust_position(stock.confidence, stock.grade),
             confidence=stock.confidence,
-            reason=(
-                f"변동성 돌파: 시가 {today_open:,.0f} + "
-                f"전일변동폭 {prev_range:,.0f} x K({k}) = "
-                f"목표가 {breakout_price:,.0f}원 돌파"
-            ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            reason=_REASON_TEMPLATE,
+            reason_args={
+                "today_open": today_open,
+                "prev_range": prev_range,
+                "k": self._k_factor,
+                "breakout_price": breakout_price,
+            },
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_pct"],
-            "target_prices_pct": [],
-            "trailing_stop": False,
-            "trailing_stop_pct": None,
-            "time_exit": "MARKET_CLOSE",
-            "max_holding_hours": None,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
@@ -26,16 +26,30 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 import structlog
+from numpy.lib.stride_tricks import sliding_window_view
 
 from kats.strategy.base_strategy import (
+    COL_CLOSE,
+    COL_LOW,
+    COL_OPEN,
     BaseStrategy,
+    ExitRules,
     StockCandidate,
     StrategyCategory,
     TradeSignal,
+    candidate_arrays,
+    grade_mask,
+    prepare_market_data,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Signal rationale, rendered lazily by TradeSignal.reason
+_REASON_TEMPLATE = (
+    "VWAP 바운스: VWAP {vwap:,.0f}원 지지 확인, "
+    "거리 {distance_pct:.2f}%, 반등 캔들 확인"
+)
+
 
 class VWAPBounceStrategy(BaseStrategy):
     """VWAP bounce institutional support strategy.
@@ -55,48 +69,60 @@ class VWAPBounceStrategy(BaseStrategy):
             "stop_loss_buffer_pct": 0.5,
             "target_1_pct": 5.0,
             "target_2_pct": 10.0,
-            "grade_target": ["A"],
+            "grade_target": frozenset({"A"}),
             "position_pct": 25.0,
         }
+        self._grade_mask: int = grade_mask(self.params["grade_target"])
+        # Hot-path constants derived once from params (fixed at runtime)
+        self._vwap_prox: float = float(self.params["vwap_proximity_pct"])
+        self._bounce_candles: int = int(self.params["bounce_candles"])
+        self._stop_mult: float = 1 - self.params["stop_loss_buffer_pct"] / 100
+        self._target_1_mult: float = 1 + self.params["target_1_pct"] / 100
+        self._target_2_mult: float = 1 + self.params["target_2_pct"] / 100
+        self._exit_rules: ExitRules = ExitRules(
+            stop_loss_pct=self.params["stop_loss_buffer_pct"],
+            target_prices_pct=(
+                self.params["target_1_pct"],
+                self.params["target_2_pct"],
+            ),
+            trailing_stop=True,
+            trailing_stop_pct=3.0,
+        )
 
     # ── Bounce confirmation ───────────────────────────────────────────────
 
     @staticmethod
     def _confirm_bounce(
-        minute_candles: Any,
+        minute_ohlcv: np.ndarray,
         vwap: float,
         required_candles: int = 2,
     ) -> bool:
         """Confirm that at least *required_candles* consecutive candles have
         bounced off VWAP (close > open, low near VWAP).
 
+        *minute_ohlcv* is the ``(n, 5)`` block cached by
+        :func:`prepare_market_data`; the three columns are read as views
+        of it, with no per-column pandas lookup.
+
         A bounce candle:
             * close > open (bullish)
             * low is within 1 % of VWAP (tested VWAP support)
         """
-        try:
-            opens = minute_candles["open"].values
-            closes = minute_candles["close"].values
-            lows = minute_candles["low"].values
-        except (KeyError, AttributeError):
-            return False
+        opens = minute_ohlcv[:, COL_OPEN]
+        closes = minute_ohlcv[:, COL_CLOSE]
+        lows = minute_ohlcv[:, COL_LOW]
 
-        if len(opens) < required_candles:
+        if vwap <= 0 or len(opens) < required_candles:
             return False
 
-        # Check the last N candles
-        consecutive = 0
-        for i in range(len(opens) - 1, max(len(opens) - required_candles - 3, -1), -1):
-            is_bullish = closes[i] > opens[i]
-            low_near_vwap = abs(lows[i] - vwap) / vwap * 100 <= 1.0 if vwap > 0 else False
-            if is_bullish and low_near_vwap:
-                consecutive += 1
-            else:
-                consecutive = 0
-            if consecutive >= required_candles:
-                return True
+        # Only the last required_candles + 2 candles are considered
+        tail = slice(-(required_candles + 2), None)
+        bounce = (closes[tail] > opens[tail]) & (
+            np.abs(lows[tail] - vwap) / vwap * 100 <= 1.0
+        )
 
-        return False
+        # Any window of required_candles consecutive bounce candles
+        return bool(sliding_window_view(bounce, required_candles).all(axis=1).any())
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
@@ -105,18 +131,17 @@ class VWAPBounceStrategy(BaseStrategy):
     ) -> List[StockCandidate]:
         """Select A-grade large-caps with strong institutional interest."""
         min_turnover = 2_000_000_000  # 20 억 원
-        filtered: List[StockCandidate] = []
-        for c in candidates:
-            if c.grade not in self.params["grade_target"]:
-                continue
-            if c.avg_turnover_20d < min_turnover:
-                continue
+        arr = candidate_arrays(candidates)
+        mask = (
+            self._grade_keep(candidates, self._grade_mask)
+            & (arr["avg_turnover_20d"] >= min_turnover)
             # Institutional flow must be net positive
-            if c.inst_foreign_flow <= 0:
-                continue
-            filtered.append(c)
+            & (arr["inst_foreign_flow"] > 0)
+        )
+        filtered = [candidates[i] for i in np.flatnonzero(mask).tolist()]
 
-        self.log.info("scan_complete", strategy="S5", matched=len(filtered))
+        if self._info_enabled:
+            self.log.info("scan_complete", strategy="S5", matched=len(filtered))
         return filtered
 
     # ── Signal generation ─────────────────────────────────────────────────
@@ -127,7 +152,6 @@ class VWAPBounceStrategy(BaseStrategy):
         market_data: Dict[str, Any],
     ) -> Optional[TradeSignal]:
         indicators: Dict[str, Any] = market_data.get("indicators", {})
-        minute_candles = market_data.get("minute_candles")
         current_price: float = market_data["current_price"]
         vwap: float = indicators.get("vwap", 0)
 
@@ -140,17 +164,18 @@ class VWAPBounceStrategy(BaseStrategy):
 
         # 2. Price within proximity of VWAP (pullback zone)
         distance_pct = (current_price - vwap) / vwap * 100
-        if distance_pct > self.params["vwap_proximity_pct"]:
+        if distance_pct > self._vwap_prox:
             return None
 
         # 3. Bounce candle confirmation
-        if not self._confirm_bounce(
-            minute_candles, vwap, self.params["bounce_candles"]
+        prepare_market_data(market_data)
+        if not market_data["minute_candles_ok"] or not self._confirm_bounce(
+            market_data["minute_ohlcv"], vwap, self._bounce_candles
         ):
             return None
 
         # Stop just below VWAP
-        stop_loss = vwap * (1 - self.params["stop_loss_buffer_pct"] / 100)
+        stop_loss = vwap * self._stop_mult
 
         self.log.info(
             "signal_generated",
@@ -166,30 +191,18 @@ class VWAPBounceStrategy(BaseStrategy):
             entry_price=current_price,
             stop_loss=stop_loss,
             target_prices=[
-                current_price * (1 + self.params["target_1_pct"] / 100),
-                current_price * (1 + self.params["target_2_pct"] / 100),
+                current_price * self._target_1_mult,
+                current_price * self._target_2_mult,
                 0,  # trailing stop
             ],
             position_pct=self._adjust_position(stock.confidence, stock.grade),
             confidence=stock.confidence,
-            reason=(
-                f"VWAP 바운스: VWAP {vwap:,.0f}원 지지 확인, "
-                f"거리 {distance_pct:.2f}%, 반등 캔들 확인"
-            ),
-            indicators_snapshot=self._capture_snapshot(indicators),
+            reason=_REASON_TEMPLATE,
+            reason_args={"vwap": vwap, "distance_pct": distance_pct},
+            indicators_snapshot=self._market_snapshot(market_data),
         )
 
     # ── Exit rules ────────────────────────────────────────────────────────
 
-    def get_exit_rules(self) -> Dict[str, Any]:
-        return {
-            "stop_loss_pct": self.params["stop_loss_buffer_pct"],
-            "target_prices_pct": [
-                self.params["target_1_pct"],
-                self.params["target_2_pct"],
-            ],
-            "trailing_stop": True,
-            "trailing_stop_pct": 3.0,
-            "time_exit": None,
-            "max_holding_hours": None,
-        }
+    def get_exit_rules(self) -> ExitRules:
+        return self._exit_rules
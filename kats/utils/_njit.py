@@ -0,0 +1,46 @@
+"""
+KATS optional Numba JIT shim
+
+Exposes :func:`njit`, which is ``numba.njit`` when Numba is installed and a
+no-op decorator otherwise, so numeric kernels can be written once and still
+run (as plain Python) without the optional dependency.
+
+Usage:
+    from kats.utils._njit import NUMBA_AVAILABLE, njit
+
+    @njit(cache=True, fastmath=True)
+    def kernel(values):
+        ...
+
+Callers that have a vectorised NumPy equivalent should check
+:data:`NUMBA_AVAILABLE` and prefer that path when the kernel would run
+interpreted.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """``numba.njit`` if available, else an identity decorator.
+
+    Supports both ``@njit`` and ``@njit(cache=True, ...)`` forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
@@ -14,17 +14,36 @@ Usage:
     calendar = EventCalendar(repository)
     events = await calendar.get_upcoming_events(days_ahead=3)
     impact = await calendar.check_event_impact(date.today())
+    window = await calendar.get_impact_window(days_ahead=7)
+    calendar.start_background_refresh()   # keep the next 7 days in memory
     if await calendar.is_special_event_day(date.today()):
         ...  # reduce position sizes
 """
 
 from __future__ import annotations
 
-from datetime import date, timedelta
+import asyncio
+import contextlib
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
 from enum import Enum, unique
-from typing import Any, Dict, List, Optional
-
-from kats.utils.logger import get_logger
+from operator import attrgetter
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from kats.utils.logger import get_logger, log_throttled
 
 logger = get_logger(__name__)
 
@@ -49,38 +68,99 @@ class EventType(str, Enum):
 # Impact Defaults by Event Type
 # ============================================================================
 
-_DEFAULT_IMPACT: Dict[str, Dict[str, Any]] = {
-    EventType.OPTION_EXPIRY: {
-        "cash_adjust_pct": 20.0,
-        "trading_action": "REDUCE",
-        "description": "옵션 만기일 -- 변동성 증가 대비 포지션 축소",
-    },
-    EventType.FOMC: {
-        "cash_adjust_pct": 30.0,
-        "trading_action": "REDUCE",
-        "description": "FOMC 금리 결정 -- 시장 방향성 불확실, 현금 비중 확대",
-    },
-    EventType.EARNINGS: {
-        "cash_adjust_pct": 10.0,
-        "trading_action": "NORMAL",
-        "description": "실적 발표 -- 해당 종목 신규 진입 회피",
-    },
-    EventType.BOK: {
-        "cash_adjust_pct": 20.0,
-        "trading_action": "REDUCE",
-        "description": "한은 금통위 -- 금리 결정에 따른 변동성 대비",
-    },
-    EventType.MSCI: {
-        "cash_adjust_pct": 15.0,
-        "trading_action": "REDUCE",
-        "description": "MSCI 리밸런싱 -- 수급 변동 대비 주의",
-    },
-    EventType.SHORT_SELL: {
-        "cash_adjust_pct": 10.0,
-        "trading_action": "NORMAL",
-        "description": "공매도 관련 이벤트 -- 수급 변동 모니터링",
-    },
-}
+class ImpactRow(NamedTuple):
+    """Default cash adjustment, action and rationale for one event type."""
+
+    cash_adjust_pct: float
+    trading_action: str
+    description: str
+
+
+# Read-only; ``EventType`` is a ``str`` enum, so plain strings from the
+# database look up the same rows.
+_DEFAULT_IMPACT: Mapping[str, ImpactRow] = MappingProxyType({
+    EventType.OPTION_EXPIRY: ImpactRow(
+        cash_adjust_pct=20.0,
+        trading_action="REDUCE",
+        description="옵션 만기일 -- 변동성 증가 대비 포지션 축소",
+    ),
+    EventType.FOMC: ImpactRow(
+        cash_adjust_pct=30.0,
+        trading_action="REDUCE",
+        description="FOMC 금리 결정 -- 시장 방향성 불확실, 현금 비중 확대",
+    ),
+    EventType.EARNINGS: ImpactRow(
+        cash_adjust_pct=10.0,
+        trading_action="NORMAL",
+        description="실적 발표 -- 해당 종목 신규 진입 회피",
+    ),
+    EventType.BOK: ImpactRow(
+        cash_adjust_pct=20.0,
+        trading_action="REDUCE",
+        description="한은 금통위 -- 금리 결정에 따른 변동성 대비",
+    ),
+    EventType.MSCI: ImpactRow(
+        cash_adjust_pct=15.0,
+        trading_action="REDUCE",
+        description="MSCI 리밸런싱 -- 수급 변동 대비 주의",
+    ),
+    EventType.SHORT_SELL: ImpactRow(
+        cash_adjust_pct=10.0,
+        trading_action="NORMAL",
+        description="공매도 관련 이벤트 -- 수급 변동 모니터링",
+    ),
+})
+
+# Rationale per event type, flattened for check_event_impact's loop
+_DEFAULT_DESC: Mapping[str, str] = MappingProxyType(
+    {event_type: row.description for event_type, row in _DEFAULT_IMPACT.items()}
+)
+
+# Defaults for event types without a row in _DEFAULT_IMPACT
+_NO_IMPACT = ImpactRow(cash_adjust_pct=0.0, trading_action="NORMAL", description="")
+
+# ORM event fields read by ``EventCalendar._event_to_dict`` in one C call
+_EVENT_ATTRS = attrgetter(
+    "event_id",
+    "event_date",
+    "event_type",
+    "event_name",
+    "market_impact",
+    "trading_action",
+    "cash_adjust_pct",
+    "is_active",
+)
+
+# How long a ``get_events_by_date`` result is reused for the same date
+_BY_DATE_TTL_SEC = 60.0
+
+# Background prefetch defaults (see ``EventCalendar.start_background_refresh``)
+_REFRESH_WINDOW_DAYS = 7
+_REFRESH_INTERVAL_SEC = 300.0
+
+# Cache misses arriving within this window share one repository round trip
+_COALESCE_WINDOW_SEC = 0.005
+
+# Prebuilt look-ahead windows for the common ``days_ahead`` values
+_TIMEDELTA_CACHE: Mapping[int, timedelta] = MappingProxyType(
+    {n: timedelta(days=n) for n in (1, 3, 7, 14, 30)}
+)
+
+# _cached_today: [monotonic time at which the date rolls over, local date]
+_TODAY_STATE: list = [float("-inf"), None]
+
+
+def _cached_today() -> date:
+    """``date.today()``, recomputed only once the local day has rolled over."""
+    now = time.monotonic()
+    if now >= _TODAY_STATE[0]:
+        current = datetime.now()
+        midnight = datetime.combine(
+            current.date() + _TIMEDELTA_CACHE[1], datetime.min.time()
+        )
+        _TODAY_STATE[0] = now + (midnight - current).total_seconds()
+        _TODAY_STATE[1] = current.date()
+    return _TODAY_STATE[1]
 
 
 # ============================================================================
@@ -97,8 +177,14 @@ class EventCalendar:
 
         - ``get_events_in_range(start_date, end_date) -> list``
         - ``get_events_by_date(target_date) -> list``
+        - ``exists_high_impact(target_date) -> bool``
         - ``add_event(event_data) -> event``
 
+        and optionally ``get_events_by_dates(dates) -> list`` and
+        ``get_events_grouped_by_date(start_date, end_date) -> dict``,
+        used to fetch several dates in one round trip (otherwise the
+        per-date / ranged queries above are used).
+
         Each event object/dict should have at minimum: ``event_date``,
         ``event_type``, ``event_name``, ``market_impact``,
         ``trading_action``, ``cash_adjust_pct``.
@@ -106,6 +192,15 @@ class EventCalendar:
 
     def __init__(self, repository: Any) -> None:
         self._repo = repository
+        # target_date -> (monotonic expiry time, events); see
+        # _cached_get_events_by_date and start_background_refresh
+        self._by_date_cache: Dict[date, Tuple[float, List[Any]]] = {}
+        # Dates waiting for the next batched fetch, the future every caller
+        # for that date awaits, and the task that will run the fetch
+        self._pending_dates: Deque[date] = deque()
+        self._inflight: Dict[date, asyncio.Future] = {}
+        self._coalescer: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
 
     # ── Query Methods ────────────────────────────────────────────────────
 
@@ -121,28 +216,46 @@ class EventCalendar:
         Returns:
             A list of event dictionaries sorted by date ascending.
         """
-        today = date.today()
-        end_date = today + timedelta(days=days_ahead)
+        events = await self._fetch_upcoming(days_ahead)
 
-        try:
-            events = await self._repo.get_events_in_range(today, end_date)
-        except Exception:
-            logger.exception(
-                "event_calendar_query_failed",
-                start=str(today),
-                end=str(end_date),
-            )
-            return []
+        # Repositories return one record type, so check it once per batch
+        if events and isinstance(events[0], dict):
+            result = list(events)
+        else:
+            result = [self._event_to_dict(e) for e in events]
 
-        result = [self._event_to_dict(e) for e in events]
-
-        logger.info(
+        log_throttled(
+            logger,
             "upcoming_events_fetched",
             days_ahead=days_ahead,
             count=len(result),
         )
         return result
 
+    async def iter_upcoming_events(
+        self,
+        days_ahead: int = 3,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the events of :meth:`get_upcoming_events` one at a time.
+
+        Each event is converted to a dict only when the consumer asks for
+        it, so ``async for ...: break`` stops after the first one.
+
+        Args:
+            days_ahead: Look-ahead window in calendar days (default 3).
+
+        Yields:
+            Event dictionaries in date order.
+        """
+        events = await self._fetch_upcoming(days_ahead)
+        if not events:
+            return
+
+        # Repositories return one record type, so check it once per batch
+        as_dicts = isinstance(events[0], dict)
+        for e in events:
+            yield e if as_dicts else self._event_to_dict(e)
+
     async def check_event_impact(
         self,
         target_date: date,
@@ -166,7 +279,7 @@ class EventCalendar:
             - ``description`` (str) -- combined rationale
         """
         try:
-            events = await self._repo.get_events_by_date(target_date)
+            events = await self._cached_get_events_by_date(target_date)
         except Exception:
             logger.exception(
                 "event_impact_query_failed",
@@ -180,57 +293,34 @@ class EventCalendar:
                 "description": "",
             }
 
-        if not events:
-            return {
-                "has_events": False,
-                "events": [],
-                "cash_adjust_pct": 0.0,
-                "trading_action": "NORMAL",
-                "description": "해당 일자에 특이 이벤트가 없습니다.",
-            }
-
-        event_dicts = [self._event_to_dict(e) for e in events]
+        return self._assess_impact(target_date, events)
 
-        # Aggregate: take the maximum cash adjustment
-        max_cash_pct: float = 0.0
-        actions: list[str] = []
-        descriptions: list[str] = []
+    async def get_impact_window(
+        self,
+        days_ahead: int = 3,
+    ) -> Dict[date, Dict[str, Any]]:
+        """Assess every day from today through ``days_ahead`` days ahead.
 
-        for ed in event_dicts:
-            cash_pct = ed.get("cash_adjust_pct") or 0.0
-            if cash_pct > max_cash_pct:
-                max_cash_pct = cash_pct
+        One grouped repository query covers the whole window, instead of
+        a :meth:`check_event_impact` round trip per day.  The per-day
+        results also seed the by-date cache, so follow-up
+        :meth:`check_event_impact` / :meth:`is_special_event_day` calls for
+        these dates need no query.
 
-            action = ed.get("trading_action", "NORMAL")
-            actions.append(action)
-
-            event_type = ed.get("event_type", "")
-            default = _DEFAULT_IMPACT.get(event_type, {})
-            desc = default.get("description", ed.get("event_name", ""))
-            descriptions.append(desc)
-
-        # Most restrictive action: HALT > REDUCE > NORMAL
-        action_priority = {"HALT": 3, "REDUCE": 2, "NORMAL": 1}
-        final_action = max(
-            actions,
-            key=lambda a: action_priority.get(a, 0),
-        )
+        Args:
+            days_ahead: Look-ahead window in calendar days (default 3).
 
-        logger.info(
-            "event_impact_assessed",
-            date=str(target_date),
-            event_count=len(event_dicts),
-            cash_adjust_pct=max_cash_pct,
-            trading_action=final_action,
-        )
+        Returns:
+            ``{date: impact}`` for each day in the window (days without
+            events included), each shaped like :meth:`check_event_impact`.
+        """
+        try:
+            window = await self._load_window(days_ahead, _BY_DATE_TTL_SEC)
+        except Exception:
+            logger.exception("event_window_query_failed", days_ahead=days_ahead)
+            return {}
 
-        return {
-            "has_events": True,
-            "events": event_dicts,
-            "cash_adjust_pct": max_cash_pct,
-            "trading_action": final_action,
-            "description": " | ".join(descriptions),
-        }
+        return {day: self._assess_impact(day, events) for day, events in window.items()}
 
     async def is_special_event_day(self, target_date: date) -> bool:
         """Check whether the given date has any high-impact events.
@@ -239,26 +329,91 @@ class EventCalendar:
         event with ``market_impact == "HIGH"`` or ``trading_action`` in
         ``{"HALT", "REDUCE"}``.
 
+        Never goes through :meth:`check_event_impact`: events already
+        cached for the date are scanned in place (stopping at the first
+        match); otherwise the repository's ``exists_high_impact`` query
+        answers without fetching rows, falling back to the cached
+        by-date fetch for repositories that lack it.
+
         Args:
             target_date: The date to check.
 
         Returns:
             ``True`` if the date has high-impact events.
         """
-        impact = await self.check_event_impact(target_date)
+        cached = self._cached_events(target_date)
+        if cached is not None:
+            return self._any_high_impact(cached)
 
-        if not impact["has_events"]:
+        try:
+            exists_high_impact = getattr(self._repo, "exists_high_impact", None)
+            if exists_high_impact is not None:
+                return bool(await exists_high_impact(target_date))
+            events = await self._cached_get_events_by_date(target_date)
+            return self._any_high_impact(events)
+        except Exception:
+            logger.exception(
+                "event_special_day_query_failed",
+                date=str(target_date),
+            )
             return False
 
-        # Check for high-impact markers
-        if impact["trading_action"] in ("HALT", "REDUCE"):
-            return True
+    # ── Background Prefetch ──────────────────────────────────────────────
 
-        for event in impact["events"]:
-            if event.get("market_impact") == "HIGH":
-                return True
+    def start_background_refresh(
+        self,
+        window_days: int = _REFRESH_WINDOW_DAYS,
+        interval: float = _REFRESH_INTERVAL_SEC,
+    ) -> None:
+        """Keep the next ``window_days`` days' events cached in memory.
 
-        return False
+        Starts a task on the running loop that reloads the window with one
+        grouped query every *interval* seconds.  Entries it writes stay
+        valid until the following reload, so per-tick
+        :meth:`check_event_impact` / :meth:`is_special_event_day` calls
+        for dates in the window never reach the database.  Dates outside
+        the window, and failed reloads, fall back to the on-demand cache.
+
+        Calling it again while the task is running is a no-op.
+
+        Args:
+            window_days: Days ahead of today to keep loaded (default 7).
+            interval: Seconds between reloads (default 300).
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh_loop(window_days, interval)
+        )
+        logger.info(
+            "event_refresh_started",
+            window_days=window_days,
+            interval=interval,
+        )
+
+    async def stop_background_refresh(self) -> None:
+        """Cancel the task started by :meth:`start_background_refresh`."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        logger.info("event_refresh_stopped")
+
+    async def _refresh_loop(self, window_days: int, interval: float) -> None:
+        """Reload the event window every *interval* seconds until cancelled."""
+        # Outlive the next reload so the window never goes cold between them
+        ttl = interval + _BY_DATE_TTL_SEC
+        while True:
+            try:
+                await self._load_window(window_days, ttl)
+            except Exception:
+                logger.exception(
+                    "event_refresh_failed",
+                    window_days=window_days,
+                )
+            await asyncio.sleep(interval)
 
     # ── Mutation ─────────────────────────────────────────────────────────
 
@@ -287,17 +442,10 @@ class EventCalendar:
         event_type = event_data.get("event_type", "")
 
         # Apply defaults for optional fields
-        defaults = _DEFAULT_IMPACT.get(event_type, {})
-        if "market_impact" not in event_data:
-            event_data["market_impact"] = "MEDIUM"
-        if "trading_action" not in event_data:
-            event_data["trading_action"] = defaults.get(
-                "trading_action", "NORMAL"
-            )
-        if "cash_adjust_pct" not in event_data:
-            event_data["cash_adjust_pct"] = defaults.get(
-                "cash_adjust_pct", 0.0
-            )
+        defaults = _DEFAULT_IMPACT.get(event_type, _NO_IMPACT)
+        event_data.setdefault("market_impact", "MEDIUM")
+        event_data.setdefault("trading_action", defaults.trading_action)
+        event_data.setdefault("cash_adjust_pct", defaults.cash_adjust_pct)
 
         # Ensure event_date is a date object
         raw_date = event_data.get("event_date")
@@ -306,6 +454,7 @@ class EventCalendar:
 
         try:
             saved = await self._repo.add_event(event_data)
+            self._by_date_cache.pop(event_data.get("event_date"), None)
             result = self._event_to_dict(saved)
             logger.info(
                 "event_added",
@@ -323,15 +472,292 @@ class EventCalendar:
 
     # ── Helpers ──────────────────────────────────────────────────────────
 
+    def _assess_impact(
+        self,
+        target_date: date,
+        events: Sequence[Any],
+    ) -> Dict[str, Any]:
+        """Aggregate one day's *events* into a :meth:`check_event_impact`
+        result.
+        """
+        if not events:
+            return {
+                "has_events": False,
+                "events": [],
+                "cash_adjust_pct": 0.0,
+                "trading_action": "NORMAL",
+                "description": "해당 일자에 특이 이벤트가 없습니다.",
+            }
+
+        # Convert and aggregate in one pass: the maximum cash adjustment,
+        # the most restrictive action and one rationale per event
+        event_dicts: list[Dict[str, Any]] = []
+        max_cash_pct: float = 0.0
+        # Most restrictive action wins: HALT > REDUCE > NORMAL > unknown;
+        # ties keep the first event's action.
+        final_action: Optional[str] = "NORMAL"
+        best_priority = -1
+        descriptions: list[str] = []
+
+        # Repositories return one record type, so check it once per batch
+        as_dicts = isinstance(events[0], dict)
+
+        for e in events:
+            ed = e if as_dicts else self._event_to_dict(e)
+            event_dicts.append(ed)
+
+            cash_pct = ed.get("cash_adjust_pct") or 0.0
+            if cash_pct > max_cash_pct:
+                max_cash_pct = cash_pct
+
+            action = ed.get("trading_action", "NORMAL")
+            priority = (
+                3 if action == "HALT"
+                else 2 if action == "REDUCE"
+                else 1 if action == "NORMAL"
+                else 0
+            )
+            if priority > best_priority:
+                best_priority = priority
+                final_action = action
+
+            descriptions.append(
+                _DEFAULT_DESC.get(ed.get("event_type", ""))
+                or ed.get("event_name")
+                or ""
+            )
+
+        log_throttled(
+            logger,
+            "event_impact_assessed",
+            date=str(target_date),
+            event_count=len(event_dicts),
+            cash_adjust_pct=max_cash_pct,
+            trading_action=final_action,
+        )
+
+        return {
+            "has_events": True,
+            "events": event_dicts,
+            "cash_adjust_pct": max_cash_pct,
+            "trading_action": final_action,
+            "description": " | ".join(descriptions),
+        }
+
+    async def _fetch_upcoming(self, days_ahead: int) -> Sequence[Any]:
+        """Return the repository's events from today through ``days_ahead``
+        days ahead (empty, after logging, if the query fails).
+        """
+        today = _cached_today()
+        end_date = today + (
+            _TIMEDELTA_CACHE.get(days_ahead) or timedelta(days=days_ahead)
+        )
+
+        try:
+            return await self._repo.get_events_in_range(today, end_date)
+        except Exception:
+            logger.exception(
+                "event_calendar_query_failed",
+                start=str(today),
+                end=str(end_date),
+            )
+            return []
+
+    def _cached_events(self, target_date: date) -> Optional[List[Any]]:
+        """Return the unexpired cached events for *target_date*, if any."""
+        cached = self._by_date_cache.get(target_date)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        return None
+
+    async def _load_window(
+        self,
+        days_ahead: int,
+        ttl: float,
+    ) -> Dict[date, List[Any]]:
+        """Fetch today through ``days_ahead`` days ahead in one grouped
+        query and cache every day's events for *ttl* seconds.
+
+        Returns:
+            ``{date: events}`` for each day in the window, in date order
+            (days without events map to an empty list).
+        """
+        today = _cached_today()
+        end_date = today + (
+            _TIMEDELTA_CACHE.get(days_ahead) or timedelta(days=days_ahead)
+        )
+        grouped = await self._get_events_grouped_by_date(today, end_date)
+
+        expires_at = time.monotonic() + ttl
+        one_day = _TIMEDELTA_CACHE[1]
+        window: Dict[date, List[Any]] = {}
+        day = today
+        while day <= end_date:
+            events = grouped.get(day, [])
+            self._by_date_cache[day] = (expires_at, events)
+            window[day] = events
+            day += one_day
+        return window
+
+    async def _cached_get_events_by_date(self, target_date: date) -> List[Any]:
+        """``repo.get_events_by_date`` memoised per date for
+        ``_BY_DATE_TTL_SEC`` seconds.
+
+        Per-tick callers ask about the same date over and over.  Misses
+        are coalesced: concurrent callers for one date share a future, and
+        every date missed within ``_COALESCE_WINDOW_SEC`` is fetched in a
+        single round trip by :meth:`_drain_pending_dates`.
+        :meth:`add_event` drops the entry for the date it writes.
+        """
+        cached = self._cached_events(target_date)
+        if cached is not None:
+            return cached
+
+        future = self._inflight.get(target_date)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._inflight[target_date] = future
+            self._pending_dates.append(target_date)
+            if self._coalescer is None:
+                self._coalescer = loop.create_task(self._drain_pending_dates())
+
+        # Shielded so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(future)
+
+    async def _drain_pending_dates(self) -> None:
+        """Fetch every queued date in one batch and resolve its waiters."""
+        await asyncio.sleep(_COALESCE_WINDOW_SEC)
+
+        dates = list(self._pending_dates)
+        self._pending_dates.clear()
+        futures = [self._inflight.pop(d) for d in dates]
+        # Misses from here on start the next batch
+        self._coalescer = None
+
+        try:
+            by_date = await self._fetch_events_by_dates(dates)
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        expires_at = time.monotonic() + _BY_DATE_TTL_SEC
+        for d, future in zip(dates, futures):
+            events = by_date.get(d, [])
+            self._by_date_cache[d] = (expires_at, events)
+            if not future.done():
+                future.set_result(events)
+
+    async def _fetch_events_by_dates(
+        self,
+        dates: Sequence[date],
+    ) -> Dict[date, List[Any]]:
+        """Return the repository's events for each of *dates*."""
+        get_batch = getattr(self._repo, "get_events_by_dates", None)
+        if get_batch is None:
+            results = await asyncio.gather(
+                *(self._repo.get_events_by_date(d) for d in dates)
+            )
+            return {d: list(events) for d, events in zip(dates, results)}
+
+        grouped: Dict[date, List[Any]] = {d: [] for d in dates}
+        for event in await get_batch(list(dates)):
+            grouped.setdefault(self._event_date_of(event), []).append(event)
+        return grouped
+
+    async def _get_events_grouped_by_date(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> Dict[date, List[Any]]:
+        """Return the repository's events from *start_date* through
+        *end_date*, grouped by date.
+
+        Uses ``get_events_grouped_by_date`` when the repository has it,
+        else groups the ``get_events_in_range`` result.
+        """
+        get_grouped = getattr(self._repo, "get_events_grouped_by_date", None)
+        if get_grouped is not None:
+            return await get_grouped(start_date, end_date)
+
+        grouped: Dict[date, List[Any]] = {}
+        for event in await self._repo.get_events_in_range(start_date, end_date):
+            grouped.setdefault(self._event_date_of(event), []).append(event)
+        return grouped
+
+    @staticmethod
+    def _event_date_of(event: Any) -> Optional[date]:
+        """Return an event's ``event_date`` as a ``date`` (ISO strings
+        from dict records are parsed).
+        """
+        raw = (
+            event.get("event_date")
+            if isinstance(event, dict)
+            else getattr(event, "event_date", None)
+        )
+        if isinstance(raw, str):
+            return date.fromisoformat(raw)
+        return raw
+
+    @staticmethod
+    def _any_high_impact(events: Sequence[Any]) -> bool:
+        """Return whether any active event is high-impact, without
+        converting the events to dicts.
+        """
+        for event in events:
+            if isinstance(event, dict):
+                impact = event.get("market_impact")
+                action = event.get("trading_action")
+                active = event.get("is_active", True)
+            else:
+                impact = getattr(event, "market_impact", None)
+                action = getattr(event, "trading_action", None)
+                active = getattr(event, "is_active", True)
+            if active is not False and (
+                impact == "HIGH" or action == "HALT" or action == "REDUCE"
+            ):
+                return True
+        return False
+
     @staticmethod
     def _event_to_dict(event: Any) -> Dict[str, Any]:
         """Convert an event ORM model or dict to a plain dictionary.
 
         Handles both attribute-based objects (ORM models) and plain dicts.
+        Complete objects are read with one :data:`_EVENT_ATTRS` call; only
+        objects missing a field take the per-attribute ``getattr`` path.
         """
         if isinstance(event, dict):
             return event
 
+        try:
+            (
+                event_id,
+                event_date,
+                event_type,
+                event_name,
+                market_impact,
+                trading_action,
+                cash_adjust_pct,
+                is_active,
+            ) = _EVENT_ATTRS(event)
+        except AttributeError:
+            # Partial objects: fall back to per-field defaults
+            pass
+        else:
+            return {
+                "event_id": event_id,
+                "event_date": str(event_date),
+                "event_type": event_type,
+                "event_name": event_name,
+                "market_impact": market_impact,
+                "trading_action": trading_action,
+                "cash_adjust_pct": cash_adjust_pct,
+                "is_active": is_active,
+            }
+
         return {
             "event_id": getattr(event, "event_id", None),
             "event_date": str(getattr(event, "event_date", "")),
@@ -11,15 +11,24 @@ Usage:
     setup_logging(level="INFO")
     logger = get_logger("my_module")
     logger.info("order_submitted", stock_code="005930", quantity=10)
+
+    # Hot paths: at most one line per second per event
+    log_throttled(logger, "regime_detected", regime="BULL")
 """
 
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
 import os
+import queue
 import sys
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from typing import Any, Dict, Optional
 
 import structlog
 
@@ -30,6 +39,49 @@ _LOG_DIR = Path("logs")
 _DATE_FMT = "%Y-%m-%d %H:%M:%S"
 _CONFIGURED = False
 
+# Background thread that renders and writes file log records (set up once)
+_LISTENER: Optional[QueueListener] = None
+
+# log_throttled: event -> (monotonic time of last emit, calls suppressed since)
+_THROTTLE_STATE: Dict[str, list] = {}
+
+
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records untouched.
+
+    The stock ``prepare()`` renders ``record.msg`` to a string, which would
+    destroy the event dict structlog's ``ProcessorFormatter`` needs on the
+    listener side.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _DailyFileHandler(TimedRotatingFileHandler):
+    """File handler that switches to ``kats_{YYYY-MM-DD}.log`` at midnight.
+
+    Keeps the one-file-per-day naming for long-running processes: rollover
+    opens the new day's file instead of renaming the finished one.
+    """
+
+    def __init__(self, log_dir: Path) -> None:
+        self._log_dir = log_dir
+        super().__init__(
+            str(self._path_for_today()), when="midnight", encoding="utf-8"
+        )
+
+    def _path_for_today(self) -> Path:
+        return self._log_dir / f"kats_{datetime.now():%Y-%m-%d}.log"
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None  # type: ignore[assignment]
+        self.baseFilename = os.path.abspath(self._path_for_today())
+        self.stream = self._open()
+        self.rolloverAt = self.computeRollover(int(time.time()))
+
 
 # ── Public API ───────────────────────────────────────────────────────────────
 
@@ -37,7 +89,9 @@ def setup_logging(level: str = "INFO") -> None:
     """Initialise structlog and stdlib logging for the KATS application.
 
     * Console output: colored, human-readable key=value format.
-    * File output  : JSON lines written to ``logs/kats_{YYYY-MM-DD}.log``.
+    * File output  : JSON lines written to ``logs/kats_{YYYY-MM-DD}.log``
+      (switching files at local midnight), serialised and written by a
+      background :class:`QueueListener` so callers only pay for an enqueue.
 
     This function is idempotent -- calling it more than once is safe but only
     the first invocation takes effect.
@@ -45,7 +99,7 @@ def setup_logging(level: str = "INFO") -> None:
     Args:
         level: Root log level name (e.g. ``"DEBUG"``, ``"INFO"``, ``"WARNING"``).
     """
-    global _CONFIGURED
+    global _CONFIGURED, _LISTENER
     if _CONFIGURED:
         return
     _CONFIGURED = True
@@ -56,10 +110,7 @@ def setup_logging(level: str = "INFO") -> None:
     _LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     # ── File handler (JSON lines) ────────────────────────────────────────
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    log_file = _LOG_DIR / f"kats_{today_str}.log"
-
-    file_handler = logging.FileHandler(str(log_file), encoding="utf-8")
+    file_handler = _DailyFileHandler(_LOG_DIR)
     file_handler.setLevel(numeric_level)
 
     # ── Console handler (colored) ────────────────────────────────────────
@@ -71,7 +122,16 @@ def setup_logging(level: str = "INFO") -> None:
     root_logger.setLevel(numeric_level)
     # Remove any pre-existing handlers to avoid duplicate output
     root_logger.handlers.clear()
-    root_logger.addHandler(file_handler)
+    # The file handler's JSON rendering and disk write run on the
+    # listener thread
+    file_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _RecordQueueHandler(file_queue)
+    queue_handler.setLevel(numeric_level)
+    _LISTENER = QueueListener(file_queue, file_handler, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)
+
+    root_logger.addHandler(queue_handler)
     root_logger.addHandler(console_handler)
 
     # ── Shared structlog processors ──────────────────────────────────────
@@ -116,12 +176,14 @@ def setup_logging(level: str = "INFO") -> None:
     )
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Return a named, bound structlog logger.
 
     If ``setup_logging()`` has not been called yet, it is invoked
     automatically with default settings to guarantee safe usage from any
-    import order.
+    import order.  Loggers are cached per name, so repeated calls return
+    the same instance.
 
     Args:
         name: Logger name, typically ``__name__`` of the calling module.
@@ -134,10 +196,51 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+def log_throttled(
+    logger: Any,
+    event: str,
+    interval: float = 1.0,
+    **kwargs: Any,
+) -> None:
+    """``logger.info(event, **kwargs)`` at most once per *interval* seconds.
+
+    Calls in between are only counted; the next emitted line carries that
+    count as ``suppressed``.  When the root logger is at ``DEBUG`` every
+    call is emitted.
+
+    Args:
+        logger: A structlog (or stdlib-compatible) logger.
+        event: Event name; throttling is tracked per event name.
+        interval: Minimum seconds between emitted lines.
+        **kwargs: Event fields passed through to ``logger.info``.
+    """
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logger.info(event, **kwargs)
+        return
+
+    now = time.monotonic()
+    state = _THROTTLE_STATE.get(event)
+    if state is None:
+        _THROTTLE_STATE[event] = [now, 0]
+    elif now - state[0] < interval:
+        state[1] += 1
+        return
+    else:
+        if state[1]:
+            kwargs["suppressed"] = state[1]
+        state[0] = now
+        state[1] = 0
+    logger.info(event, **kwargs)
+
+
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _supports_color() -> bool:
-    """Detect whether the current terminal supports ANSI colors."""
+    """Detect whether the current terminal supports ANSI colors.
+
+    Cached: the environment and stdout are fixed for the process lifetime.
+    """
     if os.getenv("NO_COLOR"):
         return False
     if os.getenv("FORCE_COLOR"):
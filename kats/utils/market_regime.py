@@ -21,15 +21,25 @@ Usage:
     regime = detector.detect(kospi_data)
     cash_pct = detector.get_cash_allocation(regime)
     desc = detector.get_regime_description(regime)
+
+    # Hot paths: index the read-only tables directly
+    cash_pct = CASH_ALLOCATION[regime]
+
+    # Whole series at once (backtests): int8 codes, see REGIME_CODE
+    codes = detector.detect_batch(prices, ma_50, ma_200, ad_ratios)
+    regimes = [MarketRegime.from_code(c) for c in codes]
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import numpy as np
 
-from kats.strategy.base_strategy import MarketRegime
-from kats.utils.logger import get_logger
+from kats.strategy.base_strategy import REGIME_CODE, MarketRegime
+from kats.utils.logger import get_logger, log_throttled
 
 logger = get_logger(__name__)
 
@@ -46,6 +56,10 @@ _CASH_ALLOCATION: Dict[MarketRegime, float] = {
     MarketRegime.STRONG_BEAR: 80.0,   # Capital preservation mode
 }
 
+# Read-only public view: hot callers index it directly instead of going
+# through ``MarketRegimeDetector.get_cash_allocation``
+CASH_ALLOCATION: Mapping[MarketRegime, float] = MappingProxyType(_CASH_ALLOCATION)
+
 
 # ============================================================================
 # Regime Descriptions (Korean)
@@ -76,12 +90,51 @@ _REGIME_DESCRIPTION: Dict[MarketRegime, str] = {
     ),
 }
 
+# Read-only public view (see CASH_ALLOCATION)
+REGIME_DESCRIPTION: Mapping[MarketRegime, str] = MappingProxyType(
+    _REGIME_DESCRIPTION
+)
+
+
+# ============================================================================
+# Regime Lookup Table
+# ============================================================================
+
+# ``detect`` packs its seven comparisons into a 7-bit index (MSB first):
+#   price > ma_50, ma_50 > ma_200, ad > 1.5, price > ma_200,
+#   price < ma_50, price < ma_200, ad < 0.5
+# Strict < and > get separate bits so ties (and NaN, which sets none)
+# classify exactly as the decision tree in _regime_for_bits.
+
+def _regime_for_bits(bits: int) -> MarketRegime:
+    """Apply the decision tree to one packed comparison index."""
+    p_gt_50, m50_gt_200, ad_gt_15, p_gt_200, p_lt_50, p_lt_200, ad_lt_05 = (
+        (bits >> shift) & 1 for shift in range(6, -1, -1)
+    )
+    if p_gt_50 and m50_gt_200 and ad_gt_15:
+        return MarketRegime.STRONG_BULL
+    if p_gt_50 and p_gt_200:
+        return MarketRegime.BULL
+    if p_lt_50 and p_lt_200 and ad_lt_05:
+        return MarketRegime.STRONG_BEAR
+    if p_lt_200:
+        return MarketRegime.BEAR
+    return MarketRegime.SIDEWAYS
+
+
+_REGIME_LUT: Tuple[MarketRegime, ...] = tuple(
+    _regime_for_bits(bits) for bits in range(128)
+)
+_REGIME_CODE_LUT = np.array(
+    [REGIME_CODE[regime] for regime in _REGIME_LUT], dtype=np.int8
+)
+
 
 # ============================================================================
 # MarketRegimeDetector
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class KospiData:
     """Container for KOSPI market data required by the detector.
 
@@ -130,20 +183,18 @@ class MarketRegimeDetector:
         """
         price, ma50, ma200, ad_ratio = self._extract_values(kospi_data)
 
-        regime: MarketRegime
-
-        if price > ma50 > ma200 and ad_ratio > 1.5:
-            regime = MarketRegime.STRONG_BULL
-        elif price > ma50 and price > ma200:
-            regime = MarketRegime.BULL
-        elif price < ma50 and price < ma200 and ad_ratio < 0.5:
-            regime = MarketRegime.STRONG_BEAR
-        elif price < ma200:
-            regime = MarketRegime.BEAR
-        else:
-            regime = MarketRegime.SIDEWAYS
-
-        logger.info(
+        regime = _REGIME_LUT[
+            (price > ma50) << 6
+            | (ma50 > ma200) << 5
+            | (ad_ratio > 1.5) << 4
+            | (price > ma200) << 3
+            | (price < ma50) << 2
+            | (price < ma200) << 1
+            | (ad_ratio < 0.5)
+        ]
+
+        log_throttled(
+            logger,
             "market_regime_detected",
             regime=regime.value,
             price=price,
@@ -154,6 +205,46 @@ class MarketRegimeDetector:
 
         return regime
 
+    @staticmethod
+    def detect_batch(
+        prices: np.ndarray,
+        ma_50: np.ndarray,
+        ma_200: np.ndarray,
+        advance_decline_ratio: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Classify a whole series of bars with the :meth:`detect` rules.
+
+        Args:
+            prices: KOSPI levels, one per bar.
+            ma_50: 50-day moving averages, same length.
+            ma_200: 200-day moving averages, same length.
+            advance_decline_ratio: A/D ratios, same length (``1.0`` for
+                every bar when omitted).
+
+        Returns:
+            An ``int8`` array of :data:`REGIME_CODE` values; convert single
+            entries with :meth:`MarketRegime.from_code`.
+        """
+        price = np.asarray(prices, dtype=np.float64)
+        ma50 = np.asarray(ma_50, dtype=np.float64)
+        ma200 = np.asarray(ma_200, dtype=np.float64)
+        if advance_decline_ratio is None:
+            ad_ratio = np.ones_like(price)
+        else:
+            ad_ratio = np.asarray(advance_decline_ratio, dtype=np.float64)
+
+        # Same packed index as ``detect``, one per bar
+        bits = (
+            (price > ma50).astype(np.intp) << 6
+            | (ma50 > ma200) << 5
+            | (ad_ratio > 1.5) << 4
+            | (price > ma200) << 3
+            | (price < ma50) << 2
+            | (price < ma200) << 1
+            | (ad_ratio < 0.5)
+        )
+        return _REGIME_CODE_LUT[bits]
+
     # ── Cash Allocation ──────────────────────────────────────────────────
 
     @staticmethod
@@ -193,6 +284,10 @@ class MarketRegimeDetector:
         Returns:
             ``(price, ma_50, ma_200, advance_decline_ratio)``
         """
+        # Internal callers pass KospiData, whose fields are already floats
+        if isinstance(data, KospiData):
+            return data.price, data.ma_50, data.ma_200, data.advance_decline_ratio
+
         if isinstance(data, dict):
             price = float(data["price"])
             ma50 = float(data["ma_50"])
@@ -17,21 +17,19 @@ KATS Control — Python 통합 관리 CLI
 
 from __future__ import annotations
 
-import argparse
 import asyncio
+import importlib.util
 import json
 import os
+import shutil
 import signal
-import subprocess
 import sys
 import time
 from datetime import datetime, date
 from pathlib import Path
 
-# 프로젝트 루트를 path에 추가
-PROJECT_DIR = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_DIR))
-os.chdir(str(PROJECT_DIR))
+# 프로젝트 루트 (resolve 없이 절대 경로만 — 심볼릭 링크 탐색 생략)
+PROJECT_DIR = Path(os.path.abspath(__file__)).parent.parent
 
 # ── 색상 유틸 ──────────────────────────────────────────────────────────────
 class Color:
@@ -65,10 +63,33 @@ class Color:
         return f"{Color.BOLD}{text}{Color.NC}"
 
 
+# 상태 아이콘 (행마다 다시 만들지 않도록 미리 조합)
+ICON_OK = f"{Color.GREEN}✓{Color.NC}"
+ICON_ERR = f"{Color.RED}✗{Color.NC}"
+ICON_WARN = f"{Color.YELLOW}–{Color.NC}"
+
+
+def write_lines(lines: list[str]) -> None:
+    """여러 줄을 한 번의 write로 출력"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 PID_DIR = PROJECT_DIR / ".pids"
 LOG_DIR = PROJECT_DIR / "logs"
-PID_DIR.mkdir(exist_ok=True)
-LOG_DIR.mkdir(exist_ok=True)
+
+# PID/로그 디렉터리가 필요한 명령 (캐시 파일·로그 조회)
+_NEEDS_DIRS = frozenset({"start", "restart", "status", "logs", "health"})
+
+
+def _bootstrap_paths(make_dirs: bool = False) -> None:
+    """프로젝트 루트를 import 경로/작업 디렉터리로 설정 (main()에서만 호출)"""
+    root = str(PROJECT_DIR)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    os.chdir(root)
+    if make_dirs:
+        PID_DIR.mkdir(exist_ok=True)
+        LOG_DIR.mkdir(exist_ok=True)
 
 
 # ── 프로세스 유틸 ──────────────────────────────────────────────────────────
@@ -85,35 +106,170 @@ def get_pid(name: str) -> int | None:
         return None
 
 
-def is_redis_running() -> bool:
+# ── Redis 유틸 ────────────────────────────────────────────────────────────
+# redis-cli 프로세스를 띄우는 대신 redis.asyncio로 PING/INFO를 직접 보낸다.
+# 클라이언트는 이벤트 루프에 묶이므로 이벤트 루프마다 새로 만든다.
+def _redis_client():
+    """Settings.REDIS_URL 기반 redis.asyncio 클라이언트 (짧은 타임아웃)"""
+    from redis.asyncio import from_url
+    from kats.config.settings import Settings
+
+    return from_url(
+        Settings.REDIS_URL,
+        socket_timeout=1,
+        socket_connect_timeout=1,
+        decode_responses=True,
+    )
+
+
+async def _redis_ping(client) -> bool:
     try:
-        result = subprocess.run(
-            ["redis-cli", "ping"],
-            capture_output=True, text=True, timeout=3,
-        )
-        return result.stdout.strip() == "PONG"
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return bool(await client.ping())
+    except Exception:
         return False
 
 
-def redis_info() -> dict:
-    if not is_redis_running():
-        return {}
+async def _redis_info(client) -> dict:
     try:
-        result = subprocess.run(
-            ["redis-cli", "info"],
-            capture_output=True, text=True, timeout=3,
-        )
-        info = {}
-        for line in result.stdout.splitlines():
-            if ":" in line and not line.startswith("#"):
-                k, v = line.split(":", 1)
-                info[k.strip()] = v.strip()
-        return info
+        return await client.info()
     except Exception:
         return {}
 
 
+async def _redis_status() -> dict | None:
+    """PING → INFO를 하나의 연결로 조회 (미실행이면 None)"""
+    try:
+        async with _redis_client() as client:
+            if not await _redis_ping(client):
+                return None
+            return await _redis_info(client)
+    except Exception:
+        return None
+
+
+async def _redis_alive() -> bool:
+    try:
+        async with _redis_client() as client:
+            return await _redis_ping(client)
+    except Exception:
+        return False
+
+
+# ── DB 유틸 ───────────────────────────────────────────────────────────────
+# 엔진(커넥션 풀)은 첫 사용 시 한 번만 만들고 이후 명령은 재사용한다.
+# 엔진도 이벤트 루프에 묶이므로 main()의 단일 이벤트 루프 안에서 공유된다.
+_repo = None
+
+
+async def _get_repo():
+    """Settings.DB_URL 기반 Repository (지연 생성 + init_db 1회)"""
+    global _repo
+    if _repo is None:
+        from kats.database.repository import Repository
+        from kats.config.settings import Settings
+
+        repo = Repository(Settings.DB_URL)
+        await repo.init_db()
+        _repo = repo
+    return _repo
+
+
+# ── 로그 유틸 ─────────────────────────────────────────────────────────────
+# 로그 목록은 LOG_DIR의 mtime이 바뀔 때(파일 추가/삭제)만 다시 읽는다.
+_LOG_CACHE_FILE = PID_DIR / "logs.cache.json"
+
+
+def _log_entries() -> list:
+    """LOG_DIR의 kats_*.log 항목 (Path 객체/fnmatch 없이 scandir로)"""
+    with os.scandir(LOG_DIR) as it:
+        return [
+            e for e in it
+            if e.name.startswith("kats_") and e.name.endswith(".log")
+        ]
+
+
+def _log_listing() -> tuple[Path | None, int]:
+    """(최신 로그 파일, 로그 파일 수) — LOG_DIR가 그대로면 캐시 사용"""
+    try:
+        dir_mtime = LOG_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None, 0
+
+    try:
+        cached = json.loads(_LOG_CACHE_FILE.read_text())
+        if cached["mtime_ns"] == dir_mtime:
+            latest = cached["latest"]
+            return (Path(latest) if latest else None), cached["count"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    try:
+        entries = _log_entries()
+    except FileNotFoundError:
+        return None, 0
+    # 파일명이 날짜(kats_YYYY-MM-DD.log)라 이름 순서가 곧 최신 순서다
+    latest = Path(max(entries, key=lambda e: e.name).path) if entries else None
+    try:
+        tmp = _LOG_CACHE_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "mtime_ns": dir_mtime,
+            "latest": str(latest) if latest else None,
+            "count": len(entries),
+        }))
+        tmp.replace(_LOG_CACHE_FILE)
+    except OSError:
+        pass
+    return latest, len(entries)
+
+
+def _latest_log() -> Path | None:
+    return _log_listing()[0]
+
+
+# tail 프로세스 대신 파일 끝에서 역방향으로 읽는다.
+_TAIL_CHUNK = 64 * 1024
+_FOLLOW_INTERVAL = 0.1
+
+
+def tail_bytes(path: Path, n: int) -> bytes:
+    """파일의 마지막 n줄 (tail -n 과 동일)"""
+    if n <= 0:
+        return b""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = bytearray()
+        # n+1개의 개행을 확보하면 n번째 줄의 시작이 버퍼 안에 있다
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(_TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            buf[:0] = f.read(step)
+
+    idx = len(buf) - 1 if buf.endswith(b"\n") else len(buf)
+    for _ in range(n):
+        idx = buf.rfind(b"\n", 0, idx)
+        if idx < 0:
+            return bytes(buf)
+    return bytes(buf[idx + 1:])
+
+
+def follow_file(path: Path, n: int) -> None:
+    """마지막 n줄 출력 후 추가되는 내용을 계속 출력 (tail -f)"""
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    with open(path, "rb") as f:
+        out.write(tail_bytes(path, n))
+        out.flush()
+        f.seek(0, os.SEEK_END)
+        while True:
+            chunk = f.read()
+            if chunk:
+                out.write(chunk)
+                out.flush()
+            else:
+                time.sleep(_FOLLOW_INTERVAL)
+
+
 # ══════════════════════════════════════════════════════════════════════════
 #  명령어 구현
 # ══════════════════════════════════════════════════════════════════════════
@@ -129,8 +285,61 @@ def cmd_start(args):
     os.execvp("bash", cmd)
 
 
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+
+def _send_signal(pid: int, sig: int) -> bool:
+    """시그널 전송. 프로세스가 이미 종료되었으면 False"""
+    try:
+        os.kill(pid, sig)
+        return True
+    except ProcessLookupError:
+        return False
+
+
+def _stop_kats(force: bool, grace_sec: int = 15) -> bool:
+    """PID 파일 기준 KATS 종료 (stop.sh의 stop_process와 같은 절차)"""
+    pid_file = PID_DIR / "kats.pid"
+    pid = get_pid("kats")
+    if pid is None:
+        print(Color.warn("KATS: 프로세스 이미 종료됨"))
+        return True
+
+    print(f"{Color.info('KATS 종료 요청')} (PID: {pid})...")
+    # 시그널 전송 전후로 프로세스가 사라졌으면 이미 종료된 것으로 처리
+    if force:
+        if _send_signal(pid, signal.SIGKILL):
+            print(Color.warn("KATS 강제 종료 (SIGKILL)"))
+    elif _send_signal(pid, signal.SIGTERM):
+        # Graceful shutdown: SIGTERM 후 대기
+        deadline = time.monotonic() + grace_sec
+        while _pid_alive(pid) and time.monotonic() < deadline:
+            time.sleep(0.2)
+        if _pid_alive(pid):
+            print(Color.warn(f"KATS: {grace_sec}초 내 종료되지 않음. 강제 종료합니다."))
+            if _send_signal(pid, signal.SIGKILL):
+                time.sleep(1)
+
+    if _pid_alive(pid):
+        print(Color.err(f"KATS 종료 실패 (PID: {pid})"))
+        return False
+    pid_file.unlink(missing_ok=True)
+    print(f"{Color.ok('KATS 종료 완료')} (PID: {pid})")
+    return True
+
+
 def cmd_stop(args):
     """시스템 중지"""
+    # PID 파일로 KATS만 중지하는 기본 경로는 bash 없이 직접 처리한다.
+    # Redis 중지(--all)와 PID 파일 없는 프로세스 검색은 stop.sh가 담당.
+    if not (args.all or args.legacy_scripts) and (PID_DIR / "kats.pid").exists():
+        sys.exit(0 if _stop_kats(args.force) else 1)
+
     script = PROJECT_DIR / "scripts" / "stop.sh"
     cmd = ["bash", str(script)]
     if args.all:
@@ -151,275 +360,487 @@ def cmd_restart(args):
     os.execvp("bash", cmd)
 
 
+# status --json은 watch/TUI가 자주 폴링하므로 짧은 TTL로 결과를 재사용한다.
+_STATUS_CACHE_FILE = PID_DIR / "status.cache.json"
+_STATUS_CACHE_TTL = 2.0
+
+
+def _cached_status_json(script: Path, ttl: float = _STATUS_CACHE_TTL) -> bytes:
+    """status.sh --json 출력 (ttl초 이내면 캐시 사용)"""
+    try:
+        if time.time() - _STATUS_CACHE_FILE.stat().st_mtime < ttl:
+            return _STATUS_CACHE_FILE.read_bytes()
+    except OSError:
+        pass
+
+    import subprocess
+
+    result = subprocess.run(["bash", str(script), "--json"], capture_output=True)
+    sys.stderr.buffer.write(result.stderr)
+    if result.returncode != 0:
+        sys.stdout.buffer.write(result.stdout)
+        sys.exit(result.returncode)
+
+    try:
+        tmp = _STATUS_CACHE_FILE.with_suffix(".tmp")
+        tmp.write_bytes(result.stdout)
+        tmp.replace(_STATUS_CACHE_FILE)
+    except OSError:
+        pass
+    return result.stdout
+
+
 def cmd_status(args):
     """시스템 상태 확인"""
     script = PROJECT_DIR / "scripts" / "status.sh"
-    cmd = ["bash", str(script)]
     if args.json:
-        cmd.append("--json")
-    os.execvp("bash", cmd)
+        sys.stdout.buffer.write(_cached_status_json(script))
+        sys.stdout.flush()
+        return
+    # 사람이 보는 화면은 항상 최신 상태로
+    os.execvp("bash", ["bash", str(script)])
 
 
 def cmd_logs(args):
     """로그 보기"""
-    log_files = sorted(LOG_DIR.glob("kats_*.log"), reverse=True)
+    log_file = _latest_log()
 
-    if not log_files:
+    if log_file is None:
         print(Color.warn("로그 파일이 없습니다."))
         return
 
-    log_file = log_files[0]
     print(f"{Color.info('로그 파일:')} {log_file}")
     print()
 
     if args.follow:
         # tail -f 모드
         try:
-            subprocess.run(["tail", "-f", "-n", str(args.tail), str(log_file)])
+            follow_file(log_file, args.tail)
         except KeyboardInterrupt:
             print("\n로그 모니터링 종료")
     else:
         # 마지막 N줄 출력
         try:
-            result = subprocess.run(
-                ["tail", "-n", str(args.tail), str(log_file)],
-                capture_output=True, text=True,
-            )
-            print(result.stdout)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(tail_bytes(log_file, args.tail))
+            sys.stdout.buffer.flush()
+            print()
         except Exception as e:
             print(Color.err(f"로그 읽기 실패: {e}"))
 
 
-def cmd_health(args):
-    """헬스 체크 (상세)"""
-    print(f"\n{Color.bold('KATS 헬스 체크')}")
-    print("=" * 55)
-
-    checks = []
-
-    # 1. KATS 프로세스
+# ── 헬스 체크 항목 ────────────────────────────────────────────────────────
+# 각 항목은 (status, detail)을 반환한다. status: True=정상, False=이상, None=참고.
+# 블로킹 작업은 asyncio.to_thread로 넘겨 모든 항목을 동시에 실행한다.
+async def _check_process():
     kats_pid = get_pid("kats")
     if kats_pid:
-        checks.append(("KATS 프로세스", True, f"PID {kats_pid}"))
-    else:
-        checks.append(("KATS 프로세스", False, "미실행"))
-
-    # 2. Redis
-    if is_redis_running():
-        info = redis_info()
-        ver = info.get("redis_version", "?")
-        mem = info.get("used_memory_human", "?")
-        checks.append(("Redis 서버", True, f"v{ver}, {mem}"))
-    else:
-        checks.append(("Redis 서버", False, "미실행"))
+        return True, f"PID {kats_pid}"
+    return False, "미실행"
+
+
+async def _check_redis():
+    info = await _redis_status()
+    if info is None:
+        return False, "미실행"
+    ver = info.get("redis_version", "?")
+    mem = info.get("used_memory_human", "?")
+    return True, f"v{ver}, {mem}"
+
+
+def _read_env_key(path: Path, key: str) -> str | None:
+    """.env에서 키 하나의 값만 읽는다 (python-dotenv 전체 파싱 없이)"""
+    value = None
+    with open(path, "rb") as f:
+        for line in f:
+            name, sep, raw = line.strip().partition(b"=")
+            name = name.removeprefix(b"export ").strip()
+            if not sep or name.decode(errors="replace") != key:
+                continue
+            raw = raw.strip()
+            if raw[:1] in (b'"', b"'"):
+                raw = raw[1:].partition(raw[:1])[0]
+            else:
+                raw = raw.partition(b" #")[0].rstrip()
+            value = raw.decode()
+    return value
 
-    # 3. .env 파일
+
+async def _check_env():
     env_file = PROJECT_DIR / ".env"
-    if env_file.exists():
-        from dotenv import dotenv_values
-        env = dotenv_values(str(env_file))
-        has_key = bool(env.get("KIS_APP_KEY")) and env["KIS_APP_KEY"] != "your_app_key_here"
-        checks.append((".env 설정", has_key, "API 키 설정됨" if has_key else "API 키 미설정"))
-    else:
-        checks.append((".env 설정", False, "파일 없음"))
 
-    # 4. DB 파일
-    db_file = PROJECT_DIR / "kats.db"
-    if db_file.exists():
-        size_mb = db_file.stat().st_size / (1024 * 1024)
-        checks.append(("SQLite DB", True, f"{size_mb:.1f}MB"))
-    else:
-        checks.append(("SQLite DB", None, "미생성 (시작 시 자동 생성)"))
+    try:
+        val = await asyncio.to_thread(_read_env_key, env_file, "KIS_APP_KEY")
+    except OSError:
+        return False, "파일 없음"
+    has_key = bool(val) and val != "your_app_key_here"
+    return has_key, "API 키 설정됨" if has_key else "API 키 미설정"
 
-    # 5. 로그 디렉토리
-    log_files = list(LOG_DIR.glob("kats_*.log"))
-    checks.append(("로그 파일", True if log_files else None, f"{len(log_files)}개"))
 
-    # 6. 모듈 임포트
+async def _check_db():
+    db_file = PROJECT_DIR / "kats.db"
     try:
-        from kats.config.settings import Settings
-        from kats.strategy.strategy_selector import StrategySelector
-        from kats.risk.risk_manager import RiskManager
-        checks.append(("Python 모듈", True, "핵심 모듈 로드 성공"))
-    except Exception as e:
-        checks.append(("Python 모듈", False, str(e)[:50]))
+        st = await asyncio.to_thread(db_file.stat)
+    except FileNotFoundError:
+        return None, "미생성 (시작 시 자동 생성)"
+    return True, f"{st.st_size / (1024 * 1024):.1f}MB"
+
+
+async def _check_logs():
+    _, count = await asyncio.to_thread(_log_listing)
+    return (True if count else None), f"{count}개"
+
+
+# 존재만 확인 (find_spec은 모듈을 실행하지 않음). 실제 임포트는 해당 명령에서.
+_CORE_MODULES = (
+    "kats.config.settings",
+    "kats.strategy.strategy_selector",
+    "kats.risk.risk_manager",
+)
+
+
+async def _check_modules():
+    missing = [m for m in _CORE_MODULES if importlib.util.find_spec(m) is None]
+    if missing:
+        return False, f"모듈 없음: {', '.join(missing)}"[:50]
+    return True, "핵심 모듈 확인됨"
+
 
-    # 7. 디스크 공간
+async def _check_disk():
     try:
-        import shutil
-        usage = shutil.disk_usage(str(PROJECT_DIR))
-        free_gb = usage.free / (1024 ** 3)
-        checks.append(("디스크 여유", free_gb > 1, f"{free_gb:.1f}GB"))
+        usage = await asyncio.to_thread(shutil.disk_usage, str(PROJECT_DIR))
     except Exception:
-        checks.append(("디스크 여유", None, "확인 불가"))
+        return None, "확인 불가"
+    free_gb = usage.free / (1024 ** 3)
+    return free_gb > 1, f"{free_gb:.1f}GB"
+
+
+_HEALTH_CHECKS = (
+    ("KATS 프로세스", _check_process),
+    ("Redis 서버", _check_redis),
+    (".env 설정", _check_env),
+    ("SQLite DB", _check_db),
+    ("로그 파일", _check_logs),
+    ("Python 모듈", _check_modules),
+    ("디스크 여유", _check_disk),
+)
+
+
+async def _run_health_checks() -> list:
+    """모든 항목을 동시에 실행하고 (name, status, detail)을 정의 순서대로 반환"""
+    results = await asyncio.gather(
+        *(check() for _, check in _HEALTH_CHECKS), return_exceptions=True,
+    )
+    checks = []
+    for (name, _), result in zip(_HEALTH_CHECKS, results):
+        if isinstance(result, BaseException):
+            checks.append((name, False, str(result)[:50]))
+        else:
+            checks.append((name, *result))
+    return checks
+
+
+async def cmd_health(args):
+    """헬스 체크 (상세)"""
+    print(f"\n{Color.bold('KATS 헬스 체크')}")
+    print("=" * 55)
+
+    checks = await _run_health_checks()
 
     # 결과 출력
-    print()
-    all_ok = True
+    icons = {True: ICON_OK, False: ICON_ERR, None: ICON_WARN}
+    lines = [""]
     for name, status, detail in checks:
-        if status is True:
-            icon = Color.ok("✓")
-        elif status is False:
-            icon = Color.err("✗")
-            all_ok = False
-        else:
-            icon = Color.warn("–")
-
-        print(f"  {icon}  {name:20s}  {detail}")
+        lines.append(f"  {icons[status]}  {name:20s}  {detail}")
 
-    print()
-    if all_ok:
-        print(f"  {Color.ok(Color.bold('모든 항목 정상'))}")
+    lines.append("")
+    if all(status is not False for _, status, _ in checks):
+        lines.append(f"  {Color.ok(Color.bold('모든 항목 정상'))}")
     else:
-        print(f"  {Color.warn('일부 항목 확인 필요')}")
-    print()
+        lines.append(f"  {Color.warn('일부 항목 확인 필요')}")
+    lines.append("")
+    write_lines(lines)
 
 
-def cmd_db_init(args):
+async def cmd_db_init(args):
     """데이터베이스 초기화"""
+    from kats.config.settings import Settings
+
     print(f"{Color.info('데이터베이스 초기화 중...')}")
+    await _get_repo()
+    print(f"{Color.ok('DB 초기화 완료')}: {Settings.DB_URL}")
+
+
+# ── DB 통계 유틸 ──────────────────────────────────────────────────────────
+_DB_STAT_TABLES = (
+    ("stocks", "종목 마스터"),
+    ("trades", "매매 내역"),
+    ("trade_journal", "매매 일지"),
+    ("strategies", "전략 마스터"),
+    ("daily_stats", "일별 통계"),
+    ("monthly_stats", "월별 통계"),
+    ("drawdown_log", "드로우다운 이력"),
+    ("system_config", "시스템 설정"),
+    ("event_calendar", "이벤트 캘린더"),
+    ("paper_account", "가상 계좌"),
+)
+
+
+def _count_sql(table_names) -> str:
+    """테이블별 COUNT(*)를 한 번에 조회하는 UNION ALL 쿼리"""
+    return " UNION ALL ".join(
+        f"SELECT '{t}' AS name, COUNT(*) AS n FROM {t}" for t in table_names
+    )
+
+
+async def _count_rows(session, table_names) -> dict:
+    """{테이블: 행 수} — 존재하는 테이블만, 한 번의 왕복으로 조회"""
+    from sqlalchemy import inspect, text
+
+    conn = await session.connection()
+    existing = set(await conn.run_sync(lambda c: inspect(c).get_table_names()))
+    present = [t for t in table_names if t in existing]
+    if not present:
+        return {}
+
+    try:
+        result = await session.execute(text(_count_sql(present)))
+        return dict(result.all())
+    except Exception:
+        # 합친 쿼리가 실패하면 테이블별로 조회
+        counts = {}
+        for t in present:
+            try:
+                result = await session.execute(text(f"SELECT COUNT(*) FROM {t}"))
+                counts[t] = result.scalar()
+            except Exception:
+                pass
+        return counts
+
+
+def _sqlite_path(db_url: str):
+    """sqlite URL → 파일 경로 (sqlite가 아니거나 메모리 DB면 None)"""
+    if not db_url.startswith("sqlite"):
+        return None
+    _, sep, path = db_url.partition(":///")
+    path = path.split("?", 1)[0]
+    if not sep or not path or path == ":memory:":
+        return None
+    return Path(path)
+
+
+def _table_count_lines(counts: dict) -> list[str]:
+    lines = []
+    for table_name, description in _DB_STAT_TABLES:
+        count = counts.get(table_name)
+        if count is not None:
+            lines.append(f"  {description:15s} ({table_name:20s}): {count:>6,}행")
+        else:
+            lines.append(f"  {description:15s} ({table_name:20s}): {Color.warn('테이블 없음')}")
+    return lines
 
-    async def _init():
-        from kats.database.repository import Repository
-        from kats.config.settings import Settings
-        repo = Repository(Settings.DB_URL)
-        await repo.init_db()
-        print(f"{Color.ok('DB 초기화 완료')}: {Settings.DB_URL}")
 
-    asyncio.run(_init())
+def _sqlite_db_stats(db_path: Path):
+    """SQLite는 읽기 전용으로 직접 조회 (init_db/스레드 홉/이벤트 루프 없음)"""
+    import sqlite3
+    from urllib.parse import quote
+
+    lines = [f"\n{Color.bold('데이터베이스 통계')}", "=" * 50]
+
+    uri = f"file:{quote(db_path.as_posix())}?mode=ro"
+    try:
+        conn = sqlite3.connect(uri, uri=True)
+    except sqlite3.OperationalError:
+        lines.append(f"  {Color.warn('DB 미생성 (시작 시 자동 생성)')}: {db_path}")
+        write_lines(lines)
+        return
+
+    try:
+        existing = {
+            name for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        present = [t for t, _ in _DB_STAT_TABLES if t in existing]
+        counts = dict(conn.execute(_count_sql(present)).fetchall()) if present else {}
+    finally:
+        conn.close()
+
+    lines += _table_count_lines(counts)
+
+    size = db_path.stat().st_size
+    lines += ["", f"  DB 크기: {size / 1024:.1f}KB"]
+    write_lines(lines)
 
 
 def cmd_db_stats(args):
     """데이터베이스 통계"""
-    async def _stats():
-        from kats.database.repository import Repository
-        from kats.config.settings import Settings
+    from kats.config.settings import Settings
 
-        repo = Repository(Settings.DB_URL)
-        await repo.init_db()
+    db_path = _sqlite_path(Settings.DB_URL)
+    if db_path is not None:
+        # 이벤트 루프 없이 동기로 처리
+        return _sqlite_db_stats(db_path)
 
-        print(f"\n{Color.bold('데이터베이스 통계')}")
-        print("=" * 50)
+    # 그 외 백엔드는 코루틴을 돌려주어 main()의 이벤트 루프에서 실행
+    async def _stats():
+        repo = await _get_repo()
 
         # 테이블별 행 수 조회
-        from sqlalchemy import text
         async with repo.get_session() as session:
-            tables = [
-                ("stocks", "종목 마스터"),
-                ("trades", "매매 내역"),
-                ("trade_journal", "매매 일지"),
-                ("strategies", "전략 마스터"),
-                ("daily_stats", "일별 통계"),
-                ("monthly_stats", "월별 통계"),
-                ("drawdown_log", "드로우다운 이력"),
-                ("system_config", "시스템 설정"),
-                ("event_calendar", "이벤트 캘린더"),
-                ("paper_account", "가상 계좌"),
-            ]
-
-            for table_name, description in tables:
-                try:
-                    result = await session.execute(
-                        text(f"SELECT COUNT(*) FROM {table_name}")
-                    )
-                    count = result.scalar()
-                    print(f"  {description:15s} ({table_name:20s}): {count:>6,}행")
-                except Exception:
-                    print(f"  {description:15s} ({table_name:20s}): {Color.warn('테이블 없음')}")
-
-        print()
+            counts = await _count_rows(session, [t for t, _ in _DB_STAT_TABLES])
+
+        lines = [f"\n{Color.bold('데이터베이스 통계')}", "=" * 50]
+        lines += _table_count_lines(counts)
+
+        lines.append("")
         db_file = PROJECT_DIR / "kats.db"
         if db_file.exists():
             size = db_file.stat().st_size
-            print(f"  DB 크기: {size / 1024:.1f}KB")
+            lines.append(f"  DB 크기: {size / 1024:.1f}KB")
+        write_lines(lines)
 
-    asyncio.run(_stats())
+    return _stats()
 
 
-def cmd_redis_flush(args):
+async def cmd_redis_flush(args):
     """Redis → DB 수동 Flush"""
-    if not is_redis_running():
+    from kats.database.redis_buffer import RedisTickBuffer
+    from kats.config.settings import Settings
+
+    if not await _redis_alive():
         print(Color.err("Redis가 실행 중이 아닙니다."))
         sys.exit(1)
 
     target_date = args.date or datetime.now().strftime("%Y%m%d")
     print(f"{Color.info(f'Redis → DB Flush: {target_date}')}")
 
-    async def _flush():
-        from kats.database.repository import Repository
-        from kats.database.redis_buffer import RedisTickBuffer
-        from kats.config.settings import Settings
+    repo = await _get_repo()
 
-        repo = Repository(Settings.DB_URL)
-        await repo.init_db()
-
-        buffer = RedisTickBuffer(Settings.REDIS_URL)
-        async with repo.get_session() as session:
-            count = await buffer.flush_to_db(target_date, session)
-        print(f"{Color.ok(f'Flush 완료: {count}건')}")
+    buffer = RedisTickBuffer(Settings.REDIS_URL)
+    async with repo.get_session() as session:
+        count = await buffer.flush_to_db(target_date, session)
+    print(f"{Color.ok(f'Flush 완료: {count}건')}")
 
-    asyncio.run(_flush())
 
-
-def cmd_config(args):
+async def cmd_config(args):
     """시스템 설정 조회/변경"""
-    async def _config():
-        from kats.database.repository import Repository
-        from kats.config.settings import Settings
-
-        repo = Repository(Settings.DB_URL)
-        await repo.init_db()
-
-        if args.key and args.value:
-            # 설정 변경
-            await repo.set_system_config(args.key, args.value)
-            print(f"{Color.ok('설정 변경')}: {args.key} = {args.value}")
-        elif args.key:
-            # 특정 설정 조회
-            value = await repo.get_system_config(args.key)
-            if value is not None:
-                print(f"  {args.key} = {value}")
-            else:
-                print(f"  {Color.warn(f'{args.key}: 설정 없음')}")
+    from kats.config.settings import Settings
+
+    repo = await _get_repo()
+
+    if args.key and args.value:
+        # 설정 변경
+        await repo.set_system_config(args.key, args.value)
+        print(f"{Color.ok('설정 변경')}: {args.key} = {args.value}")
+    elif args.key:
+        # 특정 설정 조회
+        value = await repo.get_system_config(args.key)
+        if value is not None:
+            print(f"  {args.key} = {value}")
         else:
-            # 전체 설정 조회
-            print(f"\n{Color.bold('시스템 설정')}")
-            print("=" * 55)
+            print(f"  {Color.warn(f'{args.key}: 설정 없음')}")
+    else:
+        # 전체 설정 조회
+        lines = [
+            f"\n{Color.bold('시스템 설정')}",
+            "=" * 55,
             # .env 기반 설정
-            print(f"\n  {Color.info('[환경 변수 (.env)]')}")
-            print(f"  TRADE_MODE         = {Settings.TRADE_MODE}")
-            print(f"  TOTAL_CAPITAL      = {Settings.TOTAL_CAPITAL:,}원")
-            print(f"  RISK_PER_TRADE     = {Settings.RISK_PER_TRADE * 100:.1f}%")
-            print(f"  DAILY_LOSS_LIMIT   = {Settings.DAILY_LOSS_LIMIT * 100:.1f}%")
-            print(f"  MONTHLY_LOSS_LIMIT = {Settings.MONTHLY_LOSS_LIMIT * 100:.1f}%")
-            print(f"  MAX_POSITIONS      = {Settings.MAX_POSITIONS}")
-            print(f"  DB_URL             = {Settings.DB_URL}")
-            print(f"  REDIS_URL          = {Settings.REDIS_URL}")
-
+            f"\n  {Color.info('[환경 변수 (.env)]')}",
+            f"  TRADE_MODE         = {Settings.TRADE_MODE}",
+            f"  TOTAL_CAPITAL      = {Settings.TOTAL_CAPITAL:,}원",
+            f"  RISK_PER_TRADE     = {Settings.RISK_PER_TRADE * 100:.1f}%",
+            f"  DAILY_LOSS_LIMIT   = {Settings.DAILY_LOSS_LIMIT * 100:.1f}%",
+            f"  MONTHLY_LOSS_LIMIT = {Settings.MONTHLY_LOSS_LIMIT * 100:.1f}%",
+            f"  MAX_POSITIONS      = {Settings.MAX_POSITIONS}",
+            f"  DB_URL             = {Settings.DB_URL}",
+            f"  REDIS_URL          = {Settings.REDIS_URL}",
             # DB 저장 설정
-            print(f"\n  {Color.info('[DB 저장 설정]')}")
-            from sqlalchemy import text
-            async with repo.get_session() as session:
-                try:
-                    result = await session.execute(
-                        text("SELECT config_key, config_value, description FROM system_config ORDER BY config_key")
-                    )
-                    rows = result.fetchall()
-                    for key, value, desc in rows:
-                        desc_str = f"  # {desc}" if desc else ""
-                        print(f"  {key:30s} = {value}{Color.DIM}{desc_str}{Color.NC}")
-                except Exception:
-                    print(f"  {Color.warn('system_config 테이블 없음')}")
-            print()
-
-    asyncio.run(_config())
+            f"\n  {Color.info('[DB 저장 설정]')}",
+        ]
+        from sqlalchemy import text
+        async with repo.get_session() as session:
+            try:
+                result = await session.execute(
+                    text("SELECT config_key, config_value, description FROM system_config ORDER BY config_key")
+                )
+                rows = result.fetchall()
+                for key, value, desc in rows:
+                    desc_str = f"  # {desc}" if desc else ""
+                    lines.append(f"  {key:30s} = {value}{Color.DIM}{desc_str}{Color.NC}")
+            except Exception:
+                lines.append(f"  {Color.warn('system_config 테이블 없음')}")
+        lines.append("")
+        write_lines(lines)
 
 
 # ══════════════════════════════════════════════════════════════════════════
 #  CLI 진입점
 # ══════════════════════════════════════════════════════════════════════════
 
-def main():
+def _run(coro):
+    """코루틴 실행 (uvloop이 설치돼 있으면 uvloop 이벤트 루프 사용)"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+# 명령별 인자 정의 — 실행 시에는 요청된 명령의 파서만 만든다
+def _args_start(p):
+    p.add_argument("--live", action="store_true", help="실전 매매 모드")
+    p.add_argument("--skip-redis", action="store_true", help="Redis 시작 건너뛰기")
+
+
+def _args_stop(p):
+    p.add_argument("--all", action="store_true", help="Redis도 함께 중지")
+    p.add_argument("--force", action="store_true", help="강제 종료")
+    p.add_argument("--legacy-scripts", action="store_true", help="stop.sh로 중지 (잔여 프로세스 정리 포함)")
+
+
+def _args_restart(p):
+    p.add_argument("--live", action="store_true", help="실전 매매 모드")
+    p.add_argument("--force", action="store_true", help="강제 종료 후 재시작")
+
+
+def _args_status(p):
+    p.add_argument("--json", action="store_true", help="JSON 형식 출력")
+
+
+def _args_logs(p):
+    p.add_argument("--tail", "-n", type=int, default=50, help="출력 줄 수 (기본: 50)")
+    p.add_argument("--follow", "-f", action="store_true", help="실시간 추적")
+
+
+def _args_redis_flush(p):
+    p.add_argument("--date", help="대상 날짜 (YYYYMMDD, 기본: 오늘)")
+
+
+def _args_config(p):
+    p.add_argument("key", nargs="?", help="설정 키")
+    p.add_argument("value", nargs="?", help="설정 값 (변경 시)")
+
+
+# 명령 → (핸들러, 도움말, 인자 정의)
+_COMMANDS = {
+    "start": (cmd_start, "시스템 시작", _args_start),
+    "stop": (cmd_stop, "시스템 중지", _args_stop),
+    "restart": (cmd_restart, "시스템 재시작", _args_restart),
+    "status": (cmd_status, "시스템 상태 확인", _args_status),
+    "logs": (cmd_logs, "로그 보기", _args_logs),
+    "health": (cmd_health, "상세 헬스 체크", None),
+    "db-init": (cmd_db_init, "데이터베이스 초기화", None),
+    "db-stats": (cmd_db_stats, "데이터베이스 통계", None),
+    "redis-flush": (cmd_redis_flush, "Redis → DB 수동 Flush", _args_redis_flush),
+    "config": (cmd_config, "시스템 설정 조회/변경", _args_config),
+}
+
+
+def _build_parser():
+    """전체 파서 (도움말/알 수 없는 명령일 때만 사용)"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="KATS v1.1 — 시스템 관리 CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -443,73 +864,46 @@ def main():
     )
 
     subparsers = parser.add_subparsers(dest="command", help="실행할 명령")
+    for name, (_, help_text, add_args) in _COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if add_args is not None:
+            add_args(sub)
+    return parser
+
 
-    # start
-    p_start = subparsers.add_parser("start", help="시스템 시작")
-    p_start.add_argument("--live", action="store_true", help="실전 매매 모드")
-    p_start.add_argument("--skip-redis", action="store_true", help="Redis 시작 건너뛰기")
-
-    # stop
-    p_stop = subparsers.add_parser("stop", help="시스템 중지")
-    p_stop.add_argument("--all", action="store_true", help="Redis도 함께 중지")
-    p_stop.add_argument("--force", action="store_true", help="강제 종료")
-
-    # restart
-    p_restart = subparsers.add_parser("restart", help="시스템 재시작")
-    p_restart.add_argument("--live", action="store_true", help="실전 매매 모드")
-    p_restart.add_argument("--force", action="store_true", help="강제 종료 후 재시작")
-
-    # status
-    p_status = subparsers.add_parser("status", help="시스템 상태 확인")
-    p_status.add_argument("--json", action="store_true", help="JSON 형식 출력")
-
-    # logs
-    p_logs = subparsers.add_parser("logs", help="로그 보기")
-    p_logs.add_argument("--tail", "-n", type=int, default=50, help="출력 줄 수 (기본: 50)")
-    p_logs.add_argument("--follow", "-f", action="store_true", help="실시간 추적")
-
-    # health
-    subparsers.add_parser("health", help="상세 헬스 체크")
-
-    # db-init
-    subparsers.add_parser("db-init", help="데이터베이스 초기화")
-
-    # db-stats
-    subparsers.add_parser("db-stats", help="데이터베이스 통계")
-
-    # redis-flush
-    p_flush = subparsers.add_parser("redis-flush", help="Redis → DB 수동 Flush")
-    p_flush.add_argument("--date", help="대상 날짜 (YYYYMMDD, 기본: 오늘)")
-
-    # config
-    p_config = subparsers.add_parser("config", help="시스템 설정 조회/변경")
-    p_config.add_argument("key", nargs="?", help="설정 키")
-    p_config.add_argument("value", nargs="?", help="설정 값 (변경 시)")
-
-    args = parser.parse_args()
-
-    if not args.command:
-        parser.print_help()
-        sys.exit(0)
-
-    command_map = {
-        "start": cmd_start,
-        "stop": cmd_stop,
-        "restart": cmd_restart,
-        "status": cmd_status,
-        "logs": cmd_logs,
-        "health": cmd_health,
-        "db-init": cmd_db_init,
-        "db-stats": cmd_db_stats,
-        "redis-flush": cmd_redis_flush,
-        "config": cmd_config,
-    }
-
-    handler = command_map.get(args.command)
-    if handler:
-        handler(args)
+def _parse_command(name: str, argv: list[str]):
+    """단일 명령의 파서만 만들어 인자 해석"""
+    import argparse
+
+    _, help_text, add_args = _COMMANDS[name]
+    parser = argparse.ArgumentParser(
+        prog=f"{Path(sys.argv[0]).name} {name}", description=help_text,
+    )
+    if add_args is not None:
+        add_args(parser)
+    args = parser.parse_args(argv)
+    args.command = name
+    return args
+
+
+def main():
+    argv = sys.argv[1:]
+    if argv and argv[0] in _COMMANDS:
+        args = _parse_command(argv[0], argv[1:])
     else:
-        parser.print_help()
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        if not args.command:
+            parser.print_help()
+            sys.exit(0)
+
+    _bootstrap_paths(make_dirs=args.command in _NEEDS_DIRS)
+    handler = _COMMANDS[args.command][0]
+
+    # I/O가 있는 명령은 코루틴을 돌려준다 → 이벤트 루프는 한 번만 만든다
+    result = handler(args)
+    if asyncio.iscoroutine(result):
+        _run(result)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+"""Streaming daily indicators kept by the strategy selector."""
+
+import numpy as np
+
+from kats.strategy.strategy_selector import (
+    BB_PERIOD,
+    PIVOT_WINDOW,
+    StrategySelector,
+)
+
+_WINDOW = 250
+
+
+def _history(days: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    closes = np.round(10_000 + np.cumsum(rng.normal(0, 50, days)))
+    highs = closes + np.round(rng.uniform(0, 100, days))
+    dates = [f"D{i:05d}" for i in range(days)]
+    return dates, closes, highs
+
+
+def _market_data(dates, closes, highs, indicators=None):
+    daily = {
+        "date": list(dates),
+        "open": list(closes),
+        "high": list(highs),
+        "low": list(closes),
+        "close": list(closes),
+        "volume": [1.0] * len(closes),
+    }
+    return {"daily_prices": daily, "indicators": indicators or {}}
+
+
+def _expected(closes, highs):
+    window = closes[-BB_PERIOD:].astype(np.float32).astype(np.float64)
+    mean, std = window.mean(), window.std()
+    return mean + 2 * std, mean - 2 * std, float(highs[-PIVOT_WINDOW:].max())
+
+
+def test_rolling_window_feeds_each_new_day():
+    dates, closes, highs = _history(_WINDOW + 5)
+    selector = StrategySelector()
+    for day in range(5 + 1):
+        sl = slice(day, day + _WINDOW)
+        md = _market_data(dates[sl], closes[sl], highs[sl])
+        selector.update_daily_indicators("005930", md)
+        upper, lower, pivot = _expected(closes[sl], highs[sl])
+        ind = md["indicators"]
+        assert np.isclose(ind["bb_upper"], upper)
+        assert np.isclose(ind["bb_lower"], lower)
+        assert ind["pivot_high"] == pivot
+
+
+def test_revised_bar_rebuilds_state():
+    dates, closes, highs = _history(_WINDOW)
+    selector = StrategySelector()
+    selector.update_daily_indicators("005930", _market_data(dates, closes, highs))
+
+    closes = closes.copy()
+    closes[-1] += 500
+    md = _market_data(dates, closes, highs)
+    selector.update_daily_indicators("005930", md)
+    upper, lower, _ = _expected(closes, highs)
+    assert np.isclose(md["indicators"]["bb_upper"], upper)
+    assert np.isclose(md["indicators"]["bb_lower"], lower)
+
+
+def test_hub_indicators_are_not_overwritten():
+    dates, closes, highs = _history(_WINDOW)
+    hub = {"bb_upper": 1.0, "rsi_14": 55.0}
+    md = _market_data(dates, closes, highs, indicators=hub)
+    StrategySelector().update_daily_indicators("005930", md)
+    assert md["indicators"]["bb_upper"] == 1.0
+    assert md["indicators"]["rsi_14"] == 55.0
+    assert "pivot_high" in md["indicators"]
+    assert hub == {"bb_upper": 1.0, "rsi_14": 55.0}
@@ -0,0 +1,69 @@
+"""Triple Screen Force Index, incremental against full recomputation."""
+
+import numpy as np
+import pandas as pd
+
+from kats.strategy.triple_screen import TripleScreenStrategy
+
+_WINDOW = 250
+
+
+def _history(days: int, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    closes = np.round(10_000 + np.cumsum(rng.normal(0, 50, days)))
+    volumes = rng.integers(1_000, 5_000, days).astype(np.float64)
+    return pd.DataFrame({
+        "date": [f"D{i:05d}" for i in range(days)],
+        "close": closes,
+        "volume": volumes,
+    })
+
+
+def _fresh(frame: pd.DataFrame) -> float:
+    return TripleScreenStrategy()._screen2_force_index("X", frame)
+
+
+def test_rolling_dated_window_matches_full_recompute():
+    history = _history(_WINDOW + 20)
+    strategy = TripleScreenStrategy()
+    for day in range(21):
+        frame = history.iloc[day : day + _WINDOW].reset_index(drop=True)
+        got = strategy._screen2_force_index("X", frame)
+        assert np.isclose(got, _fresh(frame), rtol=1e-9)
+
+
+def test_shifted_undated_window_with_equal_close_recomputes():
+    history = _history(_WINDOW + 1).drop(columns="date")
+    # The cached bar and the one after it share a close
+    history.loc[_WINDOW - 2 :, "close"] = history.loc[_WINDOW - 2, "close"]
+    strategy = TripleScreenStrategy()
+    first = history.iloc[:_WINDOW].reset_index(drop=True)
+    strategy._screen2_force_index("X", first)
+
+    shifted = history.iloc[1 : _WINDOW + 1].reset_index(drop=True)
+    assert np.isclose(
+        strategy._screen2_force_index("X", shifted), _fresh(shifted), rtol=1e-9
+    )
+
+
+def test_revised_volume_recomputes():
+    frame = _history(_WINDOW)
+    strategy = TripleScreenStrategy()
+    strategy._screen2_force_index("X", frame)
+
+    revised = frame.copy()
+    revised.loc[_WINDOW - 5, "volume"] += 10_000
+    assert np.isclose(
+        strategy._screen2_force_index("X", revised), _fresh(revised), rtol=1e-9
+    )
+
+
+def test_same_day_repoll_tracks_forming_bar():
+    frame = _history(_WINDOW)
+    strategy = TripleScreenStrategy()
+    for bump in (0, 30, -45):
+        polled = frame.copy()
+        polled.loc[_WINDOW - 1, "close"] += bump
+        polled.loc[_WINDOW - 1, "volume"] += abs(bump)
+        got = strategy._screen2_force_index("X", polled)
+        assert np.isclose(got, _fresh(polled), rtol=1e-9)
@@ -0,0 +1,71 @@
+"""Strategy scans over candidates built by the stock screener."""
+
+import asyncio
+
+from kats.market.stock_screener import StockCandidate
+from kats.strategy.base_strategy import candidate_arrays, scan_cycle
+from kats.strategy.triple_screen import TripleScreenStrategy
+from kats.strategy.volatility_breakout import VolatilityBreakoutStrategy
+from kats.strategy.vwap_bounce import VWAPBounceStrategy
+
+
+def _screened(code: str, **overrides) -> StockCandidate:
+    fields = dict(
+        stock_code=code,
+        stock_name=code,
+        market="KOSPI",
+        grade="A",
+        price=100.0,
+        ma_50=90.0,
+        ma_150=80.0,
+        ma_200=70.0,
+        ma_200_slope=1.0,
+        week52_high=105.0,
+        week52_low=50.0,
+        rs_rank=90.0,
+        avg_turnover_20d=5_000_000_000,
+    )
+    fields.update(overrides)
+    return StockCandidate(**fields)
+
+
+def _scan(strategy, candidates):
+    return [c.stock_code for c in asyncio.run(strategy.scan(candidates))]
+
+
+def test_candidate_arrays_maps_flow_labels():
+    candidates = [
+        _screened("000001", inst_foreign_flow="BUY"),
+        _screened("000002", inst_foreign_flow="SELL"),
+        _screened("000003"),
+    ]
+    arr = candidate_arrays(candidates)
+    assert arr["inst_foreign_flow"].tolist() == [1.0, -1.0, 0.0]
+
+
+def test_scans_accept_screener_candidates():
+    candidates = [
+        _screened("000001"),
+        _screened("000002", inst_foreign_flow="BUY"),
+        _screened("000003", avg_turnover_20d=100_000_000),
+    ]
+    assert _scan(VolatilityBreakoutStrategy(), candidates) == ["000001", "000002"]
+    assert _scan(TripleScreenStrategy(), candidates) == [
+        "000001", "000002", "000003",
+    ]
+    assert _scan(VWAPBounceStrategy(), candidates) == ["000002"]
+
+
+def test_candidate_arrays_follow_in_place_enrichment():
+    candidates = [_screened("000001")]
+    assert candidate_arrays(candidates)["rs_rank"].tolist() == [90.0]
+    candidates[0].rs_rank = 40.0
+    assert candidate_arrays(candidates)["rs_rank"].tolist() == [40.0]
+
+
+def test_scan_cycle_shares_one_array():
+    candidates = [_screened("000001")]
+    with scan_cycle(candidates) as arr:
+        assert candidate_arrays(candidates) is arr
+        assert candidate_arrays(list(candidates)) is not arr
+    assert candidate_arrays(candidates) is not arr
@@ -0,0 +1,20 @@
+"""TradeSignal construction and lazily rendered reasons."""
+
+from kats.strategy.base_strategy import TradeSignal
+
+_ARGS = ("005930", "BUY", "S4", 70_000.0, 66_500.0, [75_600.0], 22.5, 4)
+
+
+def test_reason_keyword_and_positional():
+    by_keyword = TradeSignal(*_ARGS, reason="돌파")
+    by_position = TradeSignal(*_ARGS, "돌파", {"rsi": 55})
+    assert by_keyword.reason == by_position.reason == "돌파"
+    assert by_keyword.indicators_snapshot == {}
+    assert by_position.indicators_snapshot == {"rsi": 55}
+
+
+def test_reason_template_rendered_on_read():
+    signal = TradeSignal(
+        *_ARGS, reason="피벗 {pivot:,.0f}원", reason_args={"pivot": 70_000.0}
+    )
+    assert signal.reason == "피벗 70,000원"